@@ -2,8 +2,9 @@
 
 import streamlit as st
 from config import STREAMLIT_CONFIG
-from init_db import initialize_database
-from components import ProjectSelector, ProjectInfo
+from init_db import initialize_database, is_database_ready
+from database import read_cache
+from components import ProjectSelector, ProjectInfo, ProjectCalendarSettings
 from pages import render_welcome_page, render_project_main_page, render_error_page
 
 # 페이지 설정
@@ -13,9 +14,24 @@ st.set_page_config(
     layout=STREAMLIT_CONFIG["layout"]
 )
 
-# 데이터베이스 자동 초기화
-try:
+# 데이터베이스 자동 초기화 (프로세스당 한 번만 실행, rerun마다 반복하지 않음)
+@st.cache_resource(show_spinner=False)
+def _initialize_database_once():
+    """데이터베이스 초기화 (프로세스 전역 캐시)"""
     initialize_database(with_sample_data=False)
+    return True
+
+def ensure_database():
+    """캐시된 초기화 실행 후 헬스 체크 (DB 파일 삭제·스키마 변경 시 재초기화)"""
+    _initialize_database_once()
+    if not is_database_ready():
+        from database import db
+        db.close_all()
+        _initialize_database_once.clear()
+        _initialize_database_once()
+
+try:
+    ensure_database()
 except Exception as e:
     st.error(f"데이터베이스 초기화 중 오류 발생: {e}")
 
@@ -32,19 +48,22 @@ def main():
     st.title("📋 태스크 매니저 (Task Manager)")
     st.markdown("### 🚀 효율적인 업무, 스마트한 스케줄링")
     
-    try:
-        # 사이드바 - 프로젝트 관리
-        ProjectSelector.render()
-        ProjectInfo.render()
+    # 한 번의 rerun 동안 프로젝트 버전 확인을 공유 (같은 조회는 SQLite를 다시 읽지 않음)
+    with read_cache.request_scope():
+        try:
+            # 사이드바 - 프로젝트 관리
+            ProjectSelector.render()
+            ProjectInfo.render()
+            ProjectCalendarSettings.render()
+            
+            # 메인 컨텐츠 라우팅
+            if st.session_state.current_project_id:
+                render_project_main_page()
+            else:
+                render_welcome_page()
         
-        # 메인 컨텐츠 라우팅
-        if st.session_state.current_project_id:
-            render_project_main_page()
-        else:
-            render_welcome_page()
-    
-    except Exception as e:
-        render_error_page(str(e))
+        except Exception as e:
+            render_error_page(str(e))
 
 
 
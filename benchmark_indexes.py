@@ -0,0 +1,132 @@
+# benchmark_indexes.py - 프로젝트 단위 조회 인덱스 성능 비교 스크립트
+#
+# 사용법: python benchmark_indexes.py [--tasks 100000] [--projects 500] [--queries 200]
+# 임시 DB에 대량 데이터를 만든 뒤, 관리 인덱스를 제거한 상태(before)와
+# 다시 생성한 상태(after)에서 get_tasks 지연 시간을 비교한다. 기존 DB는 건드리지 않는다.
+
+import argparse
+import os
+import random
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+
+import config
+
+def _populate(db_path: str, task_count: int, project_count: int):
+    """대량 테스트 데이터 생성"""
+    conn = sqlite3.connect(db_path)
+    conn.execute("BEGIN")
+    conn.executemany(
+        "INSERT INTO projects (name) VALUES (?)",
+        [(f"bench-{i}",) for i in range(project_count)]
+    )
+    project_ids = [row[0] for row in conn.execute("SELECT id FROM projects")]
+
+    rng = random.Random(42)
+    conn.executemany(
+        "INSERT INTO team_members (project_id, name, role, available_hours_per_day) VALUES (?, ?, ?, ?)",
+        [(pid, f"member-{j}", "개발", 8.0) for pid in project_ids for j in range(5)]
+    )
+    conn.executemany(
+        "INSERT INTO sprints (project_id, name, start_date, end_date) VALUES (?, ?, ?, ?)",
+        [(pid, f"Sprint {j}", f"2025-0{j + 1}-01", f"2025-0{j + 1}-14") for pid in project_ids for j in range(3)]
+    )
+    conn.executemany(
+        '''INSERT INTO tasks (project_id, build_type, priority, item_name, assignee, final_hours)
+           VALUES (?, ?, ?, ?, ?, ?)''',
+        [
+            (rng.choice(project_ids), f"Sprint {rng.randrange(3)}", rng.randint(1, 5),
+             f"task-{i}", f"member-{rng.randrange(5)}", rng.choice([4.0, 8.0, 16.0]))
+            for i in range(task_count)
+        ]
+    )
+    conn.commit()
+    conn.close()
+    return project_ids
+
+def _measure(project_ids, query_count: int) -> dict:
+    """무작위 프로젝트에 대해 get_tasks 지연 시간 측정 (ms)
+
+    get_tasks는 조회 결과 캐시를 거치므로, 인덱스 효과를 재려고 캐시를 건너뛰는 원본 함수를 호출한다.
+    """
+    from database import get_tasks
+
+    rng = random.Random(7)
+    samples = []
+    for _ in range(query_count):
+        pid = rng.choice(project_ids)
+        start = time.perf_counter()
+        get_tasks.uncached(pid)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    return {
+        "mean": statistics.mean(samples),
+        "p50": samples[len(samples) // 2],
+        "p95": samples[int(len(samples) * 0.95) - 1],
+    }
+
+def _query_plan(db_path: str) -> str:
+    """get_tasks 쿼리 실행 계획"""
+    conn = sqlite3.connect(db_path)
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM tasks WHERE project_id = ? ORDER BY priority, created_at", (1,)
+    ).fetchall()
+    conn.close()
+    return " / ".join(row[-1] for row in plan)
+
+def run_benchmark(task_count: int, project_count: int, query_count: int):
+    """인덱스 전후 get_tasks 성능 비교"""
+    temp_dir = tempfile.mkdtemp(prefix="pokoton_bench_")
+    db_path = os.path.join(temp_dir, "bench.db")
+    config.DATABASE_CONFIG["db_path"] = db_path
+
+    try:
+        from init_db import create_tables
+        from migrations import MANAGED_INDEXES
+        import database
+
+        database.db = database.DatabaseManager(db_path)
+        create_tables()
+
+        print(f">> 데이터 생성: 업무 {task_count:,}개 / 프로젝트 {project_count}개")
+        project_ids = _populate(db_path, task_count, project_count)
+
+        conn = sqlite3.connect(db_path)
+        for index_name in MANAGED_INDEXES:
+            conn.execute(f"DROP INDEX IF EXISTS {index_name}")
+        conn.execute("ANALYZE")
+        conn.close()
+        database.db.close_all()
+        print(f">> [before] 실행 계획: {_query_plan(db_path)}")
+        before = _measure(project_ids, query_count)
+
+        conn = sqlite3.connect(db_path)
+        for index_sql in MANAGED_INDEXES.values():
+            conn.execute(index_sql)
+        conn.execute("ANALYZE")
+        conn.commit()
+        conn.close()
+        database.db.close_all()
+        print(f">> [after]  실행 계획: {_query_plan(db_path)}")
+        after = _measure(project_ids, query_count)
+
+        print(f"\n>> get_tasks 지연 시간 ({query_count}회, ms)")
+        print(f"   {'':8}{'mean':>10}{'p50':>10}{'p95':>10}")
+        for label, result in (("before", before), ("after", after)):
+            print(f"   {label:8}{result['mean']:>10.3f}{result['p50']:>10.3f}{result['p95']:>10.3f}")
+        print(f">> 평균 {before['mean'] / after['mean']:.1f}배 개선")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="프로젝트 단위 조회 인덱스 벤치마크")
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--projects", type=int, default=500)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    run_benchmark(args.tasks, args.projects, args.queries)
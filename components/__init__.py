@@ -1,20 +1,20 @@
 # components/__init__.py - 컴포넌트 모듈 초기화
 
-from .project_components import ProjectSelector, ProjectInfo
+from .project_components import ProjectSelector, ProjectInfo, ProjectCalendarSettings
 from .team_components import TeamMemberForm, TeamMemberList
-from .task_components import TaskForm, TaskList
+from .task_components import TaskForm, TaskList, TaskImport
 from .system_components import SystemStatus, DevelopmentTools, ProgressIndicator
-from .simulation_components import SimulationRunner, SimulationResults, SimulationAnalysis, SimulationVisualization, SimulationExport
+from .simulation_components import SimulationRunner, SimulationHistory, SimulationResults, SimulationAnalysis, SimulationVisualization, SimulationExport
 from .sprint_components import SprintForm, SprintList, SprintTaskDistribution
 from .demo_components import DemoGuide, FeatureHighlight
 from .task_distribution_components import TaskDistributionSimulator, TaskDistributionViewer
 
 __all__ = [
-    'ProjectSelector', 'ProjectInfo',
+    'ProjectSelector', 'ProjectInfo', 'ProjectCalendarSettings',
     'TeamMemberForm', 'TeamMemberList', 
-    'TaskForm', 'TaskList',
+    'TaskForm', 'TaskList', 'TaskImport',
     'SystemStatus', 'DevelopmentTools', 'ProgressIndicator',
-    'SimulationRunner', 'SimulationResults', 'SimulationAnalysis', 'SimulationVisualization', 'SimulationExport',
+    'SimulationRunner', 'SimulationHistory', 'SimulationResults', 'SimulationAnalysis', 'SimulationVisualization', 'SimulationExport',
     'SprintForm', 'SprintList', 'SprintTaskDistribution',
     'DemoGuide', 'FeatureHighlight',
     'TaskDistributionSimulator', 'TaskDistributionViewer'
@@ -1,7 +1,8 @@
 # components/project_components.py - 프로젝트 관련 UI 컴포넌트
 
 import streamlit as st
-from database import create_project, get_all_projects, get_project_summary
+from database import create_project, get_all_projects, get_project_summary, get_project_calendar, set_project_calendar
+from utils.calendar_providers import get_calendar, list_calendars, calendar_label, save_calendar_file
 
 class ProjectSelector:
     """프로젝트 선택/생성 컴포넌트 클래스"""
@@ -103,4 +104,57 @@ class ProjectInfo:
                 """
             )
         else:
-            st.sidebar.warning("프로젝트를 선택하거나 새로 생성해주세요.")
\ No newline at end of file
+            st.sidebar.warning("프로젝트를 선택하거나 새로 생성해주세요.")
+
+class ProjectCalendarSettings:
+    """프로젝트 업무 달력 선택 컴포넌트 클래스 (ICS/CSV 휴일·회사 휴무일 파일 등록)"""
+    
+    @staticmethod
+    def render():
+        """업무 달력 선택/등록 렌더링"""
+        project_id = st.session_state.get('current_project_id')
+        if not project_id:
+            return
+        
+        with st.sidebar.expander("📅 업무 달력", expanded=False):
+            current = get_project_calendar(project_id)
+            options = list_calendars()
+            if current not in options:
+                options.append(current)  # 파일이 지워졌어도 현재 설정은 보이게 유지
+            
+            selected = st.selectbox(
+                "일정 계산에 사용할 달력",
+                options=options,
+                index=options.index(current),
+                format_func=calendar_label,
+                key="project_calendar_select"
+            )
+            
+            try:
+                calendar = get_calendar(selected)
+                if calendar.warnings:
+                    st.warning(f"⚠️ 달력 파일에서 {len(calendar.warnings)}건을 읽지 못했습니다.")
+                    for warning in calendar.warnings[:5]:
+                        st.caption(warning)
+            except ValueError as e:
+                st.error(str(e))
+                calendar = None
+            
+            if calendar is not None and selected != current:
+                if st.button("달력 적용", key="apply_project_calendar", type="primary"):
+                    set_project_calendar(project_id, selected)
+                    st.success(f"✅ 업무 달력이 '{calendar_label(selected)}'(으)로 변경되었습니다.")
+                    st.rerun()
+            
+            uploaded = st.file_uploader(
+                "ICS/CSV 달력 파일 등록",
+                type=["ics", "csv"],
+                key="project_calendar_upload",
+                help="공휴일과 회사 휴무일(창립기념일, 하계 휴무 등)을 담은 파일. CSV는 날짜, 이름, 종료일(선택) 열을 읽습니다."
+            )
+            if uploaded is not None and st.button("파일 등록", key="save_project_calendar"):
+                try:
+                    name = save_calendar_file(uploaded.name, uploaded.getvalue())
+                    st.success(f"✅ 달력 '{name}'이 등록되었습니다. 위에서 선택해 적용하세요.")
+                except ValueError as e:
+                    st.error(str(e))
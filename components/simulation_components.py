@@ -2,15 +2,56 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
 import io
-from simulation import run_simulation, get_simulation_summary
-from database import get_project_summary
+import dataclasses
+from simulation import (
+    run_simulation, get_simulation_summary, compute_input_fingerprint,
+    save_simulation_result, load_simulation_result, load_latest_simulation_result, resolve_project_calendar,
+    resolve_result_calendar
+)
+from database import load_project_snapshot, list_simulation_runs, delete_simulation_run
 from utils import DataValidator, ErrorHandler
-from utils.calendar_utils import KoreanHolidayCalendar
+
+def restore_saved_simulation(state_key: str, project_id: int, fingerprint: str) -> bool:
+    """현재 입력과 지문이 같은 저장된 결과를 세션에 불러오기 (재시뮬레이션 생략)
+
+    프로젝트/입력 데이터가 바뀌었을 때만 한 번 시도하므로, 사용자가 결과를 지운 뒤 다시 불러오지 않는다.
+    """
+    loaded_key = f"{state_key}_loaded_from"
+    current = st.session_state.get(state_key)
+    if current is not None and current.project_id == project_id:
+        return False
+    if st.session_state.get(loaded_key) == (project_id, fingerprint):
+        return False
+    
+    st.session_state[loaded_key] = (project_id, fingerprint)
+    try:
+        stored = load_latest_simulation_result(project_id, fingerprint)
+    except Exception:
+        stored = None
+    if stored is None:
+        st.session_state.pop(state_key, None)
+        return False
+    
+    st.session_state[state_key] = stored
+    return True
+
+def store_simulation_result(result):
+    """시뮬레이션 결과를 실행 이력에 저장하고 세션에 둘 결과 반환 (저장 실패는 결과 표시를 막지 않음)
+
+    캐시가 공유하는 결과는 수정하지 않고, 실행 ID를 넣은 얕은 복사본을 돌려준다.
+    """
+    try:
+        run_id = save_simulation_result(result)
+    except Exception as e:
+        st.warning(f"⚠️ 시뮬레이션 이력을 저장하지 못했습니다: {e}")
+        return result
+    return dataclasses.replace(result, run_id=run_id)
 
 class SimulationRunner:
     """시뮬레이션 실행 컴포넌트"""
@@ -20,8 +61,9 @@ class SimulationRunner:
         """시뮬레이션 실행 UI"""
         st.header("🎯 업무 분배 시뮬레이션")
         
-        # 프로젝트 기본 정보 표시
-        project_summary = get_project_summary(st.session_state.current_project_id)
+        # 프로젝트 기본 정보 표시 (요약/검증/시뮬레이션이 같은 스냅샷을 공유)
+        snapshot = load_project_snapshot(st.session_state.current_project_id)
+        project_summary = snapshot.summary
         
         col1, col2, col3, col4 = st.columns(4)
         with col1:
@@ -43,12 +85,23 @@ class SimulationRunner:
                 st.warning("⚠️ 업무를 먼저 추가해주세요.")
             return
         
+        # 프로젝트 달력 파일을 쓸 수 없으면 기본 달력으로 계산한다는 것을 알림
+        calendar = resolve_project_calendar(snapshot.project_id, snapshot)
+        if calendar.fallback_warning:
+            st.warning(f"⚠️ {calendar.fallback_warning}")
+        
+        # 입력이 바뀌지 않았으면 저장된 결과를 그대로 사용
+        fingerprint = compute_input_fingerprint(snapshot)
+        if restore_saved_simulation('simulation_result', st.session_state.current_project_id, fingerprint):
+            saved = st.session_state.simulation_result
+            st.info(f"💾 저장된 시뮬레이션 결과를 불러왔습니다. (실행 시각: {saved.created_at.strftime('%Y-%m-%d %H:%M')})")
+        
         # 시뮬레이션 실행 버튼
         col1, col2, col3 = st.columns([1, 1, 1])
         with col2:
             if st.button("🚀 Round Robin 시뮬레이션 실행", type="primary"):
                 # 시뮬레이션 실행 전 유효성 검증
-                validation_result = DataValidator.validate_simulation_requirements(st.session_state.current_project_id)
+                validation_result = DataValidator.validate_simulation_requirements(st.session_state.current_project_id, snapshot=snapshot)
                 
                 # 오류가 있으면 실행 중단
                 if not validation_result["valid"]:
@@ -62,8 +115,8 @@ class SimulationRunner:
                 
                 try:
                     with st.spinner("시뮬레이션을 실행 중입니다..."):
-                        result = run_simulation(st.session_state.current_project_id)
-                        st.session_state.simulation_result = result
+                        result = run_simulation(st.session_state.current_project_id, snapshot=snapshot)
+                        st.session_state.simulation_result = store_simulation_result(result)
                         st.success("✅ 시뮬레이션이 완료되었습니다!")
                         
                         # 결과 요약 표시
@@ -71,6 +124,55 @@ class SimulationRunner:
                         st.rerun()
                 except Exception as e:
                     ErrorHandler.handle_simulation_error(e)
+        
+        SimulationHistory.render(fingerprint)
+
+class SimulationHistory:
+    """시뮬레이션 실행 이력 컴포넌트"""
+    
+    @staticmethod
+    def render(current_fingerprint: str = ""):
+        """저장된 실행 목록 조회/불러오기/삭제 UI"""
+        project_id = st.session_state.current_project_id
+        runs = list_simulation_runs(project_id)
+        if not runs:
+            return
+        
+        with st.expander(f"📜 시뮬레이션 실행 이력 ({len(runs)}건)"):
+            history_df = pd.DataFrame([
+                {
+                    "실행 ID": run['id'],
+                    "실행 시각": run['created_at'],
+                    "업무 수": run['total_tasks'],
+                    "총 예상시간": f"{run['total_estimated_hours']:.1f}h",
+                    "예상 완료": f"{run['estimated_completion_days']}일",
+                    "소요 시간": f"{run['duration_ms']:.0f}ms",
+                    "현재 데이터": "✅ 일치" if run['fingerprint'] == current_fingerprint else "변경됨",
+                }
+                for run in runs
+            ])
+            st.dataframe(history_df, use_container_width=True, hide_index=True)
+            
+            run_labels = {run['id']: f"#{run['id']} ({run['created_at']})" for run in runs}
+            selected_run_id = st.selectbox(
+                "실행 선택", options=list(run_labels), format_func=run_labels.get, key="simulation_history_run"
+            )
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                if st.button("📂 불러오기", key="simulation_history_load"):
+                    stored = load_simulation_result(selected_run_id)
+                    if stored:
+                        st.session_state.simulation_result = stored
+                        st.rerun()
+                    st.error("❌ 실행 이력을 찾을 수 없습니다.")
+            with col2:
+                if st.button("🗑️ 삭제", key="simulation_history_delete"):
+                    delete_simulation_run(selected_run_id)
+                    current = st.session_state.get('simulation_result')
+                    if current is not None and current.run_id == selected_run_id:
+                        del st.session_state.simulation_result
+                    st.rerun()
 
 class SimulationResults:
     """시뮬레이션 결과 표시 컴포넌트"""
@@ -183,7 +285,7 @@ class SimulationResults:
             **3단계**: 날짜 계산
             - 스프린트 시작일 기준
             - 주말(토,일) 자동 제외
-            - 한국 공휴일 자동 제외
+            - 한국 공휴일 및 업무 달력의 회사 휴무일 자동 제외
             """)
             
         # 간단한 분배 균형도 표시
@@ -413,6 +515,8 @@ class SimulationVisualization:
             st.warning("표시할 업무 할당 정보가 없습니다.")
             return
         
+        calendar = resolve_result_calendar(result)
+        
         # 간트 차트 데이터 준비 (실제 날짜 기반)
         gantt_data = []
         
@@ -512,37 +616,48 @@ class SimulationVisualization:
             st.markdown("#### 📅 캘린더 뷰 (업무일 기준)")
             
             # 주말/공휴일 제외 안내
-            st.info("🗓️ **업무일 기준 스케줄링**: 주말(토,일)과 한국 공휴일이 자동으로 제외되어 계산됩니다.")
+            st.info("🗓️ **업무일 기준 스케줄링**: 주말(토,일)과 프로젝트 업무 달력의 공휴일·회사 휴무일이 자동으로 제외되어 계산됩니다.")
             
-            # 날짜별 업무 그룹화
-            calendar_data = []
-            for _, row in df_gantt.iterrows():
-                start_date = datetime.strptime(row['Start'], '%Y-%m-%d')
-                end_date = datetime.strptime(row['Finish'], '%Y-%m-%d')
-                
-                # 업무 기간 동안 각 날짜별로 데이터 생성
-                current_date = start_date
-                while current_date <= end_date:
-                    date_obj = current_date.date()
-                    is_workday = KoreanHolidayCalendar.is_workday(date_obj)
-                    holiday_name = KoreanHolidayCalendar.get_holiday_name(date_obj)
-                    
-                    calendar_data.append({
-                        'Date': current_date.strftime('%Y-%m-%d'),
-                        'Task': row['Task'],
-                        'Resource': row['Resource'],
-                        'Sprint': row['Sprint'],
-                        'Hours': row['Hours'] / row['Duration'] if is_workday else 0,  # 업무일만 시간 할당
-                        'WeekDay': current_date.strftime('%A'),
-                        'Month': current_date.strftime('%B %Y'),
-                        'IsWorkday': is_workday,
-                        'HolidayName': holiday_name,
-                        'DayType': '업무일' if is_workday else ('공휴일: ' + holiday_name if holiday_name else '주말')
-                    })
-                    current_date += timedelta(days=1)
+            # 날짜별 업무 그룹화 (업무 기간을 하루 단위 행으로 펼친 뒤 업무일 여부를 한 번에 계산)
+            starts = np.asarray(df_gantt['Start'].tolist(), dtype='datetime64[D]')
+            finishes = np.asarray(df_gantt['Finish'].tolist(), dtype='datetime64[D]')
+            spans = np.maximum((finishes - starts).astype(np.int64) + 1, 0)
+            rows = np.repeat(np.arange(len(df_gantt)), spans)
+            day_offsets = np.arange(spans.sum()) - np.repeat(np.cumsum(spans) - spans, spans)
+            days = starts[rows] + day_offsets
             
-            if calendar_data:
-                cal_df = pd.DataFrame(calendar_data)
+            if len(days):
+                is_workday = calendar.is_workday_batch(days)
+                date_strs = days.astype(str)
+                
+                # 요일/월/공휴일명은 기간 내 고유 날짜마다 한 번만 계산
+                day_info = {}
+                for date_str in np.unique(date_strs).tolist():
+                    date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+                    day_info[date_str] = (
+                        date_obj.strftime('%A'), date_obj.strftime('%B %Y'),
+                        calendar.get_holiday_name(date_obj.date())
+                    )
+                weekday_names, month_names, holiday_names = (
+                    [day_info[date_str][i] for date_str in date_strs.tolist()] for i in range(3)
+                )
+                
+                daily_hours = (df_gantt['Hours'] / df_gantt['Duration']).to_numpy()[rows]
+                cal_df = pd.DataFrame({
+                    'Date': date_strs,
+                    'Task': df_gantt['Task'].to_numpy()[rows],
+                    'Resource': df_gantt['Resource'].to_numpy()[rows],
+                    'Sprint': df_gantt['Sprint'].to_numpy()[rows],
+                    'Hours': np.where(is_workday, daily_hours, 0),  # 업무일만 시간 할당
+                    'WeekDay': weekday_names,
+                    'Month': month_names,
+                    'IsWorkday': is_workday,
+                    'HolidayName': holiday_names,
+                    'DayType': [
+                        '업무일' if workday else ('공휴일: ' + name if name else '주말')
+                        for workday, name in zip(is_workday.tolist(), holiday_names)
+                    ]
+                })
                 
                 # 업무일별 팀원 업무량 히트맵 (업무일만)
                 workday_df = cal_df[cal_df['IsWorkday'] == True]
@@ -556,7 +671,7 @@ class SimulationVisualization:
                     date_labels = []
                     for date_str in pivot_table.columns:
                         date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
-                        if KoreanHolidayCalendar.is_workday(date_obj):
+                        if calendar.is_workday(date_obj):
                             date_colors.append('업무일')
                             date_labels.append(f"{date_str}<br>({date_obj.strftime('%a')})")
                         else:
@@ -176,8 +176,19 @@ class SprintList:
                         key="delete_sprint_select"
                     )
                     
+                    reassign_to = None
+                    if sprint_to_delete:
+                        reassign_to = st.selectbox(
+                            "소속 업무를 옮길 스프린트 (선택사항)",
+                            options=[s["id"] for s in sprints if s["id"] != sprint_to_delete],
+                            format_func=lambda x: next(s["name"] for s in sprints if s["id"] == x),
+                            index=None,
+                            placeholder="옮기지 않음",
+                            key="delete_sprint_reassign"
+                        )
+
                     if sprint_to_delete and st.button("스프린트 삭제", key="delete_sprint", type="secondary"):
-                        if delete_sprint(sprint_to_delete):
+                        if delete_sprint(sprint_to_delete, reassign_to=reassign_to):
                             st.success("✅ 스프린트가 삭제되었습니다.")
                             st.rerun()
                         else:
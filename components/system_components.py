@@ -1,6 +1,7 @@
 # components/system_components.py - 시스템 관련 UI 컴포넌트
 
 import streamlit as st
+import pandas as pd
 from database import get_all_projects
 
 class SystemStatus:
@@ -16,10 +17,14 @@ class SystemStatus:
         with col1:
             # 데이터베이스 연결 테스트
             try:
-                from database import db
-                conn_test = db.get_connection()
-                conn_test.close()
+                from database import db, read_cache
+                with db.connection() as conn_test:
+                    conn_test.execute("SELECT 1")
+                pool_stats = db.get_pool_stats()
                 st.success("✅ 데이터베이스 연결 성공")
+                st.caption(f"연결 풀: {pool_stats['open_connections']}/{pool_stats['pool_size']} | 적중률 {pool_stats['hit_rate']}% | 대기 {pool_stats['wait_time_ms']}ms")
+                read_stats = read_cache.get_stats()
+                st.caption(f"조회 캐시: 적중률 {read_stats['hit_rate']}% | 버전 확인 {read_stats['version_checks']}회")
             except Exception as e:
                 st.error(f"❌ 데이터베이스 연결 실패: {e}")
         
@@ -38,8 +43,54 @@ class SystemStatus:
                 projects = get_all_projects()
                 st.success(f"✅ 프로젝트 조회 완료")
                 st.caption(f"총 {len(projects)}개 프로젝트")
+                from simulation import simulation_cache
+                cache_stats = simulation_cache.get_stats()
+                st.caption(f"시뮬레이션 캐시: {cache_stats['entries']}/{cache_stats['max_entries']} | 적중률 {cache_stats['hit_rate']}%")
             except Exception as e:
                 st.error(f"❌ 프로젝트 조회 실패: {e}")
+        
+        SystemStatus.render_query_stats()
+    
+    @staticmethod
+    def render_query_stats():
+        """쿼리 계측 요약 (실행 시간 상위 SQL, 최근 느린 쿼리)"""
+        from database import db
+        stats = db.get_query_stats()
+        
+        with st.expander(f"🐢 쿼리 통계 (느린 쿼리 {stats['slow_queries']}건)", expanded=False):
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("실행 쿼리", f"{stats['total_queries']:,}회")
+            with col2:
+                st.metric("누적 시간", f"{stats['total_time_ms']:,.1f}ms")
+            with col3:
+                st.metric("평균", f"{stats['mean_ms']:.2f}ms")
+            with col4:
+                st.metric(f"느린 쿼리 (≥{stats['slow_query_ms']:.0f}ms)", f"{stats['slow_queries']}건")
+            
+            if stats['top_statements']:
+                st.caption(f"최근 {stats['recent_queries']}개 쿼리 기준 누적 시간 상위 SQL")
+                st.dataframe(pd.DataFrame([
+                    {
+                        "SQL": statement['sql'][:120],
+                        "함수": statement['function'],
+                        "호출 위치": statement['caller'],
+                        "횟수": statement['count'],
+                        "합계(ms)": round(statement['total_ms'], 2),
+                        "평균(ms)": round(statement['mean_ms'], 2),
+                        "최대(ms)": round(statement['max_ms'], 2),
+                        "행 수": statement['rows'],
+                    }
+                    for statement in stats['top_statements']
+                ]), use_container_width=True, hide_index=True)
+            
+            for entry in stats['recent_slow_queries'][:5]:
+                st.markdown(f"**{entry['duration_ms']:.1f}ms** · `{entry['function']}` · {entry['caller']}")
+                st.code(f"{entry['sql']}\n-- plan: {entry.get('plan', '')}", language="sql")
+            
+            if st.button("통계 초기화", key="reset_query_stats"):
+                db.reset_query_stats()
+                st.rerun()
 
 class DevelopmentTools:
     """개발 도구 컴포넌트 클래스"""
@@ -2,7 +2,7 @@
 
 import streamlit as st
 import pandas as pd
-from database import add_task, get_tasks, delete_task, get_team_members, update_task, get_task_by_id, get_sprints, add_sprint
+from database import add_task, search_tasks, query_tasks, count_tasks, get_task_filter_options, delete_task, get_team_members, update_task, get_task_by_id, get_sprints, add_sprint
 
 class TaskForm:
     """업무 입력/수정 폼 컴포넌트 클래스"""
@@ -186,36 +186,50 @@ class TaskForm:
                 default_ai_judgment = task_data['ai_judgment'] if is_edit_mode and task_data else ""
                 ai_judgment = st.text_input("AI 판단", value=default_ai_judgment, placeholder="AI 분석 결과...", key=f"{form_key_prefix}task_ai_judgment")
             with col2:
-                # 연결성 - 기존 업무 목록에서 선택
-                if is_edit_mode and task_data:
-                    # 수정 모드: 현재 수정 중인 업무는 제외
-                    existing_tasks = [t for t in get_tasks(st.session_state.current_project_id) if t['id'] != task_data['id']]
+                # 연결성 - 업무를 검색해 결과에서 선택 (전체 업무 목록을 불러오지 않음)
+                project_id = st.session_state.current_project_id
+                connectivity_key = f"{form_key_prefix}task_connectivity"
+                search_query = st.text_input(
+                    "업무 연결성 검색",
+                    placeholder="업무명/내용 또는 #ID (비우면 최근 업무)",
+                    key=f"{form_key_prefix}task_connectivity_search"
+                )
+                if search_query.strip():
+                    candidates = search_tasks(project_id, search_query, limit=20)
                 else:
-                    existing_tasks = get_tasks(st.session_state.current_project_id)
+                    candidates, _ = query_tasks(project_id, sort="-created_at", limit=20)
                 
-                task_options = ["연결 없음"] + [f"#{task['id']} - {task['item_name']}" for task in existing_tasks]
+                # 현재 연결된 업무와 이미 선택한 업무는 검색어가 바뀌어도 선택지에 유지
+                current_connectivity = str(task_data['connectivity']) if is_edit_mode and task_data and task_data['connectivity'] else ""
+                pinned_ids = [int(current_connectivity)] if current_connectivity.isdigit() else []
+                if st.session_state.get(connectivity_key):
+                    pinned_ids.append(st.session_state[connectivity_key])
                 
-                # 현재 연결성 값 찾기
-                default_connectivity_index = 0
-                if is_edit_mode and task_data and task_data['connectivity']:
-                    for i, option in enumerate(task_options[1:], 1):
-                        if option.startswith(f"#{task_data['connectivity']} -"):
-                            default_connectivity_index = i
-                            break
+                connectivity_labels = {0: "연결 없음"}
+                for pinned_id in pinned_ids:
+                    if pinned_id not in connectivity_labels:
+                        pinned_task = get_task_by_id(pinned_id)
+                        if pinned_task:
+                            connectivity_labels[pinned_id] = f"#{pinned_id} - {pinned_task['item_name']}"
+                for candidate in candidates:
+                    # 수정 모드: 현재 수정 중인 업무는 제외
+                    if not (is_edit_mode and task_data and candidate['id'] == task_data['id']):
+                        connectivity_labels.setdefault(candidate['id'], f"#{candidate['id']} - {candidate['item_name']}")
+                
+                connectivity_options = list(connectivity_labels)
+                default_connectivity = int(current_connectivity) if current_connectivity.isdigit() and int(current_connectivity) in connectivity_labels else 0
                 
                 selected_connectivity = st.selectbox(
                     "업무 연결성", 
-                    options=task_options, 
-                    index=default_connectivity_index, 
-                    key=f"{form_key_prefix}task_connectivity",
+                    options=connectivity_options, 
+                    format_func=connectivity_labels.get,
+                    index=connectivity_options.index(default_connectivity), 
+                    key=connectivity_key,
                     help="이 업무와 연관된 다른 업무를 선택하세요"
                 )
                 
-                # 실제 저장할 connectivity 값 (ID만 추출)
-                if selected_connectivity == "연결 없음":
-                    connectivity = ""
-                else:
-                    connectivity = selected_connectivity.split(" - ")[0].replace("#", "")
+                # 실제 저장할 connectivity 값 (ID 문자열)
+                connectivity = str(selected_connectivity) if selected_connectivity else ""
             
             # 버튼 행
             if is_edit_mode:
@@ -277,37 +291,101 @@ class TaskForm:
                             st.error("⚠️ 업무명을 입력해주세요.")
 
 class TaskList:
-    """업무 목록 표시 컴포넌트 클래스"""
+    """업무 목록 표시 컴포넌트 클래스 (SQL 필터 + keyset 페이지네이션)"""
+    
+    SORT_OPTIONS = {"priority": "우선순위순", "-created_at": "최근 등록순", "created_at": "오래된 등록순", "-final_hours": "예상시간 많은순"}
+    PAGE_SIZES = [25, 50, 100, 200]
+    
+    @staticmethod
+    def _render_filters(project_id):
+        """필터/정렬 위젯 렌더링 → (filters, sort, page_size)"""
+        options = get_task_filter_options(project_id)
+        
+        col1, col2, col3, col4, col5 = st.columns(5)
+        with col1:
+            build_types = st.multiselect("스프린트", options=options["build_type"], format_func=lambda x: x or "(없음)", key="task_filter_build_type")
+        with col2:
+            assignees = st.multiselect("담당자", options=options["assignee"], format_func=lambda x: x or "미지정", key="task_filter_assignee")
+        with col3:
+            priorities = st.multiselect("우선순위", options=options["priority"], key="task_filter_priority")
+        with col4:
+            attributes = st.multiselect("속성", options=options["attribute"], format_func=lambda x: x or "(없음)", key="task_filter_attribute")
+        with col5:
+            parts = st.multiselect("파트", options=options["part_division"], format_func=lambda x: x or "(없음)", key="task_filter_part_division")
+        
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            sort = st.selectbox("정렬", options=list(TaskList.SORT_OPTIONS), format_func=TaskList.SORT_OPTIONS.get, key="task_list_sort")
+        with col2:
+            page_size = st.selectbox("페이지 크기", options=TaskList.PAGE_SIZES, index=1, key="task_list_page_size")
+        
+        filters = {
+            "build_type": build_types, "assignee": assignees, "priority": priorities,
+            "attribute": attributes, "part_division": parts
+        }
+        return filters, sort, page_size
     
     @staticmethod
     def render():
         """업무 목록 표시"""
-        tasks = get_tasks(st.session_state.current_project_id)
+        project_id = st.session_state.current_project_id
+        total_count = count_tasks(project_id)
         
-        if tasks:
-            st.subheader(f"📊 업무 현황 ({len(tasks)}개)")
+        if total_count:
+            st.subheader(f"📊 업무 현황 ({total_count}개)")
+            
+            filters, sort, page_size = TaskList._render_filters(project_id)
+            filtered_count = count_tasks(project_id, filters) if any(filters.values()) else total_count
+            
+            # 페이지 상태: 각 페이지 시작 키 스택 (필터/정렬/페이지 크기가 바뀌면 첫 페이지로)
+            signature = (project_id, repr(sorted(filters.items())), sort, page_size)
+            if st.session_state.get("task_list_signature") != signature:
+                st.session_state.task_list_signature = signature
+                st.session_state.task_list_page_keys = [None]
+            page_keys = st.session_state.task_list_page_keys
+            
+            tasks, next_key = query_tasks(project_id, filters, sort, page_keys[-1], page_size)
             
             # 업무 테이블 표시
-            tasks_df = pd.DataFrame([
-                {
-                    "ID": task["id"],
-                    "업무명": task["item_name"],
-                    "속성": task.get("attribute", ""),
-                    "빌드": task.get("build_type", ""),
-                    "파트": task.get("part_division", ""),
-                    "우선순위": task.get("priority", 3),
-                    "담당자": task.get("assignee", "미지정"),
-                    "스토리포인트": task.get("story_points_leader", 0),
-                    "리더예상": f"{task.get('duration_leader', 0):.1f}h",
-                    "담당자예상": f"{task.get('duration_assignee', 0):.1f}h", 
-                    "최종시간": f"{task.get('final_hours', 0):.1f}h",
-                    "AI판단": task.get("ai_judgment", "")[:20] + "..." if len(task.get("ai_judgment", "")) > 20 else task.get("ai_judgment", ""),
-                    "연결성": f"#{task.get('connectivity', '')}" if task.get('connectivity', '') else "없음",
-                    "등록일": task["created_at"][:10] if task["created_at"] else ""
-                } for task in tasks
-            ])
+            if tasks:
+                page_df = pd.DataFrame(tasks)
+                ai_judgment = page_df["ai_judgment"].fillna("")
+                tasks_df = pd.DataFrame({
+                    "ID": page_df["id"],
+                    "업무명": page_df["item_name"],
+                    "속성": page_df["attribute"],
+                    "빌드": page_df["build_type"],
+                    "파트": page_df["part_division"],
+                    "우선순위": page_df["priority"],
+                    "담당자": page_df["assignee"],
+                    "스토리포인트": page_df["story_points_leader"],
+                    "리더예상": page_df["duration_leader"].fillna(0).map("{:.1f}h".format),
+                    "담당자예상": page_df["duration_assignee"].fillna(0).map("{:.1f}h".format),
+                    "최종시간": page_df["final_hours"].fillna(0).map("{:.1f}h".format),
+                    "AI판단": ai_judgment.where(ai_judgment.str.len() <= 20, ai_judgment.str[:20] + "..."),
+                    "연결성": ("#" + page_df["connectivity"].fillna("")).where(page_df["connectivity"].fillna("") != "", "없음"),
+                    "등록일": page_df["created_at"].fillna("").str[:10]
+                })
+                st.dataframe(tasks_df, use_container_width=True, hide_index=True)
+            else:
+                st.info("🔍 조건에 맞는 업무가 없습니다.")
             
-            st.dataframe(tasks_df, use_container_width=True, hide_index=True)
+            # 페이지 이동
+            page_count = max((filtered_count + page_size - 1) // page_size, 1)
+            col1, col2, col3 = st.columns([1, 2, 1])
+            with col1:
+                if st.button("◀ 이전", key="task_list_prev", disabled=len(page_keys) == 1):
+                    page_keys.pop()
+                    st.rerun()
+            with col2:
+                st.caption(f"{len(page_keys)} / {page_count} 페이지 · 조건에 맞는 업무 {filtered_count}개")
+            with col3:
+                if st.button("다음 ▶", key="task_list_next", disabled=next_key is None):
+                    page_keys.append(next_key)
+                    st.rerun()
+            
+            # 선택 박스 표시용 ID → 업무명 매핑 (현재 페이지)
+            task_names = {task["id"]: task["item_name"] for task in tasks}
             
             # 업무 수정/삭제 기능
             col1, col2 = st.columns(2)
@@ -316,8 +394,8 @@ class TaskList:
                 with st.expander("✏️ 업무 수정"):
                     task_to_edit = st.selectbox(
                         "수정할 업무 선택",
-                        options=[t["id"] for t in tasks],
-                        format_func=lambda x: next(t["item_name"] for t in tasks if t["id"] == x),
+                        options=list(task_names),
+                        format_func=task_names.get,
                         index=None,
                         placeholder="수정할 업무를 선택하세요",
                         key="edit_task_select"
@@ -332,8 +410,8 @@ class TaskList:
                 with st.expander("🗑️ 업무 삭제"):
                     task_to_delete = st.selectbox(
                         "삭제할 업무 선택",
-                        options=[t["id"] for t in tasks],
-                        format_func=lambda x: next(t["item_name"] for t in tasks if t["id"] == x),
+                        options=list(task_names),
+                        format_func=task_names.get,
                         index=None,
                         placeholder="삭제할 업무를 선택하세요",
                         key="delete_task_select"
@@ -346,4 +424,88 @@ class TaskList:
                         else:
                             st.error("❌ 업무 삭제에 실패했습니다.")
         else:
-            st.info("📝 아직 추가된 업무가 없습니다. 위에서 업무를 추가해주세요.")
\ No newline at end of file
+            st.info("📝 아직 추가된 업무가 없습니다. 위에서 업무를 추가해주세요.")
+
+class TaskImport:
+    """업무 일괄 가져오기 (CSV/XLSX) 컴포넌트"""
+    
+    @staticmethod
+    def render():
+        """업무 일괄 가져오기 렌더링"""
+        from utils.task_importer import TaskImporter, build_import_template
+        
+        with st.expander("📥 업무 일괄 가져오기 (CSV/Excel)"):
+            st.caption("업무 목록/결과 Export와 같은 한글 헤더(업무명, 빌드, 우선순위, 담당자, 최종시간 등) 또는 영문 필드명을 인식합니다.")
+            
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                uploaded_file = st.file_uploader("가져올 파일", type=["csv", "xlsx"], key="task_import_file")
+            with col2:
+                st.download_button(
+                    label="📄 양식 다운로드",
+                    data=build_import_template().encode("utf-8-sig"),
+                    file_name="task_import_template.csv",
+                    mime="text/csv",
+                    key="download_task_import_template"
+                )
+                create_missing_sprints = st.checkbox("없는 스프린트 자동 생성", value=True, key="task_import_create_sprints")
+                dry_run = st.checkbox("검증만 실행", value=False, key="task_import_dry_run")
+            
+            if uploaded_file and st.button("📥 가져오기 실행", key="task_import_run", type="primary"):
+                # CSV는 줄 수로 진행률 추정 (XLSX는 가져오기 모듈에서 시트 정보로 추정)
+                total_rows = None
+                if uploaded_file.name.lower().endswith(".csv"):
+                    total_rows = max(uploaded_file.getvalue().count(b"\n") - 1, 1)
+                
+                progress_bar = st.progress(0.0, text="가져오는 중...")
+                
+                def on_progress(processed, total):
+                    if total:
+                        progress_bar.progress(min(processed / total, 1.0), text=f"{processed:,} / {total:,}행 처리")
+                    else:
+                        progress_bar.progress(0.0, text=f"{processed:,}행 처리")
+                
+                try:
+                    report = TaskImporter(
+                        st.session_state.current_project_id,
+                        create_missing_sprints=create_missing_sprints,
+                        dry_run=dry_run
+                    ).run(uploaded_file, file_name=uploaded_file.name, progress_callback=on_progress, total_rows=total_rows)
+                except Exception as e:
+                    progress_bar.empty()
+                    st.error(f"❌ 가져오기 중 오류가 발생했습니다: {str(e)}")
+                    return
+                
+                progress_bar.progress(1.0, text=f"완료 ({report.elapsed_seconds:.1f}초)")
+                TaskImport._render_report(report)
+    
+    @staticmethod
+    def _render_report(report):
+        """가져오기 결과 리포트 표시"""
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("전체 행", f"{report.total_rows:,}")
+        with col2:
+            st.metric("검증 통과" if report.dry_run else "가져온 업무", f"{report.imported:,}")
+        with col3:
+            st.metric("오류로 제외", f"{report.skipped:,}")
+        with col4:
+            st.metric("경고", f"{report.warning_count:,}")
+        
+        if report.dry_run:
+            st.info("🔍 검증만 실행했습니다. 데이터는 저장되지 않았습니다.")
+        elif report.imported:
+            st.success(f"✅ 업무 {report.imported:,}개를 가져왔습니다.")
+        
+        if report.created_sprints:
+            st.info(f"🚀 새 스프린트 {'생성 예정' if report.dry_run else '생성'}: {', '.join(report.created_sprints)}")
+        if report.unmapped_columns:
+            st.caption(f"인식하지 못한 컬럼 (무시됨): {', '.join(report.unmapped_columns)}")
+        
+        for title, issues, total in (("❌ 오류", report.errors, report.error_count), ("⚠️ 경고", report.warnings, report.warning_count)):
+            if issues:
+                with st.expander(f"{title} {total:,}건" + (f" (상위 {len(issues):,}건 표시)" if total > len(issues) else "")):
+                    st.dataframe(
+                        pd.DataFrame([{"행": i.row, "컬럼": i.column, "내용": i.message} for i in issues]),
+                        use_container_width=True, hide_index=True
+                    )
@@ -5,10 +5,10 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
-from simulation import run_simulation
-from database import get_project_summary, get_sprints
+from simulation import run_simulation, compute_input_fingerprint, resolve_project_calendar, resolve_result_calendar
+from database import load_project_snapshot
 from utils.validation import DataValidator, ErrorHandler
-from utils.calendar_utils import KoreanHolidayCalendar
+from components.simulation_components import restore_saved_simulation, store_simulation_result
 
 class TaskDistributionSimulator:
     """업무 분배 시뮬레이션 전용 컴포넌트"""
@@ -19,8 +19,9 @@ class TaskDistributionSimulator:
         st.header("🎯 자동 업무 분배 시뮬레이션")
         st.markdown("### 스프린트 일정에 맞춘 지능적 업무 분배")
         
-        # 프로젝트 기본 정보
-        project_summary = get_project_summary(st.session_state.current_project_id)
+        # 프로젝트 기본 정보 (요약/검증/시뮬레이션이 같은 스냅샷을 공유)
+        snapshot = load_project_snapshot(st.session_state.current_project_id)
+        project_summary = snapshot.summary
         
         # 기본 정보 표시
         col1, col2, col3, col4 = st.columns(4)
@@ -29,7 +30,7 @@ class TaskDistributionSimulator:
         with col2:
             st.metric("📋 업무", f"{project_summary['task_count']}개")
         with col3:
-            st.metric("🚀 스프린트", f"{len(get_sprints(st.session_state.current_project_id))}개")
+            st.metric("🚀 스프린트", f"{len(snapshot.sprints)}개")
         with col4:
             st.metric("⏱️ 총 시간", f"{project_summary['total_estimated_hours']:.1f}h")
         
@@ -44,13 +45,24 @@ class TaskDistributionSimulator:
                 st.info("📝 **업무 관리** 탭에서 업무를 추가해주세요.")
             return
         
+        # 프로젝트 달력 파일을 쓸 수 없으면 기본 달력으로 계산한다는 것을 알림
+        calendar = resolve_project_calendar(snapshot.project_id, snapshot)
+        if calendar.fallback_warning:
+            st.warning(f"⚠️ {calendar.fallback_warning}")
+        
+        # 입력이 바뀌지 않았으면 저장된 결과를 그대로 사용
+        fingerprint = compute_input_fingerprint(snapshot)
+        if restore_saved_simulation('distribution_result', st.session_state.current_project_id, fingerprint):
+            saved = st.session_state.distribution_result
+            st.info(f"💾 저장된 분배 결과를 불러왔습니다. (실행 시각: {saved.created_at.strftime('%Y-%m-%d %H:%M')})")
+        
         # 시뮬레이션 실행 버튼
         st.markdown("---")
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
             if st.button("🚀 자동 업무 분배 실행", type="primary", use_container_width=True):
                 # 시뮬레이션 실행 전 유효성 검증
-                validation_result = DataValidator.validate_simulation_requirements(st.session_state.current_project_id)
+                validation_result = DataValidator.validate_simulation_requirements(st.session_state.current_project_id, snapshot=snapshot)
                 
                 if not validation_result["valid"]:
                     for error in validation_result["errors"]:
@@ -63,8 +75,8 @@ class TaskDistributionSimulator:
                 
                 try:
                     with st.spinner("🔄 자동 업무 분배 중..."):
-                        result = run_simulation(st.session_state.current_project_id)
-                        st.session_state.distribution_result = result
+                        result = run_simulation(st.session_state.current_project_id, snapshot=snapshot)
+                        st.session_state.distribution_result = store_simulation_result(result)
                         st.success("✅ 자동 업무 분배가 완료되었습니다!")
                         st.rerun()
                 except Exception as e:
@@ -105,6 +117,8 @@ class TaskDistributionViewer:
             st.warning("분배된 업무가 없습니다.")
             return
         
+        calendar = resolve_result_calendar(result)
+        
         # 스프린트별 데이터 준비
         sprint_data = []
         task_data = []
@@ -289,7 +303,7 @@ class TaskDistributionViewer:
                 if task_data:
                     earliest_date = datetime.strptime(earliest, '%Y-%m-%d').date()
                     latest_date = datetime.strptime(latest, '%Y-%m-%d').date()
-                    workdays = KoreanHolidayCalendar.calculate_workdays_between(earliest_date, latest_date)
+                    workdays = calendar.calculate_workdays_between(earliest_date, latest_date)
                     st.metric("💼 업무일", f"{workdays}일")
     
     @staticmethod
@@ -302,6 +316,8 @@ class TaskDistributionViewer:
             st.warning("스프린트 데이터가 없습니다.")
             return
         
+        calendar = resolve_result_calendar(result)
+        
         for sprint_workload in result.sprint_workloads:
             st.markdown(f"#### 📅 {sprint_workload.sprint_name}")
             
@@ -331,7 +347,7 @@ class TaskDistributionViewer:
                 if sprint_workload.sprint_start_date and sprint_workload.sprint_end_date:
                     start_date = datetime.strptime(sprint_workload.sprint_start_date, '%Y-%m-%d').date()
                     end_date = datetime.strptime(sprint_workload.sprint_end_date, '%Y-%m-%d').date()
-                    workdays = KoreanHolidayCalendar.calculate_workdays_between(start_date, end_date)
+                    workdays = calendar.calculate_workdays_between(start_date, end_date)
                     st.metric("영업일", f"{workdays}일")
                 else:
                     st.metric("영업일", "미정")
@@ -350,20 +366,17 @@ class TaskDistributionViewer:
                     sprint_end = datetime.strptime(sprint_workload.sprint_end_date, '%Y-%m-%d').date()
                     
                     total_days = (sprint_end - sprint_start).days + 1
-                    workdays = KoreanHolidayCalendar.calculate_workdays_between(sprint_start, sprint_end)
+                    workdays = calendar.calculate_workdays_between(sprint_start, sprint_end)
                     holidays = []
                     weekends = []
                     
-                    # 공휴일과 주말 목록 생성
-                    current_date = sprint_start
-                    while current_date <= sprint_end:
-                        if KoreanHolidayCalendar.is_holiday(current_date):
-                            holiday_name = KoreanHolidayCalendar.get_holiday_name(current_date)
-                            holidays.append(f"{current_date.strftime('%m/%d')} ({holiday_name})")
-                        elif KoreanHolidayCalendar.is_weekend(current_date):
-                            weekday = ['월', '화', '수', '목', '금', '토', '일'][current_date.weekday()]
-                            weekends.append(f"{current_date.strftime('%m/%d')} ({weekday})")
-                        current_date += timedelta(days=1)
+                    # 공휴일과 주말 목록 생성 (기간 내 비업무일만 조회)
+                    for off_date, holiday_name in calendar.get_non_workdays_between(sprint_start, sprint_end):
+                        if holiday_name:
+                            holidays.append(f"{off_date.strftime('%m/%d')} ({holiday_name})")
+                        else:
+                            weekday = ['월', '화', '수', '목', '금', '토', '일'][off_date.weekday()]
+                            weekends.append(f"{off_date.strftime('%m/%d')} ({weekday})")
                     
                     # 스프린트 기간 정보
                     col1, col2, col3, col4 = st.columns(4)
@@ -385,25 +398,27 @@ class TaskDistributionViewer:
                 st.markdown("**📋 업무별 일정 분석**")
                 
                 analysis_data = []
-                for assignment in sprint_tasks:
+                # 업무별 영업일 수는 스프린트 업무 전체를 한 번에 계산
+                task_workdays_list = calendar.workdays_between_batch(
+                    [assignment.start_date for assignment in sprint_tasks],
+                    [assignment.end_date for assignment in sprint_tasks]
+                ).tolist()
+                for assignment, task_workdays in zip(sprint_tasks, task_workdays_list):
                     start_date = datetime.strptime(assignment.start_date, '%Y-%m-%d').date()
                     end_date = datetime.strptime(assignment.end_date, '%Y-%m-%d').date()
                     
                     # 업무 기간 분석
                     task_total_days = (end_date - start_date).days + 1
-                    task_workdays = KoreanHolidayCalendar.calculate_workdays_between(start_date, end_date)
                     daily_hours = assignment.estimated_hours / max(1, task_workdays)  # 0으로 나누기 방지
                     
                     # 업무 기간 중 공휴일/주말 체크
                     task_holidays = []
                     task_weekends = []
-                    current_date = start_date
-                    while current_date <= end_date:
-                        if KoreanHolidayCalendar.is_holiday(current_date):
-                            task_holidays.append(current_date.strftime('%m/%d'))
-                        elif KoreanHolidayCalendar.is_weekend(current_date):
-                            task_weekends.append(current_date.strftime('%m/%d'))
-                        current_date += timedelta(days=1)
+                    for off_date, holiday_name in calendar.get_non_workdays_between(start_date, end_date):
+                        if holiday_name:
+                            task_holidays.append(off_date.strftime('%m/%d'))
+                        else:
+                            task_weekends.append(off_date.strftime('%m/%d'))
                     
                     analysis_data.append({
                         '업무명': assignment.task_name,
@@ -447,30 +462,8 @@ class TaskDistributionViewer:
                     start_date_obj = datetime.strptime(assignment.start_date, '%Y-%m-%d').date()
                     end_date_obj = datetime.strptime(assignment.end_date, '%Y-%m-%d').date()
                     
-                    # 업무 기간 내 업무일 구간 찾기
-                    workday_segments = []
-                    current_segment_start = None
-                    current_date = start_date_obj
-                    
-                    while current_date <= end_date_obj:
-                        is_workday = KoreanHolidayCalendar.is_workday(current_date)
-                        
-                        if is_workday:
-                            # 업무일인 경우
-                            if current_segment_start is None:
-                                current_segment_start = current_date
-                        else:
-                            # 공휴일/주말인 경우 - 현재 세그먼트 종료
-                            if current_segment_start is not None:
-                                segment_end = current_date - timedelta(days=1)
-                                workday_segments.append((current_segment_start, segment_end))
-                                current_segment_start = None
-                        
-                        current_date += timedelta(days=1)
-                    
-                    # 마지막 세그먼트 처리
-                    if current_segment_start is not None:
-                        workday_segments.append((current_segment_start, end_date_obj))
+                    # 업무 기간 내 업무일 구간 찾기 (공휴일/주말에서 끊김)
+                    workday_segments = calendar.get_workday_segments(start_date_obj, end_date_obj)
                     
                     # 각 업무일 세그먼트를 별도 막대로 생성
                     if workday_segments:
@@ -549,26 +542,21 @@ class TaskDistributionViewer:
                     timeline_start = datetime.strptime(sprint_workload.sprint_start_date, '%Y-%m-%d').date()
                     timeline_end = datetime.strptime(sprint_workload.sprint_end_date, '%Y-%m-%d').date()
                     
-                    # 주말/공휴일 배경 및 날짜 라벨 추가
-                    current_date = timeline_start
-                    while current_date <= timeline_end:
-                        if KoreanHolidayCalendar.is_weekend(current_date) or KoreanHolidayCalendar.is_holiday(current_date):
-                            # 하루 전체를 회색 배경으로 표시
-                            next_date = current_date + timedelta(days=1)
-                            fig.add_shape(
-                                type="rect",
-                                x0=current_date.strftime('%Y-%m-%d'),
-                                x1=next_date.strftime('%Y-%m-%d'),
-                                y0=-1.0,  # 여유를 두어 더 넓게
-                                y1=len(task_data),  # 상단도 여유를 두어 더 넓게
-                                fillcolor='rgba(100,100,100,0.4)',  # 더 진한 회색, 높은 투명도
-                                opacity=0.4,
-                                layer="below",
-                                line_width=0
-                            )
-                            
-                            # 주말/공휴일 날짜를 빨간색으로 표시 (어노테이션 제거, tick 색상으로 처리)
-                        current_date += timedelta(days=1)
+                    # 주말/공휴일 배경 추가 (연속된 비업무일은 사각형 하나로 묶음)
+                    for off_start, off_end in calendar.get_non_workday_segments(timeline_start, timeline_end):
+                        fig.add_shape(
+                            type="rect",
+                            x0=off_start.strftime('%Y-%m-%d'),
+                            x1=(off_end + timedelta(days=1)).strftime('%Y-%m-%d'),
+                            y0=-1.0,  # 여유를 두어 더 넓게
+                            y1=len(task_data),  # 상단도 여유를 두어 더 넓게
+                            fillcolor='rgba(100,100,100,0.4)',  # 더 진한 회색, 높은 투명도
+                            opacity=0.4,
+                            layer="below",
+                            line_width=0
+                        )
+                        
+                        # 주말/공휴일 날짜를 빨간색으로 표시 (어노테이션 제거, tick 색상으로 처리)
 
                 # 모든 날짜에 대한 커스텀 tick 설정 (스프린트 전체 기간)
                 if task_data and sprint_workload.sprint_start_date and sprint_workload.sprint_end_date:
@@ -581,15 +569,18 @@ class TaskDistributionViewer:
                     tick_timeline_start = datetime.strptime(sprint_workload.sprint_start_date, '%Y-%m-%d').date()
                     tick_timeline_end = datetime.strptime(sprint_workload.sprint_end_date, '%Y-%m-%d').date()
                     
+                    # 주말/공휴일은 한 번에 조회해 날짜별 공휴일명으로 둔다 (공휴일이 아닌 주말은 빈 문자열)
+                    off_days = dict(calendar.get_non_workdays_between(tick_timeline_start, tick_timeline_end))
+                    
                     current_date = tick_timeline_start
                     while current_date <= tick_timeline_end:
                         date_range.append(current_date.strftime('%Y-%m-%d'))
                         weekday_name = weekdays[current_date.weekday()]
                         
                         # 주말/공휴일이면 빨간색으로 스타일링
-                        if KoreanHolidayCalendar.is_weekend(current_date) or KoreanHolidayCalendar.is_holiday(current_date):
-                            if KoreanHolidayCalendar.is_holiday(current_date):
-                                holiday_name = KoreanHolidayCalendar.get_holiday_name(current_date)
+                        if current_date in off_days:
+                            holiday_name = off_days[current_date]
+                            if holiday_name:
                                 # 공휴일: 아이콘과 배경색 추가, bold 스타일
                                 tick_text = f"<span style='color:red; font-weight:bold; background-color:rgba(255,200,200,0.7); padding:2px 4px; border-radius:3px;'>🏮 {current_date.strftime('%m/%d')}<br>({holiday_name})</span>"
                             else:
@@ -3,6 +3,20 @@
 # 데이터베이스 설정
 DATABASE_CONFIG = {
     "db_path": "pokoton.db",
+    # 연결 풀 및 SQLite PRAGMA 설정
+    "pool_size": 8,                 # 프로세스당 최대 연결 수
+    "pool_timeout": 10.0,           # 풀이 가득 찼을 때 대기 시간 (초)
+    "busy_timeout_ms": 5000,        # 잠금 대기 시간 (밀리초)
+    "journal_mode": "WAL",          # 읽기/쓰기 동시성 향상
+    "synchronous": "NORMAL",        # WAL 모드에서 안전한 수준의 fsync 빈도
+    "foreign_keys": True,           # ON DELETE CASCADE / SET NULL 적용 (연결마다 켜야 함)
+    "auto_vacuum": "INCREMENTAL",   # 삭제로 비운 페이지를 파일에서 반환 (기존 DB는 초기화 시 한 번 VACUUM)
+    "read_cache_size": 256,         # 프로젝트 데이터 버전으로 검증하는 조회 결과 캐시 항목 수
+    # 쿼리 계측 (execute_query 실행 시간/행 수/호출 위치)
+    "query_stats_enabled": True,
+    "query_log_size": 1000,         # 최근 쿼리 기록 링 버퍼 크기
+    "slow_query_ms": 50.0,          # 이 시간 이상 걸린 쿼리는 실행 계획과 함께 기록
+    "slow_query_log": None,         # 느린 쿼리 로그 파일 경로 (None이면 파일 기록 안 함)
     "tables": {
         "projects": "projects",
         "team_members": "team_members", 
@@ -37,6 +51,32 @@ DEFAULT_VALUES = {
     "task_estimated_hours": 8.0
 }
 
+# 업무 일괄 가져오기 (CSV/XLSX) 설정
+IMPORT_CONFIG = {
+    "chunk_size": 2000,             # 한 번에 읽고 검증/저장하는 행 수
+    "max_reported_issues": 1000     # 리포트에 보관하는 오류/경고 최대 건수
+}
+
+# 업무일 달력 설정 (프로젝트별로 선택, projects.calendar)
+CALENDAR_CONFIG = {
+    "default": "korean",            # 기본 달력 (내장: 대한민국 공휴일)
+    "calendar_dir": "calendars",    # ICS/CSV 달력 파일을 두는 폴더 (상대 경로는 앱 폴더 기준, 프로젝트 설정에는 파일명만 저장)
+    "extend_korean": True,          # 파일 달력의 휴일·휴무일을 대한민국 공휴일에 더해 적용
+    "compiled_cache_size": 16,      # 파일 내용 해시별로 보관하는 컴파일된 달력 수
+    "recurrence_years": 30          # 매년 반복 일정(RRULE)을 펼치는 최대 햇수 (COUNT/UNTIL이 더 길어도 여기까지)
+}
+
+# 시뮬레이션 설정
+SIMULATION_CONFIG = {
+    "algorithm": "round_robin",
+    "algorithm_version": 1,         # 분배/일정 계산 로직이 바뀌면 올려서 이전 결과와 구분
+    "history_limit": 20,            # 프로젝트별로 보관하는 시뮬레이션 실행 이력 수
+    # 입력 지문 기반 결과 캐시 (프로세스 단위 LRU)
+    "cache_max_entries": 32,        # 보관하는 결과 수
+    "cache_max_assignments": 200_000,  # 보관 결과의 총 할당 행 수 상한 (메모리 제한)
+    "cache_dir": None               # 지정하면 결과를 pickle 파일로도 저장 (예: ".cache/simulation")
+}
+
 # 파일 경로
 FILE_PATHS = {
     "database": "database.py",
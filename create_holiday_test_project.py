@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # create_holiday_test_project.py - 한국 공휴일 검증용 샘플 프로젝트 생성
 
-from database import create_project, add_team_member, add_task, add_sprint
+from database import create_project, add_team_members_bulk, add_tasks_bulk, add_sprints_bulk
 from datetime import date, timedelta
 import time
 
@@ -21,50 +21,41 @@ def create_holiday_verification_project():
             {"name": "박테스트", "role": "QA 엔지니어", "hours": 7.0}
         ]
         
-        for member in team_members:
-            add_team_member(
-                project_id=project_id,
-                name=member["name"],
-                role=member["role"],
-                available_hours_per_day=member["hours"]
-            )
+        add_team_members_bulk(project_id, [
+            {"name": member["name"], "role": member["role"], "available_hours_per_day": member["hours"]}
+            for member in team_members
+        ])
         print(f"[OK] Team members created: {len(team_members)}")
         
         # 3. 한국 공휴일이 포함된 스프린트 생성
-        # 2025년 설날 연휴 포함 (1월 28일~30일)
-        # 2025년 어린이날 포함 (5월 5일~6일)
+        # 2025년 설날 연휴 포함 (1월 27일 임시공휴일, 28일~30일)
+        # 2025년 어린이날 포함 (5월 5일, 6일 대체공휴일)
+        # 2025년 추석 연휴 포함 (10월 3일~9일)
         
         today = date.today()
         
         sprints = [
             {
                 "name": "Sprint 1 - 설날 연휴 포함",
-                "description": "설날 연휴가 포함된 스프린트 (1/28~1/30 연휴)",
+                "description": "설날 연휴가 포함된 스프린트 (1/27 임시공휴일 + 1/28~1/30 설날)",
                 "start_date": "2025-01-20",  # 월요일 시작
-                "end_date": "2025-02-07"     # 금요일 종료 (18일간, 설날 연휴 3일 포함)
+                "end_date": "2025-02-07"     # 금요일 종료 (18일간, 평일 공휴일 4일 포함)
             },
             {
                 "name": "Sprint 2 - 어린이날 연휴 포함", 
-                "description": "어린이날 연휴가 포함된 스프린트 (5/5~5/6 연휴)",
+                "description": "어린이날 연휴가 포함된 스프린트 (5/5 어린이날·부처님 오신 날 + 5/6 대체공휴일)",
                 "start_date": "2025-04-28",  # 월요일 시작
-                "end_date": "2025-05-16"     # 금요일 종료 (18일간, 어린이날 연휴 2일 포함)
+                "end_date": "2025-05-16"     # 금요일 종료 (18일간, 평일 공휴일 2일 포함)
             },
             {
                 "name": "Sprint 3 - 추석 연휴 포함",
-                "description": "추석 연휴가 포함된 스프린트 (9/28~9/30 연휴)",
+                "description": "추석 연휴가 포함된 스프린트 (10/3 개천절, 10/5~10/7 추석 + 10/8 대체공휴일, 10/9 한글날)",
                 "start_date": "2025-09-22",  # 월요일 시작
-                "end_date": "2025-10-10"     # 금요일 종료 (18일간, 추석 연휴 3일 포함)
+                "end_date": "2025-10-10"     # 금요일 종료 (18일간, 평일 공휴일 5일 포함)
             }
         ]
         
-        for sprint in sprints:
-            add_sprint(
-                project_id=project_id,
-                name=sprint["name"],
-                description=sprint["description"],
-                start_date=sprint["start_date"],
-                end_date=sprint["end_date"]
-            )
+        add_sprints_bulk(project_id, sprints)
         print(f"[OK] Sprints created: {len(sprints)} (with Korean holidays)")
         
         # 4. 다양한 시간의 업무 생성 (공휴일 제외 검증용)
@@ -130,23 +121,10 @@ def create_holiday_verification_project():
             }
         ]
         
-        for task in tasks:
-            add_task(
-                project_id=project_id,
-                attribute=task["attribute"],
-                build_type=task["build_type"],
-                part_division=task["part_division"],
-                priority=task["priority"],
-                item_name=task["item_name"],
-                content=task["content"],
-                assignee=task["assignee"],
-                story_points_leader=task["story_points_leader"],
-                duration_leader=task["duration_leader"],
-                duration_assignee=0.0,
-                final_hours=task["final_hours"],
-                ai_judgment="자동생성",
-                connectivity=""
-            )
+        add_tasks_bulk(project_id, [
+            {**task, "duration_assignee": 0.0, "ai_judgment": "자동생성", "connectivity": ""}
+            for task in tasks
+        ])
         
         print(f"[OK] Tasks created: {len(tasks)}")
         
@@ -157,9 +135,9 @@ def create_holiday_verification_project():
         print(f"   - Tasks: {len(tasks)} (총 {sum(t['final_hours'] for t in tasks)}시간)")
         
         print(f"\n[HOLIDAY CHECK] 한국 공휴일 검증 포인트:")
-        print(f"   * Sprint 1: 설날 연휴 (1/28~1/30) - 3일간 공휴일")
-        print(f"   * Sprint 2: 어린이날 연휴 (5/5~5/6) - 2일간 공휴일") 
-        print(f"   * Sprint 3: 추석 연휴 (9/28~9/30) - 3일간 공휴일")
+        print(f"   * Sprint 1: 1/27 임시공휴일 + 설날 (1/28~1/30) - 평일 4일 공휴일")
+        print(f"   * Sprint 2: 어린이날·부처님 오신 날 (5/5) + 대체공휴일 (5/6) - 평일 2일 공휴일") 
+        print(f"   * Sprint 3: 개천절 (10/3), 추석 (10/5~10/7) + 대체공휴일 (10/8), 한글날 (10/9) - 평일 5일 공휴일")
         print(f"   * 각 스프린트마다 주말도 자동 제외됨")
         
         print(f"\n[VERIFY] 확인할 사항:")
@@ -1,8 +1,18 @@
 # database.py - 데이터베이스 연결 및 CRUD 함수
 
+import functools
+import json
+import os
 import sqlite3
+import queue
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from types import MappingProxyType
 from typing import List, Dict, Optional
-from config import DATABASE_CONFIG
+from config import DATABASE_CONFIG, CALENDAR_CONFIG
 # Sprint 모델은 임시로 여기서 정의
 from dataclasses import dataclass
 from typing import Optional
@@ -31,47 +41,521 @@ def validate_sprint(name: str, start_date: Optional[date], end_date: Optional[da
     return True
 
 # 기존 모델들은 models 모듈에서 import
-from models import Project, TeamMember, Task, validate_project_name, validate_team_member, validate_task
+from models import Project, TeamMember, Task, ProjectSnapshot, validate_project_name, validate_team_member, validate_task
+
+@functools.lru_cache(maxsize=512)
+def _normalize_sql(query: str) -> str:
+    """쿼리 통계 집계용 SQL (공백 정리)"""
+    return " ".join(query.split())
+
+# 쿼리를 실행/기록만 하는 내부 함수 (쿼리 통계의 조회 함수명을 찾을 때 건너뜀)
+_QUERY_HELPERS = frozenset({"_call_site", "record_query", "execute_query", "_insert_many"})
 
 class DatabaseManager:
-    """데이터베이스 관리 클래스"""
+    """데이터베이스 관리 클래스 (연결 풀 기반)
+
+    연결을 쿼리마다 새로 열지 않고 프로세스 단위 풀에서 재사용한다.
+    모듈 전역 인스턴스(db)는 Streamlit 재실행 간에도 유지되므로 연결 역시 재사용된다.
+    """
+    
+    def __init__(self, db_path: str = None, pool_size: int = None):
+        self.db_path = db_path or DATABASE_CONFIG["db_path"]
+        self.pool_size = pool_size or DATABASE_CONFIG["pool_size"]
+        self.pool_timeout = DATABASE_CONFIG["pool_timeout"]
+        
+        self._pool = queue.LifoQueue(maxsize=self.pool_size)
+        self._lock = threading.Lock()
+        self._created = 0
+        self._stats = {"hits": 0, "misses": 0, "waits": 0, "wait_time": 0.0}
+        self._local = threading.local()   # 스레드별 진행 중인 트랜잭션 (transaction())
+        self._write_generation = 0    # 풀 연결로 쓰기가 일어날 때마다 증가
+        self._epoch = 0               # close_all(DB 파일 교체/초기화)마다 증가
+        
+        # 쿼리 계측 (최근 실행 기록 링 버퍼 + 느린 쿼리 로그)
+        self.query_stats_enabled = DATABASE_CONFIG["query_stats_enabled"]
+        self.slow_query_ms = DATABASE_CONFIG["slow_query_ms"]
+        self.slow_query_log = DATABASE_CONFIG["slow_query_log"]
+        self._slow_log_lock = threading.Lock()   # 로그 파일 쓰기 전용 (디스크 I/O 중에도 풀 잠금은 잡지 않음)
+        self._query_log = deque(maxlen=DATABASE_CONFIG["query_log_size"])
+        self._slow_queries = deque(maxlen=50)
+        self._query_totals = {"count": 0, "time": 0.0, "slow": 0}
     
-    def __init__(self):
-        self.db_path = DATABASE_CONFIG["db_path"]
+    def _connect(self) -> sqlite3.Connection:
+        """PRAGMA 설정이 적용된 새 연결 생성"""
+        busy_timeout_ms = DATABASE_CONFIG["busy_timeout_ms"]
+        conn = sqlite3.connect(self.db_path, timeout=busy_timeout_ms / 1000, check_same_thread=False)
+        conn.execute(f"PRAGMA journal_mode = {DATABASE_CONFIG['journal_mode']}")
+        conn.execute(f"PRAGMA synchronous = {DATABASE_CONFIG['synchronous']}")
+        conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+        conn.execute(f"PRAGMA foreign_keys = {'ON' if DATABASE_CONFIG['foreign_keys'] else 'OFF'}")
+        return conn
     
     def get_connection(self):
-        """데이터베이스 연결 반환"""
-        return sqlite3.connect(self.db_path)
+        """풀과 무관한 독립 연결 반환 (호출자가 직접 close 해야 함)"""
+        return self._connect()
     
-    def execute_query(self, query: str, params: tuple = (), fetch: str = None):
-        """쿼리 실행 헬퍼 함수"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+    def _acquire(self) -> sqlite3.Connection:
+        """풀에서 연결 대여 (없으면 생성, 한도 초과 시 반환될 때까지 대기)"""
+        try:
+            conn = self._pool.get_nowait()
+            with self._lock:
+                self._stats["hits"] += 1
+            return conn
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            can_create = self._created < self.pool_size
+            if can_create:
+                self._created += 1
+                self._stats["misses"] += 1
+        
+        if can_create:
+            try:
+                return self._connect()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
         
+        # 풀이 가득 찬 경우 다른 스레드가 반환할 때까지 대기
+        wait_start = time.perf_counter()
         try:
-            cursor.execute(query, params)
-            
-            if fetch == "one":
-                result = cursor.fetchone()
-            elif fetch == "all":
-                result = cursor.fetchall()
-            elif fetch == "lastrowid":
-                result = cursor.lastrowid
-            else:
-                result = None
-            
-            conn.commit()
-            return result
-            
-        except Exception as e:
+            conn = self._pool.get(timeout=self.pool_timeout)
+        except queue.Empty:
+            raise sqlite3.OperationalError(f"데이터베이스 연결 대기 시간이 초과되었습니다 ({self.pool_timeout}초)")
+        with self._lock:
+            self._stats["hits"] += 1
+            self._stats["waits"] += 1
+            self._stats["wait_time"] += time.perf_counter() - wait_start
+        return conn
+    
+    def _release(self, conn: sqlite3.Connection):
+        """연결을 풀에 반환"""
+        if conn.in_transaction:
             conn.rollback()
-            raise e
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+            with self._lock:
+                self._created -= 1
+    
+    @contextmanager
+    def connection(self):
+        """풀 연결 대여 컨텍스트 매니저 (트랜잭션 진행 중이면 그 연결을 그대로 사용)"""
+        joined = getattr(self._local, "conn", None)
+        if joined is not None:
+            yield joined
+            return
+        
+        conn = self._acquire()
+        changes = conn.total_changes
+        try:
+            yield conn
         finally:
+            if conn.total_changes != changes:
+                with self._lock:
+                    self._write_generation += 1
+            self._release(conn)
+    
+    def in_transaction(self) -> bool:
+        """현재 스레드에서 transaction()이 진행 중인지"""
+        return getattr(self._local, "conn", None) is not None
+    
+    @contextmanager
+    def transaction(self, immediate: bool = True):
+        """작업 단위 트랜잭션 (범위 안의 database.py 함수 호출이 모두 합류해 한 번에 커밋)
+
+        예외가 발생하면 전체를 롤백한다. 이미 진행 중인 트랜잭션 안에서 다시 열면 SAVEPOINT로
+        합류하므로, 안쪽 범위의 예외를 바깥에서 처리하면 안쪽 변경만 되돌려진다.
+        immediate=False는 읽기 전용 스냅샷 조회용 (쓰기 잠금을 미리 잡지 않음).
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            depth = self._local.depth = self._local.depth + 1
+            savepoint = f"uow_{depth}"
+            conn.execute(f"SAVEPOINT {savepoint}")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute(f"ROLLBACK TO {savepoint}")
+                conn.execute(f"RELEASE {savepoint}")
+                raise
+            else:
+                conn.execute(f"RELEASE {savepoint}")
+            finally:
+                self._local.depth = depth - 1
+            return
+        
+        with self.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+            self._local.conn = conn
+            self._local.depth = 0
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            else:
+                conn.commit()
+            finally:
+                self._local.conn = None
+    
+    def release_free_pages(self) -> int:
+        """삭제로 비워진 페이지를 파일에서 반환 (auto_vacuum=INCREMENTAL인 DB만, 반환한 페이지 수)"""
+        with self.connection() as conn:
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                return 0
+            free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if free_pages:
+                # execute()는 결과 열이 없는 PRAGMA를 한 단계만 실행해 한 페이지만 반환하므로 스크립트로 끝까지 실행
+                conn.executescript("PRAGMA incremental_vacuum; PRAGMA wal_checkpoint(PASSIVE);")
+            return free_pages
+    
+    @property
+    def write_generation(self) -> int:
+        """이 프로세스에서 일어난 쓰기 횟수 (조회 캐시의 요청 단위 버전 확인용)"""
+        return self._write_generation
+    
+    @property
+    def epoch(self) -> int:
+        """연결 초기화 세대 (DB 파일이 바뀌면 이전 캐시 값을 쓰지 않도록)"""
+        return self._epoch
+    
+    def close_all(self):
+        """풀에 남아있는 연결 모두 종료 (DB 파일 교체/초기화 시 사용)"""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
             conn.close()
+            with self._lock:
+                self._created -= 1
+        with self._lock:
+            self._epoch += 1
+    
+    def get_pool_stats(self) -> Dict:
+        """연결 풀 통계 (적중/미스/대기 시간)"""
+        with self._lock:
+            stats = dict(self._stats)
+            created = self._created
+        requests = stats["hits"] + stats["misses"]
+        return {
+            "pool_size": self.pool_size,
+            "open_connections": created,
+            "idle_connections": self._pool.qsize(),
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "hit_rate": round(stats["hits"] / requests * 100, 1) if requests else 0.0,
+            "waits": stats["waits"],
+            "wait_time_ms": round(stats["wait_time"] * 1000, 2)
+        }
+    
+    def _call_site(self) -> tuple:
+        """(database.py 안의 조회 함수명, database.py 밖의 호출 위치)"""
+        frame = sys._getframe()
+        while frame is not None and frame.f_code.co_filename == __file__ and frame.f_code.co_name in _QUERY_HELPERS:
+            frame = frame.f_back
+        if frame is None:
+            return "", ""
+        function = frame.f_code.co_name
+        while frame is not None and frame.f_code.co_filename == __file__:
+            frame = frame.f_back
+        if frame is None:
+            return function, ""
+        return function, f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno} {frame.f_code.co_name}"
+    
+    def record_query(self, conn: sqlite3.Connection, query: str, params, duration: float, rows: int):
+        """쿼리 실행 기록 (임계값을 넘으면 실행 계획과 함께 느린 쿼리로 저장)"""
+        if not self.query_stats_enabled:
+            return
+        
+        duration_ms = duration * 1000
+        function, caller = self._call_site()
+        entry = {
+            "sql": _normalize_sql(query),
+            "function": function,
+            "caller": caller,
+            "duration_ms": duration_ms,
+            "rows": rows,
+            "at": time.time(),
+        }
+        
+        slow = duration_ms >= self.slow_query_ms
+        if slow:
+            try:
+                plan = conn.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+                entry["plan"] = " / ".join(row[-1] for row in plan)
+            except sqlite3.Error:
+                entry["plan"] = ""
+        
+        with self._lock:
+            self._query_log.append(entry)
+            self._query_totals["count"] += 1
+            self._query_totals["time"] += duration_ms
+            if slow:
+                self._query_totals["slow"] += 1
+                self._slow_queries.append(entry)
+        
+        if slow and self.slow_query_log:
+            line = "\t".join([
+                time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(entry["at"])),
+                f"{duration_ms:.1f}ms", f"rows={rows}", function, caller, entry["sql"], f"plan={entry['plan']}"
+            ])
+            try:
+                with self._slow_log_lock, open(self.slow_query_log, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+            except OSError:
+                pass
+    
+    def get_query_stats(self, top: int = 10) -> Dict:
+        """쿼리 통계 (누적 합계 + 링 버퍼 기준 SQL별 집계 + 최근 느린 쿼리)"""
+        with self._lock:
+            entries = list(self._query_log)
+            slow_queries = list(self._slow_queries)
+            totals = dict(self._query_totals)
+        
+        grouped = {}
+        for entry in entries:
+            group = grouped.setdefault(entry["sql"], {
+                "sql": entry["sql"], "function": entry["function"], "caller": entry["caller"],
+                "count": 0, "total_ms": 0.0, "max_ms": 0.0, "rows": 0
+            })
+            group["count"] += 1
+            group["total_ms"] += entry["duration_ms"]
+            group["max_ms"] = max(group["max_ms"], entry["duration_ms"])
+            group["rows"] += entry["rows"]
+        
+        statements = sorted(grouped.values(), key=lambda group: group["total_ms"], reverse=True)[:top]
+        for group in statements:
+            group["mean_ms"] = group["total_ms"] / group["count"]
+        
+        return {
+            "total_queries": totals["count"],
+            "total_time_ms": round(totals["time"], 2),
+            "mean_ms": round(totals["time"] / totals["count"], 3) if totals["count"] else 0.0,
+            "slow_queries": totals["slow"],
+            "slow_query_ms": self.slow_query_ms,
+            "recent_queries": len(entries),
+            "top_statements": statements,
+            "recent_slow_queries": slow_queries[::-1]
+        }
+    
+    def reset_query_stats(self):
+        """쿼리 통계 초기화"""
+        with self._lock:
+            self._query_log.clear()
+            self._slow_queries.clear()
+            self._query_totals = {"count": 0, "time": 0.0, "slow": 0}
+    
+    def execute_query(self, query: str, params: tuple = (), fetch: str = None):
+        """쿼리 실행 헬퍼 함수 (실행 시간/행 수/호출 위치 기록, transaction() 안에서는 커밋을 미룸)"""
+        joined = self.in_transaction()
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            
+            try:
+                started = time.perf_counter()
+                cursor.execute(query, params)
+                
+                if fetch == "one":
+                    result = cursor.fetchone()
+                    rows = 1 if result is not None else 0
+                elif fetch == "all":
+                    result = cursor.fetchall()
+                    rows = len(result)
+                elif fetch == "lastrowid":
+                    result = cursor.lastrowid
+                    rows = max(cursor.rowcount, 0)
+                else:
+                    result = None
+                    rows = max(cursor.rowcount, 0)
+                
+                if not joined:
+                    conn.commit()
+                self.record_query(conn, query, params, time.perf_counter() - started, rows)
+                return result
+                
+            except Exception as e:
+                if not joined:
+                    conn.rollback()
+                raise e
+            finally:
+                cursor.close()
 
 # 전역 데이터베이스 매니저 인스턴스
 db = DatabaseManager()
 
+class ReadCache:
+    """프로젝트 단위 조회 결과 캐시 (모든 세션이 공유)
+
+    값은 (DB epoch, 프로젝트 데이터 버전)과 함께 보관하고 현재 버전과 같을 때만 재사용한다.
+    request_scope() 안에서는 프로젝트 버전 확인도 요청(Streamlit rerun)당 한 번만 하며,
+    그 사이 이 프로세스에서 쓰기가 일어나면 다시 확인한다.
+    """
+    
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()   # 키 → (버전, 값)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats = {"hits": 0, "misses": 0, "version_checks": 0}
+    
+    @contextmanager
+    def request_scope(self):
+        """요청 단위 범위 (프로젝트 버전 확인 결과를 범위 안에서 재사용, 중첩되면 바깥 범위를 그대로 사용)"""
+        previous = getattr(self._local, "versions", None)
+        if previous is None:
+            self._local.versions = {}
+        try:
+            yield
+        finally:
+            self._local.versions = previous
+    
+    def _project_version(self, project_id: int) -> tuple:
+        """(DB 매니저, epoch, 프로젝트 데이터 버전) - 요청 범위 안에서는 쓰기가 없으면 재조회하지 않음"""
+        versions = getattr(self._local, "versions", None)
+        generation = db.write_generation
+        if versions is not None:
+            memo = versions.get(project_id)
+            if memo is not None and memo[0] == generation:
+                return memo[1]
+        
+        version = (id(db), db.epoch, get_project_version(project_id))
+        with self._lock:
+            self._stats["version_checks"] += 1
+        if versions is not None:
+            versions[project_id] = (generation, version)
+        return version
+    
+    def project_version(self, project_id: int) -> Optional[int]:
+        """프로젝트 데이터 버전 (요청 범위 안에서는 조회 캐시의 버전 확인과 한 번의 조회를 공유)"""
+        return self._project_version(project_id)[2]
+    
+    def get_or_load(self, key: tuple, project_id: int, loader):
+        """캐시 값 반환 (없거나 버전이 다르면 loader 실행 후 저장, 프로젝트가 없으면 저장하지 않음)
+
+        트랜잭션 진행 중에는 커밋 전 데이터를 보거나 남기지 않도록 캐시를 거치지 않는다.
+        """
+        if db.in_transaction():
+            return loader()
+        
+        version = self._project_version(project_id)
+        if version[-1] is None:
+            return loader()
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry[1]
+        
+        value = loader()
+        with self._lock:
+            self._stats["misses"] += 1
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+    
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+    
+    def get_stats(self) -> Dict:
+        """캐시 통계 (적중/미스/버전 확인 횟수)"""
+        with self._lock:
+            stats = dict(self._stats)
+            entries = len(self._entries)
+        requests = stats["hits"] + stats["misses"]
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "version_checks": stats["version_checks"],
+            "hit_rate": round(stats["hits"] / requests * 100, 1) if requests else 0.0
+        }
+
+read_cache = ReadCache(DATABASE_CONFIG["read_cache_size"])
+
+def _copy_result(value):
+    """캐시 값을 호출자에게 넘길 때 목록/dict를 복사 (호출자가 수정해도 캐시는 그대로)"""
+    if isinstance(value, list):
+        return [dict(item) if isinstance(item, dict) else item for item in value]
+    if isinstance(value, dict):
+        return {key: list(item) if isinstance(item, list) else item for key, item in value.items()}
+    if isinstance(value, tuple):
+        return tuple(_copy_result(item) for item in value)
+    return value
+
+def cached_read(func):
+    """프로젝트 ID를 첫 인자로 받는 조회 함수를 read_cache로 감싸기 (원본은 func.uncached)"""
+    @functools.wraps(func)
+    def wrapper(project_id, *args, **kwargs):
+        key = (func.__name__, project_id, json.dumps([args, kwargs], sort_keys=True, default=str))
+        value = read_cache.get_or_load(key, project_id, lambda: func(project_id, *args, **kwargs))
+        return _copy_result(value)
+    wrapper.uncached = func
+    return wrapper
+
+# 조회 컬럼 정의 및 행 → dict 변환 (여러 조회 함수에서 공통 사용)
+SPRINT_COLUMNS = "id, name, description, start_date, end_date, status, created_at"
+TEAM_MEMBER_COLUMNS = "id, name, role, available_hours_per_day, profile_icon_index, hire_date, created_at"
+TASK_COLUMNS = """id, attribute, build_type, part_division, priority, item_name, content,
+                  assignee, story_points_leader, duration_leader, duration_assignee, final_hours,
+                  ai_judgment, connectivity, created_at, assignee_id"""
+
+def _row_to_sprint(row) -> Dict:
+    """스프린트 행 → dict"""
+    return {
+        "id": row[0],
+        "name": row[1],
+        "description": row[2],
+        "start_date": row[3],
+        "end_date": row[4],
+        "status": row[5],
+        "created_at": row[6]
+    }
+
+def _row_to_team_member(row) -> Dict:
+    """팀원 행 → dict"""
+    return {
+        "id": row[0],
+        "name": row[1],
+        "role": row[2],
+        "available_hours_per_day": row[3],
+        "profile_icon_index": row[4] if row[4] is not None else 0,  # 기본값 0
+        "hire_date": row[5],  # 입사일
+        "created_at": row[6]
+    }
+
+def _row_to_task(row) -> Dict:
+    """업무 행 → dict (H4: 13개 필드)"""
+    return {
+        "id": row[0],
+        "attribute": row[1],
+        "build_type": row[2],
+        "part_division": row[3],
+        "priority": row[4], 
+        "item_name": row[5],
+        "content": row[6],
+        "assignee": row[7],
+        "story_points_leader": row[8],
+        "duration_leader": row[9],
+        "duration_assignee": row[10],
+        "final_hours": row[11],
+        "ai_judgment": row[12],
+        "connectivity": row[13],
+        "created_at": row[14],
+        "assignee_id": row[15]  # 담당 팀원 ID (assignee 이름과 일치하는 팀원이 없으면 None)
+    }
+
 # 프로젝트 관련 함수들
 def create_project(name: str) -> int:
     """새 프로젝트 생성"""
@@ -97,6 +581,7 @@ def get_all_projects() -> List[Dict]:
     
     return [{"id": row[0], "name": row[1], "created_at": row[2]} for row in rows or []]
 
+@cached_read
 def get_project_by_id(project_id: int) -> Optional[Dict]:
     """ID로 프로젝트 조회"""
     row = db.execute_query(
@@ -109,12 +594,48 @@ def get_project_by_id(project_id: int) -> Optional[Dict]:
         return {"id": row[0], "name": row[1], "created_at": row[2]}
     return None
 
+def get_project_version(project_id: int) -> Optional[int]:
+    """프로젝트 데이터 버전 (업무/팀원/스프린트가 바뀔 때마다 트리거가 증가, 프로젝트가 없으면 None)
+
+    캐시된 조회 결과나 시뮬레이션 결과가 최신인지 정수 비교 한 번으로 확인하는 용도.
+    """
+    row = db.execute_query(
+        "SELECT data_version FROM projects WHERE id = ?",
+        (project_id,),
+        fetch="one"
+    )
+    return row[0] if row else None
+
+@cached_read
+def get_project_calendar(project_id: int) -> str:
+    """프로젝트 업무 달력 이름 (프로젝트가 없으면 기본 달력)"""
+    row = db.execute_query(
+        "SELECT calendar FROM projects WHERE id = ?",
+        (project_id,),
+        fetch="one"
+    )
+    return row[0] if row else CALENDAR_CONFIG["default"]
+
+def set_project_calendar(project_id: int, calendar: str) -> bool:
+    """프로젝트 업무 달력 변경 (트리거가 데이터 버전을 올려 캐시된 조회와 시뮬레이션 지문이 갱신된다)"""
+    db.execute_query(
+        "UPDATE projects SET calendar = ? WHERE id = ?",
+        (calendar, project_id)
+    )
+    return True
+
 def delete_project(project_id: int) -> bool:
-    """프로젝트 삭제"""
-    result = db.execute_query(
+    """프로젝트 삭제 (하위 스프린트/팀원/업무/실행 이력은 외래 키 CASCADE로 함께 삭제)
+
+    하위 테이블의 project_id는 모두 인덱스 선두 컬럼이라 연쇄 삭제가 전체 스캔 없이 끝난다.
+    삭제 후 비워진 페이지는 incremental_vacuum으로 파일에서 반환한다.
+    """
+    db.execute_query(
         "DELETE FROM projects WHERE id = ?",
         (project_id,)
     )
+    if not db.in_transaction():
+        db.release_free_pages()
     return True  # 삭제 성공
 
 # 스프린트 관련 함수들
@@ -140,10 +661,11 @@ def add_sprint(project_id: int, name: str, description: str = "", start_date: st
     except sqlite3.IntegrityError:
         raise ValueError(f"스프린트 '{name}'은 이미 존재합니다.")
 
+@cached_read
 def get_sprints(project_id: int) -> List[Dict]:
     """프로젝트의 스프린트 목록 조회"""
     rows = db.execute_query(
-        '''SELECT id, name, description, start_date, end_date, status, created_at
+        f'''SELECT {SPRINT_COLUMNS}
            FROM sprints
            WHERE project_id = ?
            ORDER BY start_date, created_at''',
@@ -151,15 +673,7 @@ def get_sprints(project_id: int) -> List[Dict]:
         fetch="all"
     )
     
-    return [{
-        "id": row[0],
-        "name": row[1],
-        "description": row[2],
-        "start_date": row[3],
-        "end_date": row[4],
-        "status": row[5],
-        "created_at": row[6]
-    } for row in rows or []]
+    return [_row_to_sprint(row) for row in rows or []]
 
 def get_sprint_by_id(sprint_id: int) -> Optional[Dict]:
     """ID로 스프린트 조회"""
@@ -184,6 +698,7 @@ def get_sprint_by_id(sprint_id: int) -> Optional[Dict]:
         }
     return None
 
+@cached_read
 def get_sprint_by_name(project_id: int, name: str) -> Optional[Dict]:
     """이름으로 스프린트 조회"""
     row = db.execute_query(
@@ -227,12 +742,26 @@ def update_sprint(sprint_id: int, name: str, description: str = "", start_date:
     except sqlite3.IntegrityError:
         raise ValueError(f"스프린트 '{name}'은 이미 존재합니다.")
 
-def delete_sprint(sprint_id: int) -> bool:
-    """스프린트 삭제"""
-    db.execute_query(
-        "DELETE FROM sprints WHERE id = ?",
-        (sprint_id,)
-    )
+def delete_sprint(sprint_id: int, reassign_to: Optional[int] = None) -> bool:
+    """스프린트 삭제 (reassign_to를 주면 소속 업무를 그 스프린트로 옮기고 한 트랜잭션에서 삭제)"""
+    with db.transaction():
+        sprint = get_sprint_by_id(sprint_id)
+        target = get_sprint_by_id(reassign_to) if reassign_to is not None else None
+        if reassign_to is not None and (
+            not sprint or not target or target["project_id"] != sprint["project_id"] or target["id"] == sprint_id
+        ):
+            raise ValueError("같은 프로젝트의 다른 스프린트로만 업무를 옮길 수 있습니다.")
+
+        if target:
+            # 업무는 스프린트 이름(build_type)으로 소속을 나타낸다
+            db.execute_query(
+                "UPDATE tasks SET build_type = ? WHERE project_id = ? AND build_type = ?",
+                (target["name"], sprint["project_id"], sprint["name"])
+            )
+        db.execute_query(
+            "DELETE FROM sprints WHERE id = ?",
+            (sprint_id,)
+        )
     return True
 
 # 팀원 관련 함수들
@@ -253,10 +782,11 @@ def add_team_member(project_id: int, name: str, role: str, available_hours_per_d
     )
     return member_id
 
+@cached_read
 def get_team_members(project_id: int) -> List[Dict]:
     """프로젝트의 팀원 목록 조회"""
     rows = db.execute_query(
-        '''SELECT id, name, role, available_hours_per_day, profile_icon_index, hire_date, created_at
+        f'''SELECT {TEAM_MEMBER_COLUMNS}
            FROM team_members
            WHERE project_id = ?
            ORDER BY created_at''',
@@ -264,15 +794,19 @@ def get_team_members(project_id: int) -> List[Dict]:
         fetch="all"
     )
     
-    return [{
-        "id": row[0],
-        "name": row[1],
-        "role": row[2],
-        "available_hours_per_day": row[3],
-        "profile_icon_index": row[4] if len(row) > 4 else 0,  # 기본값 0
-        "hire_date": row[5] if len(row) > 5 else None,  # 입사일
-        "created_at": row[6] if len(row) > 6 else row[4]  # 호환성 유지
-    } for row in rows or []]
+    return [_row_to_team_member(row) for row in rows or []]
+
+def update_team_member(member_id: int, name: str, role: str, available_hours_per_day: float, hire_date: str = None) -> bool:
+    """팀원 수정 (이름이 바뀌면 트리거가 담당 업무의 assignee도 함께 변경)"""
+    if not validate_team_member(name, role, available_hours_per_day):
+        raise ValueError("유효하지 않은 팀원 정보입니다.")
+    
+    db.execute_query(
+        '''UPDATE team_members SET name = ?, role = ?, available_hours_per_day = ?, hire_date = ?
+           WHERE id = ?''',
+        (name.strip(), role.strip(), available_hours_per_day, hire_date, member_id)
+    )
+    return True
 
 def delete_team_member(member_id: int) -> bool:
     """팀원 삭제"""
@@ -306,12 +840,11 @@ def add_task(project_id: int, attribute: str = "", build_type: str = "", part_di
     )
     return task_id
 
+@cached_read
 def get_tasks(project_id: int) -> List[Dict]:
     """프로젝트의 업무 목록 조회 (H4: 13개 필드)"""
     rows = db.execute_query(
-        '''SELECT id, attribute, build_type, part_division, priority, item_name, content,
-                  assignee, story_points_leader, duration_leader, duration_assignee, final_hours,
-                  ai_judgment, connectivity, created_at
+        f'''SELECT {TASK_COLUMNS}
            FROM tasks
            WHERE project_id = ?
            ORDER BY priority, created_at''',
@@ -319,23 +852,146 @@ def get_tasks(project_id: int) -> List[Dict]:
         fetch="all"
     )
     
-    return [{
-        "id": row[0],
-        "attribute": row[1],
-        "build_type": row[2],
-        "part_division": row[3],
-        "priority": row[4], 
-        "item_name": row[5],
-        "content": row[6],
-        "assignee": row[7],
-        "story_points_leader": row[8],
-        "duration_leader": row[9],
-        "duration_assignee": row[10],
-        "final_hours": row[11],
-        "ai_judgment": row[12],
-        "connectivity": row[13],
-        "created_at": row[14]
-    } for row in rows or []]
+    return [_row_to_task(row) for row in rows or []]
+
+# 업무 목록 페이지 조회 (SQL 필터 + keyset 페이지네이션)
+TASK_FILTER_COLUMNS = ("build_type", "assignee", "priority", "attribute", "part_division")
+
+# 정렬 이름 → 정렬 키 식 (마지막은 항상 id로 순서를 유일하게 만든다, '-' 접두사는 내림차순)
+# 행 값 비교에서 NULL은 어느 쪽도 아니어서 빠지므로 키에 NULL이 없어야 한다.
+# priority/created_at은 마이그레이션 v12 트리거가 채워 인덱스를 그대로 쓰고, final_hours는 COALESCE로 0 취급
+TASK_SORT_KEYS = {
+    "priority": ("priority", "created_at", "id"),
+    "created_at": ("created_at", "id"),
+    "final_hours": ("COALESCE(final_hours, 0)", "id"),
+}
+
+def _task_filter_clause(project_id: int, filters: Optional[Dict]) -> tuple:
+    """필터 dict → (WHERE 절, 파라미터). 값이 목록이면 IN, 비어 있으면 무시"""
+    clauses = ["project_id = ?"]
+    params = [project_id]
+    for column, value in (filters or {}).items():
+        if column not in TASK_FILTER_COLUMNS:
+            raise ValueError(f"지원하지 않는 필터입니다: {column}")
+        if value is None:
+            continue
+        values = list(value) if isinstance(value, (list, tuple, set)) else [value]
+        if not values:
+            continue
+        clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+        params.extend(values)
+    return " AND ".join(clauses), params
+
+@cached_read
+def query_tasks(project_id: int, filters: Optional[Dict] = None, sort: str = "priority",
+                after_key: Optional[tuple] = None, limit: int = 50) -> tuple:
+    """업무 목록 한 페이지 조회
+
+    Args:
+        filters: {"build_type": [...], "assignee": "김개발", "priority": [1, 2], ...}
+        sort: TASK_SORT_KEYS의 이름 ('-' 접두사는 내림차순)
+        after_key: 이전 페이지의 next_key (None이면 첫 페이지)
+        limit: 페이지 크기
+
+    Returns:
+        (업무 dict 목록, next_key) - 다음 페이지가 없으면 next_key는 None
+    """
+    descending = sort.startswith("-")
+    sort_columns = TASK_SORT_KEYS.get(sort.lstrip("-"))
+    if sort_columns is None:
+        raise ValueError(f"지원하지 않는 정렬입니다: {sort}")
+
+    where, params = _task_filter_clause(project_id, filters)
+    if after_key is not None:
+        # 행 값 비교로 마지막 행 다음부터 조회 (OFFSET 없이 정렬 인덱스를 그대로 이어서 읽음)
+        where += f" AND ({', '.join(sort_columns)}) {'<' if descending else '>'} ({', '.join('?' * len(sort_columns))})"
+        params.extend(after_key)
+
+    direction = " DESC" if descending else ""
+    rows = db.execute_query(
+        f'''SELECT {TASK_COLUMNS}, {", ".join(sort_columns)}
+           FROM tasks
+           WHERE {where}
+           ORDER BY {", ".join(column + direction for column in sort_columns)}
+           LIMIT ?''',
+        tuple(params) + (limit + 1,),
+        fetch="all"
+    ) or []
+
+    key_start = len(rows[0]) - len(sort_columns) if rows else 0
+    next_key = tuple(rows[limit - 1][key_start:]) if len(rows) > limit else None
+    return [_row_to_task(row) for row in rows[:limit]], next_key
+
+@cached_read
+def count_tasks(project_id: int, filters: Optional[Dict] = None) -> int:
+    """필터 조건에 맞는 업무 수"""
+    where, params = _task_filter_clause(project_id, filters)
+    row = db.execute_query(f"SELECT COUNT(*) FROM tasks WHERE {where}", tuple(params), fetch="one")
+    return row[0] if row else 0
+
+@cached_read
+def get_task_filter_options(project_id: int) -> Dict[str, List]:
+    """필터 선택지 (프로젝트 업무에 실제로 존재하는 값)"""
+    return {
+        column: [row[0] for row in db.execute_query(
+            f"SELECT DISTINCT {column} FROM tasks WHERE project_id = ? ORDER BY {column}",
+            (project_id,),
+            fetch="all"
+        ) or []]
+        for column in TASK_FILTER_COLUMNS
+    }
+
+# 업무 전문 검색 (tasks_fts)
+TASK_SEARCH_WEIGHTS = (10.0, 1.0, 2.0)  # bm25 가중치: 업무명, 내용, AI 판단
+
+def _build_fts_query(query: str) -> str:
+    """입력 문자열 → FTS5 MATCH 식 (단어마다 접두어 검색, 모든 단어 AND)
+
+    각 단어를 큰따옴표로 감싸 FTS5 연산자/특수문자를 일반 문자로 취급한다.
+    """
+    terms = [term.replace('"', '""') for term in query.split()]
+    return " ".join(f'"{term}"*' for term in terms if term)
+
+@cached_read
+def search_tasks(project_id: int, query: str, limit: int = 20) -> List[Dict]:
+    """업무 검색 (업무명/내용/AI 판단, 관련도순)
+
+    '#12' 또는 '12'처럼 업무 ID를 입력하면 해당 업무를 맨 앞에 포함한다.
+    """
+    query = (query or "").strip()
+    if not query:
+        return []
+
+    results = []
+    task_id = query.lstrip("#")
+    if task_id.isdigit():
+        row = db.execute_query(
+            "SELECT id, item_name, build_type, assignee, priority FROM tasks WHERE id = ? AND project_id = ?",
+            (int(task_id), project_id),
+            fetch="one"
+        )
+        if row:
+            results.append(row)
+
+    match = _build_fts_query(query)
+    if match:
+        rows = db.execute_query(
+            f'''SELECT t.id, t.item_name, t.build_type, t.assignee, t.priority
+               FROM tasks_fts
+               JOIN tasks t ON t.id = tasks_fts.rowid
+               WHERE tasks_fts MATCH ? AND t.project_id = ?
+               ORDER BY bm25(tasks_fts, {", ".join(map(str, TASK_SEARCH_WEIGHTS))}), t.priority, t.id
+               LIMIT ?''',
+            (match, project_id, limit),
+            fetch="all"
+        ) or []
+        pinned_id = results[0][0] if results else None   # '#번호'로 찾은 업무는 중복 없이 맨 앞에 둔다
+        results.extend(row for row in rows if row[0] != pinned_id)
+
+    return [
+        {"id": row[0], "item_name": row[1], "build_type": row[2], "assignee": row[3], "priority": row[4]}
+        for row in results[:limit]
+    ]
 
 def update_task(task_id: int, attribute: str = "", build_type: str = "", part_division: str = "",
                 priority: int = 3, item_name: str = "", content: str = "", assignee: str = "",
@@ -346,25 +1002,29 @@ def update_task(task_id: int, attribute: str = "", build_type: str = "", part_di
         raise ValueError("업무명(항목)은 필수입니다.")
     if not (1 <= priority <= 5):
         raise ValueError("우선순위는 1~5 사이의 값이어야 합니다.")
-    
-    db.execute_query(
-        '''UPDATE tasks SET
-            attribute = ?, build_type = ?, part_division = ?, priority = ?, item_name = ?, content = ?,
-            assignee = ?, story_points_leader = ?, duration_leader = ?, duration_assignee = ?, 
-            final_hours = ?, ai_judgment = ?, connectivity = ?
-           WHERE id = ?''',
-        (attribute, build_type, part_division, priority, item_name.strip(), content,
-         assignee, story_points_leader, duration_leader, duration_assignee, final_hours,
-         ai_judgment, connectivity, task_id)
-    )
+    # connectivity는 트리거가 의존성 간선으로 동기화하므로 순환이 생기는 값은 미리 거부
+    # (검사와 수정을 한 트랜잭션에서 해야 그 사이 다른 쓰기로 순환이 생기지 않는다)
+    depends_on_id = _connectivity_task_id(connectivity)
+    with db.transaction():
+        if depends_on_id is not None and would_create_cycle(task_id, depends_on_id):
+            raise ValueError(f"업무 #{depends_on_id}을(를) 연결하면 순환 의존성이 생깁니다.")
+
+        db.execute_query(
+            '''UPDATE tasks SET
+                attribute = ?, build_type = ?, part_division = ?, priority = ?, item_name = ?, content = ?,
+                assignee = ?, story_points_leader = ?, duration_leader = ?, duration_assignee = ?,
+                final_hours = ?, ai_judgment = ?, connectivity = ?
+               WHERE id = ?''',
+            (attribute, build_type, part_division, priority, item_name.strip(), content,
+             assignee, story_points_leader, duration_leader, duration_assignee, final_hours,
+             ai_judgment, connectivity, task_id)
+        )
     return True
 
 def get_task_by_id(task_id: int) -> Optional[Dict]:
     """ID로 업무 조회"""
     row = db.execute_query(
-        '''SELECT id, attribute, build_type, part_division, priority, item_name, content,
-                  assignee, story_points_leader, duration_leader, duration_assignee, final_hours,
-                  ai_judgment, connectivity, created_at
+        f'''SELECT {TASK_COLUMNS}
            FROM tasks
            WHERE id = ?''',
         (task_id,),
@@ -372,23 +1032,7 @@ def get_task_by_id(task_id: int) -> Optional[Dict]:
     )
     
     if row:
-        return {
-            "id": row[0],
-            "attribute": row[1],
-            "build_type": row[2],
-            "part_division": row[3],
-            "priority": row[4], 
-            "item_name": row[5],
-            "content": row[6],
-            "assignee": row[7],
-            "story_points_leader": row[8],
-            "duration_leader": row[9],
-            "duration_assignee": row[10],
-            "final_hours": row[11],
-            "ai_judgment": row[12],
-            "connectivity": row[13],
-            "created_at": row[14]
-        }
+        return _row_to_task(row)
     return None
 
 def delete_task(task_id: int) -> bool:
@@ -399,44 +1043,420 @@ def delete_task(task_id: int) -> bool:
     )
     return True
 
-# 프로젝트 요약 정보
-def get_project_summary(project_id: int) -> Dict:
-    """프로젝트 요약 정보 조회"""
-    # 팀원 수
-    team_count_result = db.execute_query(
-        "SELECT COUNT(*) FROM team_members WHERE project_id = ?",
-        (project_id,),
-        fetch="one"
-    )
-    team_count = team_count_result[0] if team_count_result else 0
+# 업무 의존성 그래프 (task_dependencies: task_id가 depends_on_id에 의존)
+DEPENDENCY_KINDS = {
+    "finish_to_start": "선행 업무 완료 후 시작",
+    "connectivity": "업무 연결성 (업무 입력 폼)",
+}
+
+def _connectivity_task_id(connectivity) -> Optional[int]:
+    """connectivity 값('12', '#12')이 업무 ID면 정수로, 아니면 None"""
+    value = str(connectivity or "").strip("# ")
+    return int(value) if value.isdigit() else None
+
+def add_task_dependency(task_id: int, depends_on_id: int, kind: str = "finish_to_start") -> bool:
+    """의존성 추가 (같은 프로젝트의 업무만, 순환이 생기면 ValueError)"""
+    if kind not in DEPENDENCY_KINDS:
+        raise ValueError(f"지원하지 않는 의존성 종류입니다: {kind}")
+    if task_id == depends_on_id:
+        raise ValueError("업무는 자기 자신에 의존할 수 없습니다.")
     
-    # 업무 수
-    task_count_result = db.execute_query(
-        "SELECT COUNT(*) FROM tasks WHERE project_id = ?",
+    with db.transaction():
+        row = db.execute_query(
+            "SELECT COUNT(DISTINCT project_id), COUNT(*) FROM tasks WHERE id IN (?, ?)",
+            (task_id, depends_on_id),
+            fetch="one"
+        )
+        if row[1] != 2:
+            raise ValueError("존재하지 않는 업무입니다.")
+        if row[0] != 1:
+            raise ValueError("같은 프로젝트의 업무끼리만 연결할 수 있습니다.")
+        if would_create_cycle(task_id, depends_on_id):
+            raise ValueError(f"업무 #{depends_on_id}에 의존하면 순환 의존성이 생깁니다.")
+
+        db.execute_query(
+            "INSERT OR REPLACE INTO task_dependencies (task_id, depends_on_id, kind) VALUES (?, ?, ?)",
+            (task_id, depends_on_id, kind)
+        )
+    return True
+
+def remove_task_dependency(task_id: int, depends_on_id: int) -> bool:
+    """의존성 삭제"""
+    db.execute_query(
+        "DELETE FROM task_dependencies WHERE task_id = ? AND depends_on_id = ?",
+        (task_id, depends_on_id)
+    )
+    return True
+
+@cached_read
+def get_dependency_edges(project_id: int) -> List[Dict]:
+    """프로젝트의 의존성 간선 목록"""
+    rows = db.execute_query(
+        '''SELECT d.task_id, d.depends_on_id, d.kind
+           FROM task_dependencies d
+           JOIN tasks t ON t.id = d.task_id
+           WHERE t.project_id = ?
+           ORDER BY d.task_id, d.depends_on_id''',
         (project_id,),
+        fetch="all"
+    )
+    return [{"task_id": row[0], "depends_on_id": row[1], "kind": row[2]} for row in rows or []]
+
+def _dependency_closure(task_id: int, upstream: bool) -> List[Dict]:
+    """재귀 CTE로 의존성 전이 폐쇄 조회 (direct = 직접 연결 여부)
+
+    UNION이 이미 방문한 업무를 다시 확장하지 않으므로 간선 수에 비례해 종료되며,
+    순환이 있는 기존 데이터에서도 무한 반복하지 않는다. 탐색은 정방향은 기본 키,
+    역방향은 idx_task_dependencies_reverse 인덱스를 사용한다.
+    """
+    source, target = ("task_id", "depends_on_id") if upstream else ("depends_on_id", "task_id")
+    rows = db.execute_query(
+        f'''WITH RECURSIVE closure(id) AS (
+               SELECT {target} FROM task_dependencies WHERE {source} = ?
+               UNION
+               SELECT d.{target} FROM closure c JOIN task_dependencies d ON d.{source} = c.id
+           )
+           SELECT t.id, t.item_name, t.assignee, t.build_type, t.priority,
+                  EXISTS (SELECT 1 FROM task_dependencies d WHERE d.{source} = ? AND d.{target} = t.id) AS direct
+           FROM closure c
+           JOIN tasks t ON t.id = c.id
+           WHERE t.id <> ?
+           ORDER BY direct DESC, t.priority, t.id''',
+        (task_id, task_id, task_id),
+        fetch="all"
+    )
+    return [
+        {"id": row[0], "item_name": row[1], "assignee": row[2], "build_type": row[3], "priority": row[4], "direct": bool(row[5])}
+        for row in rows or []
+    ]
+
+def get_upstream_tasks(task_id: int) -> List[Dict]:
+    """이 업무가 (직간접적으로) 의존하는 선행 업무 목록"""
+    return _dependency_closure(task_id, upstream=True)
+
+def get_downstream_tasks(task_id: int) -> List[Dict]:
+    """이 업무에 (직간접적으로) 의존하는 후행 업무 목록 (변경 영향 범위)"""
+    return _dependency_closure(task_id, upstream=False)
+
+def would_create_cycle(task_id: int, depends_on_id: int) -> bool:
+    """task_id → depends_on_id 간선을 추가하면 순환이 생기는지 확인"""
+    if task_id == depends_on_id:
+        return True
+    row = db.execute_query(
+        '''WITH RECURSIVE reach(id) AS (
+               SELECT ?
+               UNION
+               SELECT d.depends_on_id FROM reach r JOIN task_dependencies d ON d.task_id = r.id
+           )
+           SELECT 1 FROM reach WHERE id = ? LIMIT 1''',
+        (depends_on_id, task_id),
         fetch="one"
     )
-    task_count = task_count_result[0] if task_count_result else 0
-    
-    # 총 예상 시간 (H4: final_hours 컬럼 사용)
-    total_hours_result = db.execute_query(
-        "SELECT SUM(final_hours) FROM tasks WHERE project_id = ?",
+    return row is not None
+
+@cached_read
+def find_dependency_cycles(project_id: int) -> List[int]:
+    """순환 의존성에 포함된 업무 ID 목록 (이전된 기존 데이터 점검용)"""
+    rows = db.execute_query(
+        '''WITH RECURSIVE reach(start_id, id) AS (
+               SELECT d.task_id, d.depends_on_id
+               FROM task_dependencies d
+               JOIN tasks t ON t.id = d.task_id
+               WHERE t.project_id = ?
+               UNION
+               SELECT r.start_id, d.depends_on_id
+               FROM reach r
+               JOIN task_dependencies d ON d.task_id = r.id
+           )
+           SELECT DISTINCT start_id FROM reach WHERE start_id = id ORDER BY start_id''',
         (project_id,),
-        fetch="one"
+        fetch="all"
     )
-    total_hours = total_hours_result[0] if total_hours_result and total_hours_result[0] else 0
-    
-    # 총 가용 시간 (일일)
-    total_capacity_result = db.execute_query(
-        "SELECT SUM(available_hours_per_day) FROM team_members WHERE project_id = ?",
+    return [row[0] for row in rows or []]
+
+# 대량 추가 (단일 트랜잭션 + executemany)
+TASK_INSERT_DEFAULTS = {
+    "attribute": "", "build_type": "", "part_division": "", "priority": 3, "item_name": "",
+    "content": "", "assignee": "", "story_points_leader": 0, "duration_leader": 0.0,
+    "duration_assignee": 0.0, "final_hours": 0.0, "ai_judgment": "", "connectivity": ""
+}
+
+def _insert_many(sql: str, params: List[tuple]) -> List[int]:
+    """여러 행을 하나의 IMMEDIATE 트랜잭션에서 삽입하고 새 ID 목록 반환
+
+    쓰기 잠금을 잡은 상태에서 삽입하므로 AUTOINCREMENT ID가 연속으로 부여된다.
+    (트리거 내부 INSERT는 last_insert_rowid()에 영향을 주지 않는다)
+    """
+    if not params:
+        return []
+
+    with db.transaction() as conn:
+        started = time.perf_counter()
+        conn.executemany(sql, params)
+        last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        db.record_query(conn, sql, params[0], time.perf_counter() - started, len(params))
+
+    return list(range(last_id - len(params) + 1, last_id + 1))
+
+def add_sprints_bulk(project_id: int, sprints: List[Dict]) -> List[int]:
+    """스프린트 대량 추가 (add_sprint와 같은 키의 dict 목록, 입력 순서대로 ID 반환)"""
+    params = []
+    names = set()
+    for index, sprint in enumerate(sprints):
+        name = sprint.get("name", "")
+        if not validate_sprint(name, None, None):
+            raise ValueError(f"유효하지 않은 스프린트 정보입니다. ({index + 1}번째 항목)")
+        if name.strip() in names:
+            raise ValueError(f"스프린트 '{name}'은 이미 존재합니다.")
+        names.add(name.strip())
+        params.append((
+            project_id, name.strip(), sprint.get("description", ""),
+            sprint.get("start_date") or None, sprint.get("end_date") or None,
+            sprint.get("status", "planned")
+        ))
+
+    try:
+        return _insert_many(
+            '''INSERT INTO sprints (project_id, name, description, start_date, end_date, status)
+               VALUES (?, ?, ?, ?, ?, ?)''',
+            params
+        )
+    except sqlite3.IntegrityError as e:
+        raise ValueError(f"이미 존재하는 스프린트가 포함되어 있습니다: {e}")
+
+def add_team_members_bulk(project_id: int, members: List[Dict]) -> List[int]:
+    """팀원 대량 추가 (add_team_member와 같은 키의 dict 목록, 입력 순서대로 ID 반환)"""
+    from utils.icon_generator import get_random_icon_index
+
+    params = []
+    for index, member in enumerate(members):
+        name = member.get("name", "")
+        role = member.get("role", "")
+        hours = member.get("available_hours_per_day", 0)
+        if not validate_team_member(name, role, hours):
+            raise ValueError(f"유효하지 않은 팀원 정보입니다. ({index + 1}번째 항목)")
+        params.append((
+            project_id, name.strip(), role.strip(), hours,
+            get_random_icon_index(), member.get("hire_date")
+        ))
+
+    return _insert_many(
+        '''INSERT INTO team_members (project_id, name, role, available_hours_per_day, profile_icon_index, hire_date)
+           VALUES (?, ?, ?, ?, ?, ?)''',
+        params
+    )
+
+def add_tasks_bulk(project_id: int, tasks: List[Dict]) -> List[int]:
+    """업무 대량 추가 (add_task와 같은 키의 dict 목록, 입력 순서대로 ID 반환)"""
+    params = []
+    for index, task in enumerate(tasks):
+        values = {**TASK_INSERT_DEFAULTS, **task}
+        if not values["item_name"].strip():
+            raise ValueError(f"업무명(항목)은 필수입니다. ({index + 1}번째 항목)")
+        if not (1 <= values["priority"] <= 5):
+            raise ValueError(f"우선순위는 1~5 사이의 값이어야 합니다. ({index + 1}번째 항목)")
+        values["item_name"] = values["item_name"].strip()
+        params.append((project_id,) + tuple(values[key] for key in TASK_INSERT_DEFAULTS))
+
+    return _insert_many(
+        '''INSERT INTO tasks (
+            project_id, attribute, build_type, part_division, priority, item_name, content,
+            assignee, story_points_leader, duration_leader, duration_assignee, final_hours,
+            ai_judgment, connectivity
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
+        params
+    )
+
+# 프로젝트 요약 정보
+@cached_read
+def get_project_summary(project_id: int) -> Dict:
+    """프로젝트 요약 정보 조회 (트리거로 유지되는 project_stats 단건 조회)"""
+    row = db.execute_query(
+        '''SELECT team_count, task_count, total_estimated_hours, total_daily_capacity
+           FROM project_stats
+           WHERE project_id = ?''',
         (project_id,),
         fetch="one"
     )
-    total_daily_capacity = total_capacity_result[0] if total_capacity_result and total_capacity_result[0] else 0
     
+    if not row:
+        return {
+            "team_count": 0,
+            "task_count": 0,
+            "total_estimated_hours": 0,
+            "total_daily_capacity": 0
+        }
+    
+    # 증감 누적으로 생기는 부동소수점 오차 정리
     return {
-        "team_count": team_count,
-        "task_count": task_count,
-        "total_estimated_hours": total_hours,
-        "total_daily_capacity": total_daily_capacity
-    }
\ No newline at end of file
+        "team_count": row[0],
+        "task_count": row[1],
+        "total_estimated_hours": round(row[2], 6),
+        "total_daily_capacity": round(row[3], 6)
+    }
+
+def _summarize(team_members: List[Dict], tasks: List[Dict]) -> Dict:
+    """조회된 팀원/업무 목록으로 요약 정보 계산 (get_project_summary와 동일한 키)"""
+    return {
+        "team_count": len(team_members),
+        "task_count": len(tasks),
+        "total_estimated_hours": sum(task["final_hours"] or 0 for task in tasks),
+        "total_daily_capacity": sum(member["available_hours_per_day"] or 0 for member in team_members)
+    }
+
+@cached_read
+def load_project_snapshot(project_id: int) -> ProjectSnapshot:
+    """프로젝트 스냅샷 조회
+
+    팀원/업무/스프린트와 요약 정보를 하나의 읽기 트랜잭션에서 읽어 불변 객체로 반환한다.
+    검증기, 시뮬레이터, 요약 위젯이 같은 객체를 공유하면 한 번의 일관된 조회로 충분하다.
+    """
+    with db.transaction(immediate=False) as conn:
+        version_row = conn.execute(
+            "SELECT data_version, calendar FROM projects WHERE id = ?", (project_id,)
+        ).fetchone()
+        member_rows = conn.execute(
+            f"SELECT {TEAM_MEMBER_COLUMNS} FROM team_members WHERE project_id = ? ORDER BY created_at",
+            (project_id,)
+        ).fetchall()
+        task_rows = conn.execute(
+            f"SELECT {TASK_COLUMNS} FROM tasks WHERE project_id = ? ORDER BY priority, created_at",
+            (project_id,)
+        ).fetchall()
+        sprint_rows = conn.execute(
+            f"SELECT {SPRINT_COLUMNS} FROM sprints WHERE project_id = ? ORDER BY start_date, created_at",
+            (project_id,)
+        ).fetchall()
+    
+    team_members = [_row_to_team_member(row) for row in member_rows]
+    tasks = [_row_to_task(row) for row in task_rows]
+    sprints = [_row_to_sprint(row) for row in sprint_rows]
+    
+    return ProjectSnapshot(
+        project_id=project_id,
+        team_members=tuple(MappingProxyType(m) for m in team_members),
+        tasks=tuple(MappingProxyType(t) for t in tasks),
+        sprints=tuple(MappingProxyType(s) for s in sprints),
+        summary=MappingProxyType(_summarize(team_members, tasks)),
+        data_version=version_row[0] if version_row else None,
+        calendar=version_row[1] if version_row else None
+    )
+
+# 시뮬레이션 실행 이력 (simulation_runs + simulation_assignments)
+SIMULATION_RUN_COLUMNS = """id, project_id, fingerprint, parameters, total_tasks, total_estimated_hours,
+                            estimated_completion_days, duration_ms, created_at"""
+SIMULATION_ASSIGNMENT_COLUMNS = """seq, task_id, member_id, sprint_index, task_name, priority, estimated_hours,
+                                   story_points, start_day, end_day, start_date, end_date"""
+
+def _row_to_simulation_run(row) -> Dict:
+    """시뮬레이션 실행 행 → dict"""
+    return {
+        "id": row[0],
+        "project_id": row[1],
+        "fingerprint": row[2],
+        "parameters": json.loads(row[3] or "{}"),
+        "total_tasks": row[4],
+        "total_estimated_hours": row[5],
+        "estimated_completion_days": row[6],
+        "duration_ms": row[7],
+        "created_at": row[8]
+    }
+
+def save_simulation_run(project_id: int, fingerprint: str, parameters: Dict, members: List[Dict],
+                        sprints: List[Dict], summary: Dict, assignments: List[Dict]) -> int:
+    """시뮬레이션 실행 결과 저장 (실행 정보와 할당 행을 하나의 트랜잭션으로 기록, 실행 ID 반환)
+
+    summary는 total_tasks, total_estimated_hours, estimated_completion_days, duration_ms, created_at 키,
+    assignments는 SIMULATION_ASSIGNMENT_COLUMNS(seq 제외)와 같은 키의 dict 목록이다.
+    """
+    assignment_keys = [key.strip() for key in SIMULATION_ASSIGNMENT_COLUMNS.split(",")][1:]
+
+    with db.transaction() as conn:
+        run_id = conn.execute(
+            '''INSERT INTO simulation_runs (
+                project_id, fingerprint, parameters, members, sprints, total_tasks,
+                total_estimated_hours, estimated_completion_days, duration_ms, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))''',
+            (project_id, fingerprint, json.dumps(parameters, ensure_ascii=False),
+             json.dumps(members, ensure_ascii=False), json.dumps(sprints, ensure_ascii=False),
+             summary.get("total_tasks", 0), summary.get("total_estimated_hours", 0.0),
+             summary.get("estimated_completion_days", 0), summary.get("duration_ms", 0.0),
+             summary.get("created_at"))
+        ).lastrowid
+        conn.executemany(
+            f'''INSERT INTO simulation_assignments (run_id, {SIMULATION_ASSIGNMENT_COLUMNS})
+               VALUES ({", ".join("?" * (len(assignment_keys) + 2))})''',
+            [
+                (run_id, seq) + tuple(assignment.get(key) for key in assignment_keys)
+                for seq, assignment in enumerate(assignments)
+            ]
+        )
+
+    return run_id
+
+def get_simulation_run(run_id: int) -> Optional[Dict]:
+    """시뮬레이션 실행 조회 (팀원/스프린트 정보와 할당 목록 포함)"""
+    with db.transaction(immediate=False) as conn:
+        row = conn.execute(
+            f"SELECT {SIMULATION_RUN_COLUMNS}, members, sprints FROM simulation_runs WHERE id = ?",
+            (run_id,)
+        ).fetchone()
+        assignment_rows = conn.execute(
+            f"SELECT {SIMULATION_ASSIGNMENT_COLUMNS} FROM simulation_assignments WHERE run_id = ? ORDER BY seq",
+            (run_id,)
+        ).fetchall() if row else []
+
+    if not row:
+        return None
+
+    assignment_keys = [key.strip() for key in SIMULATION_ASSIGNMENT_COLUMNS.split(",")]
+    run = _row_to_simulation_run(row)
+    run["members"] = json.loads(row[9] or "[]")
+    run["sprints"] = json.loads(row[10] or "[]")
+    run["assignments"] = [dict(zip(assignment_keys, assignment_row)) for assignment_row in assignment_rows]
+    return run
+
+def list_simulation_runs(project_id: int, limit: int = 20) -> List[Dict]:
+    """프로젝트의 시뮬레이션 실행 이력 (최신순, 할당 목록 제외)"""
+    rows = db.execute_query(
+        f'''SELECT {SIMULATION_RUN_COLUMNS}
+           FROM simulation_runs
+           WHERE project_id = ?
+           ORDER BY id DESC
+           LIMIT ?''',
+        (project_id, limit),
+        fetch="all"
+    )
+
+    return [_row_to_simulation_run(row) for row in rows or []]
+
+def find_simulation_run(project_id: int, fingerprint: str) -> Optional[int]:
+    """같은 입력 지문으로 저장된 가장 최근 실행 ID"""
+    row = db.execute_query(
+        '''SELECT MAX(id) FROM simulation_runs
+           WHERE project_id = ? AND fingerprint = ?''',
+        (project_id, fingerprint),
+        fetch="one"
+    )
+    return row[0] if row else None
+
+def delete_simulation_run(run_id: int) -> bool:
+    """시뮬레이션 실행 삭제 (할당 행은 트리거가 함께 삭제)"""
+    db.execute_query(
+        "DELETE FROM simulation_runs WHERE id = ?",
+        (run_id,)
+    )
+    return True
+
+def prune_simulation_runs(project_id: int, keep: int) -> int:
+    """최근 keep개만 남기고 오래된 실행 삭제 (삭제된 실행 수 반환)"""
+    with db.transaction() as conn:
+        deleted = conn.execute(
+            '''DELETE FROM simulation_runs
+               WHERE project_id = ? AND id NOT IN (
+                   SELECT id FROM simulation_runs WHERE project_id = ? ORDER BY id DESC LIMIT ?
+               )''',
+            (project_id, project_id, max(keep, 0))
+        ).rowcount
+
+    return deleted
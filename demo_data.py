@@ -2,232 +2,207 @@
 
 import streamlit as st
 from database import (
-    create_project, add_team_member, add_task, add_sprint
+    db, create_project, add_team_members_bulk, add_tasks_bulk, add_sprints_bulk
 )
 from datetime import date, timedelta
 
 def create_demo_project():
     """데모용 프로젝트 생성"""
     try:
-        # 1. 프로젝트 생성
-        project_id = create_project("🚀 포코톤 데모 프로젝트")
+        # 프로젝트/스프린트/팀원/업무를 한 트랜잭션으로 생성 (실패하면 만들다 만 프로젝트가 남지 않음)
+        with db.transaction():
+            # 1. 프로젝트 생성
+            project_id = create_project("🚀 포코톤 데모 프로젝트")
         
-        # 2. 스프린트 생성
-        today = date.today()
-        sprint_data = [
-            {
-                "name": "Sprint 1.0 - 기초설계",
-                "description": "프로젝트 초기 설계 및 환경 구축",
-                "start_date": today.strftime("%Y-%m-%d"),
-                "end_date": (today + timedelta(days=14)).strftime("%Y-%m-%d"),
-                "status": "active"
-            },
-            {
-                "name": "Sprint 1.1 - 핵심개발",
-                "description": "주요 기능 개발 및 구현",
-                "start_date": (today + timedelta(days=15)).strftime("%Y-%m-%d"),
-                "end_date": (today + timedelta(days=28)).strftime("%Y-%m-%d"),
-                "status": "planned"
-            },
-            {
-                "name": "v1.0.0 - 정식릴리즈",
-                "description": "최종 테스트 및 배포 준비",
-                "start_date": (today + timedelta(days=29)).strftime("%Y-%m-%d"),
-                "end_date": (today + timedelta(days=35)).strftime("%Y-%m-%d"),
-                "status": "planned"
-            }
-        ]
+            # 2. 스프린트 생성
+            today = date.today()
+            sprint_data = [
+                {
+                    "name": "Sprint 1.0 - 기초설계",
+                    "description": "프로젝트 초기 설계 및 환경 구축",
+                    "start_date": today.strftime("%Y-%m-%d"),
+                    "end_date": (today + timedelta(days=14)).strftime("%Y-%m-%d"),
+                    "status": "active"
+                },
+                {
+                    "name": "Sprint 1.1 - 핵심개발",
+                    "description": "주요 기능 개발 및 구현",
+                    "start_date": (today + timedelta(days=15)).strftime("%Y-%m-%d"),
+                    "end_date": (today + timedelta(days=28)).strftime("%Y-%m-%d"),
+                    "status": "planned"
+                },
+                {
+                    "name": "v1.0.0 - 정식릴리즈",
+                    "description": "최종 테스트 및 배포 준비",
+                    "start_date": (today + timedelta(days=29)).strftime("%Y-%m-%d"),
+                    "end_date": (today + timedelta(days=35)).strftime("%Y-%m-%d"),
+                    "status": "planned"
+                }
+            ]
         
-        for sprint in sprint_data:
-            add_sprint(
-                project_id=project_id,
-                name=sprint["name"],
-                description=sprint["description"],
-                start_date=sprint["start_date"],
-                end_date=sprint["end_date"],
-                status=sprint["status"]
-            )
+            add_sprints_bulk(project_id, sprint_data)
         
-        # 3. 팀원 생성
-        team_members = [
-            {"name": "김개발", "role": "백엔드 개발자", "hours": 8.0},
-            {"name": "박프론트", "role": "프론트엔드 개발자", "hours": 7.5},
-            {"name": "이디자인", "role": "UI/UX 디자이너", "hours": 7.0},
-            {"name": "최기획", "role": "프로젝트 매니저", "hours": 6.0},
-            {"name": "정QA", "role": "QA 엔지니어", "hours": 8.0}
-        ]
+            # 3. 팀원 생성
+            team_members = [
+                {"name": "김개발", "role": "백엔드 개발자", "hours": 8.0},
+                {"name": "박프론트", "role": "프론트엔드 개발자", "hours": 7.5},
+                {"name": "이디자인", "role": "UI/UX 디자이너", "hours": 7.0},
+                {"name": "최기획", "role": "프로젝트 매니저", "hours": 6.0},
+                {"name": "정QA", "role": "QA 엔지니어", "hours": 8.0}
+            ]
         
-        for member in team_members:
-            add_team_member(
-                project_id=project_id,
-                name=member["name"],
-                role=member["role"],
-                available_hours_per_day=member["hours"]
-            )
+            add_team_members_bulk(project_id, [
+                {"name": member["name"], "role": member["role"], "available_hours_per_day": member["hours"]}
+                for member in team_members
+            ])
         
-        # 4. 업무 생성
-        tasks = [
-            # Sprint 1.0 업무들
-            {
-                "attribute": "기능 개발",
-                "build_type": "Sprint 1.0 - 기초설계",
-                "part_division": "백엔드",
-                "priority": 5,
-                "item_name": "데이터베이스 스키마 설계",
-                "content": "프로젝트에 필요한 데이터베이스 테이블 구조 설계 및 관계 정의",
-                "assignee": "김개발",
-                "story_points_leader": 8,
-                "duration_leader": 16.0,
-                "duration_assignee": 14.0,
-                "final_hours": 15.0,
-                "ai_judgment": "복잡도 높음, 초기 설계 중요",
-                "connectivity": ""
-            },
-            {
-                "attribute": "기능 개발",
-                "build_type": "Sprint 1.0 - 기초설계",
-                "part_division": "프론트엔드",
-                "priority": 4,
-                "item_name": "UI 컴포넌트 시스템 구축",
-                "content": "재사용 가능한 UI 컴포넌트 라이브러리 구축",
-                "assignee": "박프론트",
-                "story_points_leader": 5,
-                "duration_leader": 12.0,
-                "duration_assignee": 10.0,
-                "final_hours": 11.0,
-                "ai_judgment": "표준화 필요, 디자인 시스템 연계",
-                "connectivity": ""
-            },
-            {
-                "attribute": "디자인",
-                "build_type": "Sprint 1.0 - 기초설계",
-                "part_division": "디자인",
-                "priority": 4,
-                "item_name": "와이어프레임 및 프로토타입",
-                "content": "사용자 경험 흐름 설계 및 인터랙티브 프로토타입 제작",
-                "assignee": "이디자인",
-                "story_points_leader": 8,
-                "duration_leader": 20.0,
-                "duration_assignee": 18.0,
-                "final_hours": 19.0,
-                "ai_judgment": "사용자 중심 설계 중요",
-                "connectivity": ""
-            },
+            # 4. 업무 생성
+            tasks = [
+                # Sprint 1.0 업무들
+                {
+                    "attribute": "기능 개발",
+                    "build_type": "Sprint 1.0 - 기초설계",
+                    "part_division": "백엔드",
+                    "priority": 5,
+                    "item_name": "데이터베이스 스키마 설계",
+                    "content": "프로젝트에 필요한 데이터베이스 테이블 구조 설계 및 관계 정의",
+                    "assignee": "김개발",
+                    "story_points_leader": 8,
+                    "duration_leader": 16.0,
+                    "duration_assignee": 14.0,
+                    "final_hours": 15.0,
+                    "ai_judgment": "복잡도 높음, 초기 설계 중요",
+                    "connectivity": ""
+                },
+                {
+                    "attribute": "기능 개발",
+                    "build_type": "Sprint 1.0 - 기초설계",
+                    "part_division": "프론트엔드",
+                    "priority": 4,
+                    "item_name": "UI 컴포넌트 시스템 구축",
+                    "content": "재사용 가능한 UI 컴포넌트 라이브러리 구축",
+                    "assignee": "박프론트",
+                    "story_points_leader": 5,
+                    "duration_leader": 12.0,
+                    "duration_assignee": 10.0,
+                    "final_hours": 11.0,
+                    "ai_judgment": "표준화 필요, 디자인 시스템 연계",
+                    "connectivity": ""
+                },
+                {
+                    "attribute": "디자인",
+                    "build_type": "Sprint 1.0 - 기초설계",
+                    "part_division": "디자인",
+                    "priority": 4,
+                    "item_name": "와이어프레임 및 프로토타입",
+                    "content": "사용자 경험 흐름 설계 및 인터랙티브 프로토타입 제작",
+                    "assignee": "이디자인",
+                    "story_points_leader": 8,
+                    "duration_leader": 20.0,
+                    "duration_assignee": 18.0,
+                    "final_hours": 19.0,
+                    "ai_judgment": "사용자 중심 설계 중요",
+                    "connectivity": ""
+                },
             
-            # Sprint 1.1 업무들
-            {
-                "attribute": "기능 개발",
-                "build_type": "Sprint 1.1 - 핵심개발",
-                "part_division": "백엔드",
-                "priority": 5,
-                "item_name": "API 서버 구현",
-                "content": "RESTful API 서버 구현 및 인증 시스템 개발",
-                "assignee": "김개발",
-                "story_points_leader": 13,
-                "duration_leader": 24.0,
-                "duration_assignee": 20.0,
-                "final_hours": 22.0,
-                "ai_judgment": "핵심 로직, 보안 고려 필요",
-                "connectivity": "1"
-            },
-            {
-                "attribute": "기능 개발",
-                "build_type": "Sprint 1.1 - 핵심개발",
-                "part_division": "프론트엔드",
-                "priority": 4,
-                "item_name": "메인 대시보드 개발",
-                "content": "사용자 대시보드 화면 구현 및 데이터 시각화",
-                "assignee": "박프론트",
-                "story_points_leader": 8,
-                "duration_leader": 16.0,
-                "duration_assignee": 15.0,
-                "final_hours": 15.5,
-                "ai_judgment": "사용자 인터페이스 최적화 필요",
-                "connectivity": "2"
-            },
-            {
-                "attribute": "기능 개발",
-                "build_type": "Sprint 1.1 - 핵심개발",
-                "part_division": "프론트엔드",
-                "priority": 3,
-                "item_name": "업무 관리 화면",
-                "content": "업무 생성, 수정, 삭제 기능이 있는 관리 화면",
-                "assignee": "박프론트",
-                "story_points_leader": 5,
-                "duration_leader": 14.0,
-                "duration_assignee": 12.0,
-                "final_hours": 13.0,
-                "ai_judgment": "CRUD 기본 기능",
-                "connectivity": ""
-            },
+                # Sprint 1.1 업무들
+                {
+                    "attribute": "기능 개발",
+                    "build_type": "Sprint 1.1 - 핵심개발",
+                    "part_division": "백엔드",
+                    "priority": 5,
+                    "item_name": "API 서버 구현",
+                    "content": "RESTful API 서버 구현 및 인증 시스템 개발",
+                    "assignee": "김개발",
+                    "story_points_leader": 13,
+                    "duration_leader": 24.0,
+                    "duration_assignee": 20.0,
+                    "final_hours": 22.0,
+                    "ai_judgment": "핵심 로직, 보안 고려 필요",
+                    "connectivity": "1"
+                },
+                {
+                    "attribute": "기능 개발",
+                    "build_type": "Sprint 1.1 - 핵심개발",
+                    "part_division": "프론트엔드",
+                    "priority": 4,
+                    "item_name": "메인 대시보드 개발",
+                    "content": "사용자 대시보드 화면 구현 및 데이터 시각화",
+                    "assignee": "박프론트",
+                    "story_points_leader": 8,
+                    "duration_leader": 16.0,
+                    "duration_assignee": 15.0,
+                    "final_hours": 15.5,
+                    "ai_judgment": "사용자 인터페이스 최적화 필요",
+                    "connectivity": "2"
+                },
+                {
+                    "attribute": "기능 개발",
+                    "build_type": "Sprint 1.1 - 핵심개발",
+                    "part_division": "프론트엔드",
+                    "priority": 3,
+                    "item_name": "업무 관리 화면",
+                    "content": "업무 생성, 수정, 삭제 기능이 있는 관리 화면",
+                    "assignee": "박프론트",
+                    "story_points_leader": 5,
+                    "duration_leader": 14.0,
+                    "duration_assignee": 12.0,
+                    "final_hours": 13.0,
+                    "ai_judgment": "CRUD 기본 기능",
+                    "connectivity": ""
+                },
             
-            # v1.0.0 업무들
-            {
-                "attribute": "테스트",
-                "build_type": "v1.0.0 - 정식릴리즈",
-                "part_division": "QA",
-                "priority": 5,
-                "item_name": "통합 테스트 및 버그 수정",
-                "content": "전체 시스템 통합 테스트 및 발견된 버그 수정",
-                "assignee": "정QA",
-                "story_points_leader": 8,
-                "duration_leader": 20.0,
-                "duration_assignee": 16.0,
-                "final_hours": 18.0,
-                "ai_judgment": "품질 보증 중요 단계",
-                "connectivity": "4"
-            },
-            {
-                "attribute": "문서화",
-                "build_type": "v1.0.0 - 정식릴리즈",
-                "part_division": "기획",
-                "priority": 3,
-                "item_name": "사용자 매뉴얼 작성",
-                "content": "최종 사용자를 위한 상세 매뉴얼 및 가이드 작성",
-                "assignee": "최기획",
-                "story_points_leader": 3,
-                "duration_leader": 12.0,
-                "duration_assignee": 10.0,
-                "final_hours": 11.0,
-                "ai_judgment": "사용자 편의성 향상",
-                "connectivity": ""
-            },
-            {
-                "attribute": "배포",
-                "build_type": "v1.0.0 - 정식릴리즈",
-                "part_division": "인프라",
-                "priority": 4,
-                "item_name": "프로덕션 배포 준비",
-                "content": "서버 설정, 도메인 연결, SSL 인증서 설정",
-                "assignee": "김개발",
-                "story_points_leader": 5,
-                "duration_leader": 8.0,
-                "duration_assignee": 6.0,
-                "final_hours": 7.0,
-                "ai_judgment": "배포 안정성 중요",
-                "connectivity": "7"
-            }
-        ]
+                # v1.0.0 업무들
+                {
+                    "attribute": "테스트",
+                    "build_type": "v1.0.0 - 정식릴리즈",
+                    "part_division": "QA",
+                    "priority": 5,
+                    "item_name": "통합 테스트 및 버그 수정",
+                    "content": "전체 시스템 통합 테스트 및 발견된 버그 수정",
+                    "assignee": "정QA",
+                    "story_points_leader": 8,
+                    "duration_leader": 20.0,
+                    "duration_assignee": 16.0,
+                    "final_hours": 18.0,
+                    "ai_judgment": "품질 보증 중요 단계",
+                    "connectivity": "4"
+                },
+                {
+                    "attribute": "문서화",
+                    "build_type": "v1.0.0 - 정식릴리즈",
+                    "part_division": "기획",
+                    "priority": 3,
+                    "item_name": "사용자 매뉴얼 작성",
+                    "content": "최종 사용자를 위한 상세 매뉴얼 및 가이드 작성",
+                    "assignee": "최기획",
+                    "story_points_leader": 3,
+                    "duration_leader": 12.0,
+                    "duration_assignee": 10.0,
+                    "final_hours": 11.0,
+                    "ai_judgment": "사용자 편의성 향상",
+                    "connectivity": ""
+                },
+                {
+                    "attribute": "배포",
+                    "build_type": "v1.0.0 - 정식릴리즈",
+                    "part_division": "인프라",
+                    "priority": 4,
+                    "item_name": "프로덕션 배포 준비",
+                    "content": "서버 설정, 도메인 연결, SSL 인증서 설정",
+                    "assignee": "김개발",
+                    "story_points_leader": 5,
+                    "duration_leader": 8.0,
+                    "duration_assignee": 6.0,
+                    "final_hours": 7.0,
+                    "ai_judgment": "배포 안정성 중요",
+                    "connectivity": "7"
+                }
+            ]
         
-        for task in tasks:
-            add_task(
-                project_id=project_id,
-                attribute=task["attribute"],
-                build_type=task["build_type"],
-                part_division=task["part_division"],
-                priority=task["priority"],
-                item_name=task["item_name"],
-                content=task["content"],
-                assignee=task["assignee"],
-                story_points_leader=task["story_points_leader"],
-                duration_leader=task["duration_leader"],
-                duration_assignee=task["duration_assignee"],
-                final_hours=task["final_hours"],
-                ai_judgment=task["ai_judgment"],
-                connectivity=task["connectivity"]
-            )
+            add_tasks_bulk(project_id, tasks)
         
-        return project_id, "🎉 데모 프로젝트가 성공적으로 생성되었습니다!"
+            return project_id, "🎉 데모 프로젝트가 성공적으로 생성되었습니다!"
         
     except Exception as e:
         return None, f"❌ 데모 프로젝트 생성 중 오류가 발생했습니다: {str(e)}"
@@ -3,6 +3,7 @@
 import sqlite3
 import os
 from config import DATABASE_CONFIG
+from migrations import migrate, get_schema_version, is_schema_current, MIGRATIONS, LATEST_VERSION
 
 def create_database():
     """데이터베이스 파일 생성"""
@@ -17,88 +18,42 @@ def create_database():
     conn.close()
     print(f"새 데이터베이스 파일 생성: {db_path}")
 
+AUTO_VACUUM_MODES = {"NONE": 0, "FULL": 1, "INCREMENTAL": 2}
+
+def apply_auto_vacuum(conn: sqlite3.Connection) -> bool:
+    """설정된 auto_vacuum 모드 적용 (이미 같으면 PRAGMA 한 번만 읽음, 변경했으면 True)
+
+    빈 DB는 PRAGMA만으로 적용되고, 테이블이 있는 기존 DB는 VACUUM으로 한 번 다시 써야 바뀐다.
+    다른 연결이 사용 중이라 VACUUM이 실패하면 다음 초기화 때 다시 시도한다.
+    """
+    mode = DATABASE_CONFIG["auto_vacuum"].upper()
+    if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == AUTO_VACUUM_MODES[mode]:
+        return False
+    
+    conn.execute(f"PRAGMA auto_vacuum = {mode}")
+    if conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()[0]:
+        try:
+            conn.execute("VACUUM")
+        except sqlite3.OperationalError:
+            return False
+    return True
+
 def create_tables():
-    """데이터베이스 테이블 생성"""
+    """auto_vacuum 모드 적용 후 스키마를 최신 버전으로 마이그레이션 (최신 상태면 PRAGMA만 읽음)"""
     db_path = DATABASE_CONFIG["db_path"]
     conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    
-    # 프로젝트 테이블
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS projects (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL UNIQUE,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    print(">> projects 테이블 생성 완룼")
-    
-    # 스프린트/빌드 테이블
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS sprints (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            project_id INTEGER NOT NULL,
-            name TEXT NOT NULL,
-            description TEXT DEFAULT '',
-            start_date DATE,
-            end_date DATE,
-            status TEXT DEFAULT 'planned',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE,
-            UNIQUE (project_id, name)
-        )
-    ''')
-    print(">> sprints 테이블 생성 완료")
-    
-    # 팀원 테이블
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS team_members (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            project_id INTEGER NOT NULL,
-            name TEXT NOT NULL,
-            role TEXT NOT NULL,
-            available_hours_per_day REAL NOT NULL,
-            profile_icon_index INTEGER DEFAULT 0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE
-        )
-    ''')
-    print(">> team_members 테이블 생성 완료")
-    
-    # 업무 테이블 (H4: 13개 필드로 확장)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS tasks (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            project_id INTEGER NOT NULL,
-            attribute TEXT DEFAULT '',                    -- 속성
-            build_type TEXT DEFAULT '',                   -- 적용 빌드
-            part_division TEXT DEFAULT '',                -- 파트 구분
-            priority INTEGER DEFAULT 3,                   -- 우선순위 (1-5)
-            item_name TEXT NOT NULL,                      -- 항목 (업무명)
-            content TEXT DEFAULT '',                      -- 내용
-            assignee TEXT DEFAULT '',                     -- 담당자
-            story_points_leader INTEGER DEFAULT 0,        -- 스토리 포인트(리더 입력)
-            duration_leader REAL DEFAULT 0.0,            -- 업무 예상 기간 (리더 입력)
-            duration_assignee REAL DEFAULT 0.0,          -- 업무 예상 기간(담당자 입력)
-            final_hours REAL DEFAULT 0.0,                -- 업무 예상 시간(최종)
-            ai_judgment TEXT DEFAULT '',                  -- AI 판단
-            connectivity TEXT DEFAULT '',                 -- 업무 연결성
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE
-        )
-    ''')
-    print(">> tasks 테이블 생성 완료")
     
-    # 기존 테이블에 새 컬럼 추가 (마이그레이션)
     try:
-        cursor.execute('ALTER TABLE team_members ADD COLUMN profile_icon_index INTEGER DEFAULT 0')
-        print(">> team_members 테이블에 profile_icon_index 컬럼 추가 완료")
-    except sqlite3.OperationalError:
-        # 컬럼이 이미 존재하는 경우
-        pass
+        apply_auto_vacuum(conn)
+        applied = migrate(conn)
+    finally:
+        conn.close()
     
-    conn.commit()
-    conn.close()
+    for version in applied:
+        description = next(desc for ver, desc, _ in MIGRATIONS if ver == version)
+        print(f">> 스키마 마이그레이션 v{version} 적용 완료: {description}")
+    
+    return applied
 
 def insert_sample_data():
     """샘플 데이터 삽입 (선택사항)"""
@@ -175,6 +130,7 @@ def check_database_status():
     tables = cursor.fetchall()
     
     print(f">> 데이터베이스 상태: {db_path}")
+    print(f">> 스키마 버전: v{get_schema_version(conn)} (최신 v{LATEST_VERSION})")
     print(f">> 테이블 수: {len(tables)}")
     
     for table in tables:
@@ -186,22 +142,36 @@ def check_database_status():
     conn.close()
     return True
 
-def initialize_database(with_sample_data=False):
-    """전체 데이터베이스 초기화 프로세스"""
+def is_database_ready():
+    """DB 파일 존재 및 스키마 최신 여부 확인 (PRAGMA 한 번만 읽음)"""
+    db_path = DATABASE_CONFIG["db_path"]
+    
+    if not os.path.exists(db_path):
+        return False
+    
+    conn = sqlite3.connect(db_path)
+    try:
+        return is_schema_current(conn)
+    finally:
+        conn.close()
+
+def initialize_database(with_sample_data=False, report_status=False):
+    """전체 데이터베이스 초기화 프로세스 (테이블별 레코드 수 보고는 report_status=True일 때만)"""
     print(">> 데이터베이스 초기화 시작...")
     
     # 1. 데이터베이스 파일 생성
     create_database()
     
-    # 2. 테이블 생성
+    # 2. 스키마 마이그레이션 (최신 상태면 즉시 종료)
     create_tables()
     
     # 3. 샘플 데이터 삽입 (선택)
     if with_sample_data:
         insert_sample_data()
     
-    # 4. 상태 확인
-    check_database_status()
+    # 4. 상태 확인 (테이블 전체 COUNT를 수행하므로 명시적으로 요청한 경우만)
+    if report_status:
+        check_database_status()
     
     print(">> 데이터베이스 초기화 완료!")
 
@@ -209,9 +179,14 @@ if __name__ == "__main__":
     # 스크립트 직접 실행 시
     import sys
     
+    if "--status" in sys.argv:
+        check_database_status()
+        sys.exit(0)
+    
     with_sample = "--with-sample" in sys.argv
-    initialize_database(with_sample_data=with_sample)
+    initialize_database(with_sample_data=with_sample, report_status=True)
     
     print(f"\n>> 사용법:")
     print(f"  기본 초기화: python init_db.py")
-    print(f"  샘플 데이터 포함: python init_db.py --with-sample")
\ No newline at end of file
+    print(f"  샘플 데이터 포함: python init_db.py --with-sample")
+    print(f"  상태 확인만: python init_db.py --status")
\ No newline at end of file
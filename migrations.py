@@ -0,0 +1,586 @@
+# migrations.py - 버전 기반 스키마 마이그레이션
+
+import sqlite3
+from typing import Callable, List, Tuple
+
+# ---------------------------------------------------------------------------
+# 공통 헬퍼
+# ---------------------------------------------------------------------------
+
+def _column_exists(conn: sqlite3.Connection, table: str, column: str) -> bool:
+    """테이블에 컬럼이 존재하는지 확인"""
+    return any(row[1] == column for row in conn.execute(f"PRAGMA table_info({table})"))
+
+def _add_column_if_missing(conn: sqlite3.Connection, table: str, column: str, definition: str):
+    """컬럼이 없을 때만 ALTER TABLE ADD COLUMN 실행"""
+    if not _column_exists(conn, table, column):
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+# ---------------------------------------------------------------------------
+# 마이그레이션 단계
+# ---------------------------------------------------------------------------
+
+def _migration_001_base_schema(conn: sqlite3.Connection):
+    """기본 테이블 생성 (projects, sprints, team_members, tasks)"""
+    # 프로젝트 테이블
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS projects (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # 스프린트/빌드 테이블
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS sprints (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            project_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            description TEXT DEFAULT '',
+            start_date DATE,
+            end_date DATE,
+            status TEXT DEFAULT 'planned',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE,
+            UNIQUE (project_id, name)
+        )
+    ''')
+
+    # 팀원 테이블
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS team_members (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            project_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            role TEXT NOT NULL,
+            available_hours_per_day REAL NOT NULL,
+            profile_icon_index INTEGER DEFAULT 0,
+            hire_date TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE
+        )
+    ''')
+
+    # 업무 테이블 (H4: 13개 필드)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            project_id INTEGER NOT NULL,
+            attribute TEXT DEFAULT '',                    -- 속성
+            build_type TEXT DEFAULT '',                   -- 적용 빌드
+            part_division TEXT DEFAULT '',                -- 파트 구분
+            priority INTEGER DEFAULT 3,                   -- 우선순위 (1-5)
+            item_name TEXT NOT NULL,                      -- 항목 (업무명)
+            content TEXT DEFAULT '',                      -- 내용
+            assignee TEXT DEFAULT '',                     -- 담당자
+            story_points_leader INTEGER DEFAULT 0,        -- 스토리 포인트(리더 입력)
+            duration_leader REAL DEFAULT 0.0,            -- 업무 예상 기간 (리더 입력)
+            duration_assignee REAL DEFAULT 0.0,          -- 업무 예상 기간(담당자 입력)
+            final_hours REAL DEFAULT 0.0,                -- 업무 예상 시간(최종)
+            ai_judgment TEXT DEFAULT '',                  -- AI 판단
+            connectivity TEXT DEFAULT '',                 -- 업무 연결성
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE
+        )
+    ''')
+
+    # 이전 버전에서 생성된 team_members 테이블 보정
+    _add_column_if_missing(conn, "team_members", "profile_icon_index", "INTEGER DEFAULT 0")
+    _add_column_if_missing(conn, "team_members", "hire_date", "TEXT")
+
+# 프로젝트 요약 통계 유지 트리거 (업무/팀원 변경 시 project_stats 갱신)
+PROJECT_STATS_TRIGGERS = [
+    '''CREATE TRIGGER IF NOT EXISTS trg_projects_stats_insert AFTER INSERT ON projects
+       BEGIN
+           INSERT OR IGNORE INTO project_stats (project_id) VALUES (NEW.id);
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_projects_stats_delete AFTER DELETE ON projects
+       BEGIN
+           DELETE FROM project_stats WHERE project_id = OLD.id;
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_tasks_stats_insert AFTER INSERT ON tasks
+       BEGIN
+           INSERT OR IGNORE INTO project_stats (project_id) VALUES (NEW.project_id);
+           UPDATE project_stats SET
+               task_count = task_count + 1,
+               total_estimated_hours = total_estimated_hours + COALESCE(NEW.final_hours, 0)
+           WHERE project_id = NEW.project_id;
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_tasks_stats_delete AFTER DELETE ON tasks
+       BEGIN
+           UPDATE project_stats SET
+               task_count = task_count - 1,
+               total_estimated_hours = total_estimated_hours - COALESCE(OLD.final_hours, 0)
+           WHERE project_id = OLD.project_id;
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_tasks_stats_update AFTER UPDATE OF project_id, final_hours ON tasks
+       BEGIN
+           UPDATE project_stats SET
+               task_count = task_count - 1,
+               total_estimated_hours = total_estimated_hours - COALESCE(OLD.final_hours, 0)
+           WHERE project_id = OLD.project_id;
+           INSERT OR IGNORE INTO project_stats (project_id) VALUES (NEW.project_id);
+           UPDATE project_stats SET
+               task_count = task_count + 1,
+               total_estimated_hours = total_estimated_hours + COALESCE(NEW.final_hours, 0)
+           WHERE project_id = NEW.project_id;
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_team_members_stats_insert AFTER INSERT ON team_members
+       BEGIN
+           INSERT OR IGNORE INTO project_stats (project_id) VALUES (NEW.project_id);
+           UPDATE project_stats SET
+               team_count = team_count + 1,
+               total_daily_capacity = total_daily_capacity + COALESCE(NEW.available_hours_per_day, 0)
+           WHERE project_id = NEW.project_id;
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_team_members_stats_delete AFTER DELETE ON team_members
+       BEGIN
+           UPDATE project_stats SET
+               team_count = team_count - 1,
+               total_daily_capacity = total_daily_capacity - COALESCE(OLD.available_hours_per_day, 0)
+           WHERE project_id = OLD.project_id;
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_team_members_stats_update AFTER UPDATE OF project_id, available_hours_per_day ON team_members
+       BEGIN
+           UPDATE project_stats SET
+               team_count = team_count - 1,
+               total_daily_capacity = total_daily_capacity - COALESCE(OLD.available_hours_per_day, 0)
+           WHERE project_id = OLD.project_id;
+           INSERT OR IGNORE INTO project_stats (project_id) VALUES (NEW.project_id);
+           UPDATE project_stats SET
+               team_count = team_count + 1,
+               total_daily_capacity = total_daily_capacity + COALESCE(NEW.available_hours_per_day, 0)
+           WHERE project_id = NEW.project_id;
+       END'''
+]
+
+def rebuild_project_stats(conn: sqlite3.Connection):
+    """project_stats 전체 재계산 (최초 생성 시 백필 및 복구용)"""
+    conn.execute("DELETE FROM project_stats")
+    conn.execute('''
+        INSERT INTO project_stats (project_id, team_count, task_count, total_estimated_hours, total_daily_capacity)
+        SELECT p.id,
+               (SELECT COUNT(*) FROM team_members m WHERE m.project_id = p.id),
+               (SELECT COUNT(*) FROM tasks t WHERE t.project_id = p.id),
+               (SELECT COALESCE(SUM(t.final_hours), 0) FROM tasks t WHERE t.project_id = p.id),
+               (SELECT COALESCE(SUM(m.available_hours_per_day), 0) FROM team_members m WHERE m.project_id = p.id)
+        FROM projects p
+    ''')
+
+def _migration_002_project_stats(conn: sqlite3.Connection):
+    """프로젝트 요약 통계 테이블 및 유지 트리거"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS project_stats (
+            project_id INTEGER PRIMARY KEY,
+            team_count INTEGER NOT NULL DEFAULT 0,
+            task_count INTEGER NOT NULL DEFAULT 0,
+            total_estimated_hours REAL NOT NULL DEFAULT 0,
+            total_daily_capacity REAL NOT NULL DEFAULT 0,
+            FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE
+        )
+    ''')
+    for trigger_sql in PROJECT_STATS_TRIGGERS:
+        conn.execute(trigger_sql)
+    rebuild_project_stats(conn)
+
+# 프로젝트 단위 조회 쿼리 형태(필터 + 정렬)에 맞춘 관리 인덱스
+# - get_tasks:          WHERE project_id = ? ORDER BY priority, created_at
+# - get_team_members:   WHERE project_id = ? ORDER BY created_at
+# - get_sprints:        WHERE project_id = ? ORDER BY start_date, created_at
+# - get_sprint_by_name: WHERE project_id = ? AND name = ? → UNIQUE (project_id, name) 자동 인덱스 사용
+MANAGED_INDEXES = {
+    "idx_tasks_project_priority": "CREATE INDEX IF NOT EXISTS idx_tasks_project_priority ON tasks (project_id, priority, created_at)",
+    "idx_team_members_project_created": "CREATE INDEX IF NOT EXISTS idx_team_members_project_created ON team_members (project_id, created_at)",
+    "idx_sprints_project_start": "CREATE INDEX IF NOT EXISTS idx_sprints_project_start ON sprints (project_id, start_date, created_at)",
+}
+
+def _migration_003_project_indexes(conn: sqlite3.Connection):
+    """프로젝트 단위 조회용 인덱스 생성"""
+    for index_sql in MANAGED_INDEXES.values():
+        conn.execute(index_sql)
+    conn.execute("ANALYZE")
+
+def _migration_004_task_recent_index(conn: sqlite3.Connection):
+    """업무 목록 등록순 정렬/페이지네이션용 인덱스 (query_tasks sort='created_at')"""
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_project_created ON tasks (project_id, created_at)")
+
+# 업무 전문 검색 (FTS5 external content - 본문은 tasks 테이블에만 저장하고 색인만 유지)
+TASKS_FTS_TRIGGERS = [
+    '''CREATE TRIGGER IF NOT EXISTS trg_tasks_fts_insert AFTER INSERT ON tasks
+       BEGIN
+           INSERT INTO tasks_fts (rowid, item_name, content, ai_judgment)
+           VALUES (NEW.id, NEW.item_name, NEW.content, NEW.ai_judgment);
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_tasks_fts_delete AFTER DELETE ON tasks
+       BEGIN
+           INSERT INTO tasks_fts (tasks_fts, rowid, item_name, content, ai_judgment)
+           VALUES ('delete', OLD.id, OLD.item_name, OLD.content, OLD.ai_judgment);
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_tasks_fts_update AFTER UPDATE OF item_name, content, ai_judgment ON tasks
+       BEGIN
+           INSERT INTO tasks_fts (tasks_fts, rowid, item_name, content, ai_judgment)
+           VALUES ('delete', OLD.id, OLD.item_name, OLD.content, OLD.ai_judgment);
+           INSERT INTO tasks_fts (rowid, item_name, content, ai_judgment)
+           VALUES (NEW.id, NEW.item_name, NEW.content, NEW.ai_judgment);
+       END'''
+]
+
+def rebuild_tasks_fts(conn: sqlite3.Connection):
+    """tasks_fts 색인 전체 재생성 (최초 생성 시 백필 및 복구용)"""
+    conn.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+
+def _migration_005_tasks_fts(conn: sqlite3.Connection):
+    """업무명/내용/AI 판단 전문 검색 색인 및 동기화 트리거"""
+    # unicode61: 공백/구두점 기준 토큰화 (한글 단어도 "로그"* 같은 접두어 검색으로 조사 포함 단어와 매칭)
+    conn.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+            item_name, content, ai_judgment,
+            content='tasks', content_rowid='id',
+            tokenize='unicode61'
+        )
+    ''')
+    for trigger_sql in TASKS_FTS_TRIGGERS:
+        conn.execute(trigger_sql)
+    rebuild_tasks_fts(conn)
+
+# 업무 의존성 그래프 (task_id가 depends_on_id에 의존)
+# tasks.connectivity(폼에서 입력하는 단일 연결 업무 ID)는 kind='connectivity' 간선으로 트리거가 동기화한다.
+CONNECTIVITY_TASK_ID_SQL = "CAST(trim({col}, '# ') AS INTEGER)"
+CONNECTIVITY_IS_ID_SQL = "(trim({col}, '# ') <> '' AND trim({col}, '# ') NOT GLOB '*[^0-9]*')"
+
+TASK_DEPENDENCY_TRIGGERS = [
+    f'''CREATE TRIGGER IF NOT EXISTS trg_tasks_dependency_insert AFTER INSERT ON tasks
+       WHEN {CONNECTIVITY_IS_ID_SQL.format(col="NEW.connectivity")}
+       BEGIN
+           INSERT OR IGNORE INTO task_dependencies (task_id, depends_on_id, kind)
+           SELECT NEW.id, t.id, 'connectivity' FROM tasks t
+           WHERE t.id = {CONNECTIVITY_TASK_ID_SQL.format(col="NEW.connectivity")}
+             AND t.project_id = NEW.project_id AND t.id <> NEW.id;
+       END''',
+    f'''CREATE TRIGGER IF NOT EXISTS trg_tasks_dependency_update AFTER UPDATE OF connectivity ON tasks
+       WHEN OLD.connectivity IS NOT NEW.connectivity
+       BEGIN
+           DELETE FROM task_dependencies WHERE task_id = NEW.id AND kind = 'connectivity';
+           INSERT OR IGNORE INTO task_dependencies (task_id, depends_on_id, kind)
+           SELECT NEW.id, t.id, 'connectivity' FROM tasks t
+           WHERE {CONNECTIVITY_IS_ID_SQL.format(col="NEW.connectivity")}
+             AND t.id = {CONNECTIVITY_TASK_ID_SQL.format(col="NEW.connectivity")}
+             AND t.project_id = NEW.project_id AND t.id <> NEW.id;
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_tasks_dependency_delete AFTER DELETE ON tasks
+       BEGIN
+           DELETE FROM task_dependencies WHERE task_id = OLD.id;
+           DELETE FROM task_dependencies WHERE depends_on_id = OLD.id;
+       END'''
+]
+
+def _migration_006_task_dependencies(conn: sqlite3.Connection):
+    """업무 의존성 간선 테이블, 역방향 인덱스, connectivity 값 이전"""
+    # 정방향(task_id → depends_on_id)은 기본 키, 역방향은 별도 인덱스로 탐색
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS task_dependencies (
+            task_id INTEGER NOT NULL,
+            depends_on_id INTEGER NOT NULL,
+            kind TEXT NOT NULL DEFAULT 'finish_to_start',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (task_id, depends_on_id),
+            FOREIGN KEY (task_id) REFERENCES tasks (id) ON DELETE CASCADE,
+            FOREIGN KEY (depends_on_id) REFERENCES tasks (id) ON DELETE CASCADE,
+            CHECK (task_id <> depends_on_id)
+        ) WITHOUT ROWID
+    ''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_task_dependencies_reverse ON task_dependencies (depends_on_id, task_id)")
+
+    for trigger_sql in TASK_DEPENDENCY_TRIGGERS:
+        conn.execute(trigger_sql)
+
+    # 기존 connectivity 값 이전 (같은 프로젝트에 존재하는 업무 ID만)
+    conn.execute(f'''
+        INSERT OR IGNORE INTO task_dependencies (task_id, depends_on_id, kind)
+        SELECT t.id, d.id, 'connectivity'
+        FROM tasks t
+        JOIN tasks d ON d.id = {CONNECTIVITY_TASK_ID_SQL.format(col="t.connectivity")}
+        WHERE {CONNECTIVITY_IS_ID_SQL.format(col="t.connectivity")}
+          AND d.project_id = t.project_id AND d.id <> t.id
+    ''')
+
+# 업무 담당자 참조 (tasks.assignee_id → team_members.id)
+# assignee(이름)는 표시/호환용으로 유지하고, 트리거가 같은 프로젝트의 팀원 ID로 해석한다.
+# 이름이 같은 팀원이 여럿이면 먼저 등록된 팀원으로 연결한다.
+ASSIGNEE_ID_LOOKUP_SQL = '''(SELECT m.id FROM team_members m
+            WHERE m.project_id = {task}.project_id AND m.name = trim({task}.assignee)
+            ORDER BY m.created_at, m.id LIMIT 1)'''
+
+TASK_ASSIGNEE_TRIGGERS = [
+    f'''CREATE TRIGGER IF NOT EXISTS trg_tasks_assignee_insert AFTER INSERT ON tasks
+       WHEN NEW.assignee_id IS NULL AND trim(COALESCE(NEW.assignee, '')) NOT IN ('', '미지정')
+       BEGIN
+           UPDATE tasks SET assignee_id = {ASSIGNEE_ID_LOOKUP_SQL.format(task="NEW")} WHERE id = NEW.id;
+       END''',
+    # 팀원 이름 변경으로 assignee가 바뀐 경우(이미 같은 이름의 팀원을 가리킴)는 다시 해석하지 않는다
+    f'''CREATE TRIGGER IF NOT EXISTS trg_tasks_assignee_update AFTER UPDATE OF assignee ON tasks
+       WHEN OLD.assignee IS NOT NEW.assignee
+        AND NEW.assignee IS NOT (SELECT name FROM team_members WHERE id = NEW.assignee_id)
+       BEGIN
+           UPDATE tasks SET assignee_id = {ASSIGNEE_ID_LOOKUP_SQL.format(task="NEW")} WHERE id = NEW.id;
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_team_members_assignee_insert AFTER INSERT ON team_members
+       BEGIN
+           UPDATE tasks SET assignee_id = NEW.id
+           WHERE project_id = NEW.project_id AND assignee_id IS NULL AND trim(assignee) = NEW.name;
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_team_members_assignee_rename AFTER UPDATE OF name ON team_members
+       WHEN OLD.name IS NOT NEW.name
+       BEGIN
+           UPDATE tasks SET assignee = NEW.name WHERE assignee_id = NEW.id;
+       END''',
+    # foreign_keys가 꺼져 있어도 ON DELETE SET NULL과 같은 결과가 되도록 트리거로도 정리
+    '''CREATE TRIGGER IF NOT EXISTS trg_team_members_assignee_delete AFTER DELETE ON team_members
+       BEGIN
+           UPDATE tasks SET assignee_id = NULL WHERE assignee_id = OLD.id;
+       END'''
+]
+
+def _migration_007_task_assignee_id(conn: sqlite3.Connection):
+    """업무 담당자 ID 컬럼, 인덱스, 이름 기반 값 이전"""
+    _add_column_if_missing(
+        conn, "tasks", "assignee_id",
+        "INTEGER REFERENCES team_members (id) ON DELETE SET NULL"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_assignee ON tasks (assignee_id)")
+
+    for trigger_sql in TASK_ASSIGNEE_TRIGGERS:
+        conn.execute(trigger_sql)
+
+    conn.execute(f'''
+        UPDATE tasks SET assignee_id = {ASSIGNEE_ID_LOOKUP_SQL.format(task="tasks")}
+        WHERE assignee_id IS NULL AND trim(COALESCE(assignee, '')) NOT IN ('', '미지정')
+    ''')
+
+# 시뮬레이션 실행 이력 정리 (foreign_keys 설정과 무관하게 하위 행 삭제)
+SIMULATION_RUN_TRIGGERS = [
+    '''CREATE TRIGGER IF NOT EXISTS trg_projects_simulation_runs_delete AFTER DELETE ON projects
+       BEGIN
+           DELETE FROM simulation_runs WHERE project_id = OLD.id;
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_simulation_runs_delete AFTER DELETE ON simulation_runs
+       BEGIN
+           DELETE FROM simulation_assignments WHERE run_id = OLD.id;
+       END'''
+]
+
+def _migration_008_simulation_runs(conn: sqlite3.Connection):
+    """시뮬레이션 실행 이력 및 할당 결과 테이블"""
+    # 팀원/스프린트 정보는 실행 단위 JSON으로 한 번만 저장하고, 할당 행에는 ID와 위치만 남긴다
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS simulation_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            project_id INTEGER NOT NULL,
+            fingerprint TEXT NOT NULL,                    -- 입력 데이터(팀원/업무/스프린트) + 파라미터 지문
+            parameters TEXT NOT NULL DEFAULT '{}',        -- 알고리즘 파라미터 (JSON)
+            members TEXT NOT NULL DEFAULT '[]',           -- 실행 시점 팀원 정보 (JSON)
+            sprints TEXT NOT NULL DEFAULT '[]',           -- 스프린트 그룹 순서와 기간 (JSON)
+            total_tasks INTEGER DEFAULT 0,
+            total_estimated_hours REAL DEFAULT 0.0,
+            estimated_completion_days INTEGER DEFAULT 0,
+            duration_ms REAL DEFAULT 0.0,                 -- 시뮬레이션 소요 시간
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS simulation_assignments (
+            run_id INTEGER NOT NULL,
+            seq INTEGER NOT NULL,                         -- 할당 순서
+            task_id INTEGER NOT NULL,
+            member_id INTEGER NOT NULL,
+            sprint_index INTEGER NOT NULL,                -- simulation_runs.sprints 내 위치
+            task_name TEXT,
+            priority INTEGER,
+            estimated_hours REAL,
+            story_points INTEGER,
+            start_day INTEGER,
+            end_day INTEGER,
+            start_date TEXT,
+            end_date TEXT,
+            PRIMARY KEY (run_id, seq),
+            FOREIGN KEY (run_id) REFERENCES simulation_runs (id) ON DELETE CASCADE
+        ) WITHOUT ROWID
+    ''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_simulation_runs_project ON simulation_runs (project_id, id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_simulation_runs_fingerprint ON simulation_runs (project_id, fingerprint)")
+
+    for trigger_sql in SIMULATION_RUN_TRIGGERS:
+        conn.execute(trigger_sql)
+
+# 프로젝트 데이터 버전 (업무/팀원/스프린트/의존성이 바뀔 때마다 증가)
+# 트리거가 쓰기와 같은 트랜잭션에서 올리므로, 버전이 같으면 해당 프로젝트의 입력 데이터도 같다.
+PROJECT_VERSION_BUMP_SQL = "UPDATE projects SET data_version = data_version + 1 WHERE id = {project_id};"
+
+PROJECT_VERSION_TRIGGERS = [
+    trigger_sql
+    for table in ("tasks", "team_members", "sprints")
+    for trigger_sql in (
+        f'''CREATE TRIGGER IF NOT EXISTS trg_{table}_version_insert AFTER INSERT ON {table}
+       BEGIN
+           {PROJECT_VERSION_BUMP_SQL.format(project_id="NEW.project_id")}
+       END''',
+        f'''CREATE TRIGGER IF NOT EXISTS trg_{table}_version_update AFTER UPDATE ON {table}
+       BEGIN
+           {PROJECT_VERSION_BUMP_SQL.format(project_id="NEW.project_id")}
+           UPDATE projects SET data_version = data_version + 1
+           WHERE id = OLD.project_id AND OLD.project_id IS NOT NEW.project_id;
+       END''',
+        f'''CREATE TRIGGER IF NOT EXISTS trg_{table}_version_delete AFTER DELETE ON {table}
+       BEGIN
+           {PROJECT_VERSION_BUMP_SQL.format(project_id="OLD.project_id")}
+       END''',
+    )
+] + [
+    f'''CREATE TRIGGER IF NOT EXISTS trg_task_dependencies_version_insert AFTER INSERT ON task_dependencies
+       BEGIN
+           {PROJECT_VERSION_BUMP_SQL.format(project_id="(SELECT project_id FROM tasks WHERE id = NEW.task_id)")}
+       END''',
+    f'''CREATE TRIGGER IF NOT EXISTS trg_task_dependencies_version_delete AFTER DELETE ON task_dependencies
+       BEGIN
+           {PROJECT_VERSION_BUMP_SQL.format(project_id="(SELECT project_id FROM tasks WHERE id = OLD.task_id)")}
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_projects_version_rename AFTER UPDATE OF name ON projects
+       BEGIN
+           UPDATE projects SET data_version = data_version + 1 WHERE id = NEW.id;
+       END'''
+]
+
+def _migration_009_project_data_version(conn: sqlite3.Connection):
+    """프로젝트 데이터 버전 컬럼 및 증가 트리거"""
+    _add_column_if_missing(conn, "projects", "data_version", "INTEGER NOT NULL DEFAULT 0")
+
+    for trigger_sql in PROJECT_VERSION_TRIGGERS:
+        conn.execute(trigger_sql)
+
+# 외래 키 미적용 기간에 남은 고아 행 정리 (부모 → 자식 순서, 삭제 트리거가 FTS/통계/의존성도 함께 정리)
+ORPHAN_SWEEP_SQL = [
+    "DELETE FROM simulation_runs WHERE project_id NOT IN (SELECT id FROM projects)",
+    "DELETE FROM simulation_assignments WHERE run_id NOT IN (SELECT id FROM simulation_runs)",
+    "DELETE FROM tasks WHERE project_id NOT IN (SELECT id FROM projects)",
+    "DELETE FROM team_members WHERE project_id NOT IN (SELECT id FROM projects)",
+    "DELETE FROM sprints WHERE project_id NOT IN (SELECT id FROM projects)",
+    "DELETE FROM project_stats WHERE project_id NOT IN (SELECT id FROM projects)",
+    '''DELETE FROM task_dependencies
+       WHERE task_id NOT IN (SELECT id FROM tasks) OR depends_on_id NOT IN (SELECT id FROM tasks)''',
+    '''UPDATE tasks SET assignee_id = NULL
+       WHERE assignee_id IS NOT NULL AND assignee_id NOT IN (SELECT id FROM team_members)''',
+]
+
+def _migration_010_orphan_sweep(conn: sqlite3.Connection):
+    """삭제된 프로젝트에 남아 있던 하위 행 정리 (이후로는 PRAGMA foreign_keys가 CASCADE 적용)"""
+    for sweep_sql in ORPHAN_SWEEP_SQL:
+        conn.execute(sweep_sql)
+
+# 프로젝트 업무 달력 (config.CALENDAR_CONFIG, 내장 달력 이름 또는 달력 폴더의 ICS/CSV 파일명)
+# 달력이 바뀌면 일정 계산 결과도 바뀌므로 데이터 버전을 올려 조회 캐시와 시뮬레이션 지문을 갱신한다.
+PROJECT_CALENDAR_VERSION_TRIGGER = '''CREATE TRIGGER IF NOT EXISTS trg_projects_version_calendar AFTER UPDATE OF calendar ON projects
+       BEGIN
+           UPDATE projects SET data_version = data_version + 1 WHERE id = NEW.id;
+       END'''
+
+def _migration_011_project_calendar(conn: sqlite3.Connection):
+    """프로젝트별 업무 달력 컬럼 및 변경 시 데이터 버전 증가 트리거"""
+    _add_column_if_missing(conn, "projects", "calendar", "TEXT NOT NULL DEFAULT 'korean'")
+    conn.execute(PROJECT_CALENDAR_VERSION_TRIGGER)
+
+# 업무 목록 keyset 정렬 키 (database.TASK_SORT_KEYS)의 priority/created_at은 인덱스를 그대로 타도록 원본 컬럼으로 비교하므로
+# NULL이 없어야 한다 (행 값 비교에서 NULL은 어느 쪽도 아니라 다음 페이지부터 빠짐). 기존 NULL을 채우고 이후에도 채운다.
+TASK_SORT_KEY_BACKFILL_SQL = '''UPDATE tasks SET priority = COALESCE(priority, 3), created_at = COALESCE(created_at, CURRENT_TIMESTAMP)
+       WHERE priority IS NULL OR created_at IS NULL'''
+
+TASK_SORT_KEY_TRIGGERS = [
+    '''CREATE TRIGGER IF NOT EXISTS trg_tasks_sort_keys_insert AFTER INSERT ON tasks
+       WHEN NEW.priority IS NULL OR NEW.created_at IS NULL
+       BEGIN
+           UPDATE tasks SET priority = COALESCE(priority, 3), created_at = COALESCE(created_at, CURRENT_TIMESTAMP)
+           WHERE id = NEW.id;
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_tasks_sort_keys_update AFTER UPDATE OF priority, created_at ON tasks
+       WHEN NEW.priority IS NULL OR NEW.created_at IS NULL
+       BEGIN
+           UPDATE tasks SET priority = COALESCE(priority, 3), created_at = COALESCE(created_at, CURRENT_TIMESTAMP)
+           WHERE id = NEW.id;
+       END''',
+]
+
+def _migration_012_task_sort_keys(conn: sqlite3.Connection):
+    """업무 정렬 키(priority, created_at) NULL 보정 및 보정 트리거"""
+    conn.execute(TASK_SORT_KEY_BACKFILL_SQL)
+    for trigger_sql in TASK_SORT_KEY_TRIGGERS:
+        conn.execute(trigger_sql)
+
+# (버전, 설명, 적용 함수) - 버전은 1부터 연속 증가, 한 번 배포된 단계는 수정하지 않는다
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Connection], None]]] = [
+    (1, "기본 테이블 생성 및 team_members 컬럼 보정", _migration_001_base_schema),
+    (2, "project_stats 통계 테이블 및 트리거", _migration_002_project_stats),
+    (3, "프로젝트 단위 조회 인덱스 (tasks, team_members, sprints)", _migration_003_project_indexes),
+    (4, "업무 등록순 정렬 인덱스", _migration_004_task_recent_index),
+    (5, "업무 전문 검색 색인 (tasks_fts)", _migration_005_tasks_fts),
+    (6, "업무 의존성 그래프 (task_dependencies) 및 connectivity 이전", _migration_006_task_dependencies),
+    (7, "업무 담당자 팀원 ID 참조 (tasks.assignee_id)", _migration_007_task_assignee_id),
+    (8, "시뮬레이션 실행 이력 (simulation_runs, simulation_assignments)", _migration_008_simulation_runs),
+    (9, "프로젝트 데이터 버전 (projects.data_version)", _migration_009_project_data_version),
+    (10, "외래 키 고아 행 정리 (삭제된 프로젝트의 하위 행)", _migration_010_orphan_sweep),
+    (11, "프로젝트 업무 달력 (projects.calendar)", _migration_011_project_calendar),
+    (12, "업무 정렬 키 NULL 보정 (priority, created_at)", _migration_012_task_sort_keys),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+# ---------------------------------------------------------------------------
+# 마이그레이션 엔진
+# ---------------------------------------------------------------------------
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """현재 스키마 버전 (PRAGMA user_version)"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+def is_schema_current(conn: sqlite3.Connection) -> bool:
+    """스키마가 최신 버전인지 확인"""
+    return get_schema_version(conn) >= LATEST_VERSION
+
+def migrate(conn: sqlite3.Connection) -> List[int]:
+    """미적용 마이그레이션을 순서대로 적용하고 적용된 버전 목록 반환
+
+    최신 상태면 PRAGMA 한 번만 읽고 종료한다.
+    각 단계는 별도의 IMMEDIATE 트랜잭션에서 실행되며, 실패 시 해당 단계만 롤백된다.
+    """
+    if is_schema_current(conn):
+        return []
+
+    applied = []
+    for version, description, step in MIGRATIONS:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 다른 프로세스가 먼저 적용했을 수 있으므로 잠금 획득 후 다시 확인
+            if get_schema_version(conn) >= version:
+                conn.rollback()
+                continue
+
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS schema_version (
+                    version INTEGER PRIMARY KEY,
+                    description TEXT NOT NULL,
+                    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            step(conn)
+            conn.execute(
+                "INSERT OR REPLACE INTO schema_version (version, description) VALUES (?, ?)",
+                (version, description)
+            )
+            conn.execute(f"PRAGMA user_version = {int(version)}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        applied.append(version)
+
+    return applied
@@ -1,9 +1,9 @@
 # models/__init__.py - 모델 모듈 초기화
 
-from .data_models import Project, TeamMember, Task
+from .data_models import Project, TeamMember, Task, ProjectSnapshot
 from .validators import validate_project_name, validate_team_member, validate_task
 
 __all__ = [
-    'Project', 'TeamMember', 'Task',
+    'Project', 'TeamMember', 'Task', 'ProjectSnapshot',
     'validate_project_name', 'validate_team_member', 'validate_task'
 ]
\ No newline at end of file
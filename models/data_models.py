@@ -1,7 +1,7 @@
 # models/data_models.py - 데이터 모델 정의
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple, Mapping, Any
 from datetime import datetime
 
 @dataclass
@@ -48,4 +48,21 @@ class Task:
         if not (1 <= self.priority <= 5):
             raise ValueError("우선순위는 1~5 사이의 값이어야 합니다.")
         if not self.item_name.strip():
-            raise ValueError("업무명(항목)은 필수입니다.")
\ No newline at end of file
+            raise ValueError("업무명(항목)은 필수입니다.")
+
+@dataclass(frozen=True)
+class ProjectSnapshot:
+    """프로젝트 스냅샷 (한 번의 읽기 트랜잭션으로 조회한 불변 데이터)
+
+    각 행은 읽기 전용 매핑이며 키 구성은 get_team_members/get_tasks/get_sprints와 동일하다.
+    summary는 get_project_summary와 같은 키를 가진다.
+    data_version은 같은 트랜잭션에서 읽은 프로젝트 데이터 버전이다 (get_project_version).
+    calendar는 프로젝트 업무 달력 이름이다 (None이면 기본 달력).
+    """
+    project_id: int
+    team_members: Tuple[Mapping[str, Any], ...] = ()
+    tasks: Tuple[Mapping[str, Any], ...] = ()
+    sprints: Tuple[Mapping[str, Any], ...] = ()
+    summary: Mapping[str, Any] = None
+    data_version: Optional[int] = None
+    calendar: Optional[str] = None
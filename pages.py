@@ -2,7 +2,7 @@
 
 import streamlit as st
 from components import (
-    TeamMemberForm, TeamMemberList, TaskForm, TaskList,
+    TeamMemberForm, TeamMemberList, TaskForm, TaskList, TaskImport,
     SimulationRunner, SimulationResults, SimulationAnalysis, SimulationVisualization, SimulationExport,
     SprintForm, SprintList, SprintTaskDistribution,
     DemoGuide, FeatureHighlight, TaskDistributionSimulator
@@ -74,6 +74,7 @@ def render_project_main_page():
             TaskForm.render()
         
         st.markdown("---")
+        TaskImport.render()
         TaskList.render()
     
     with tab3:
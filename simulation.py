@@ -1,12 +1,22 @@
 # simulation.py - H5 시뮬레이션 로직
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta, date
+import hashlib
+import json
 import math
 import random
-from database import get_team_members, get_tasks, get_sprints
-from utils.calendar_utils import KoreanHolidayCalendar, WorkdayCalculator
+import time
+from config import SIMULATION_CONFIG
+import database
+from database import (
+    load_project_snapshot, get_project_calendar, read_cache,
+    save_simulation_run, get_simulation_run, find_simulation_run, prune_simulation_runs
+)
+from models import ProjectSnapshot
+from utils.calendar_providers import CalendarProvider, KOREAN_CALENDAR, fallback_calendar, find_calendar, get_calendar
+from utils.simulation_cache import SimulationCache
 
 @dataclass
 class TaskAssignment:
@@ -23,6 +33,7 @@ class TaskAssignment:
     sprint_name: str = ""
     build_type: str = ""
     story_points: int = 1  # 스토리 포인트
+    assignee_id: Optional[int] = None  # 담당 팀원 ID
     
 @dataclass
 class TeamMemberWorkload:
@@ -57,35 +68,154 @@ class SimulationResult:
     estimated_completion_days: int
     round_robin_assignments: List[TaskAssignment]
     created_at: datetime
+    fingerprint: str = ""                               # 입력 데이터 지문 (compute_input_fingerprint)
+    parameters: Dict = field(default_factory=dict)      # 알고리즘 파라미터
+    duration_ms: float = 0.0                            # 시뮬레이션 소요 시간
+    run_id: Optional[int] = None                        # 저장된 실행 ID (simulation_runs)
+
+# 입력 지문 계산에 포함하는 필드 (RoundRobinSimulator가 읽는 값만)
+FINGERPRINT_FIELDS = {
+    "team_members": ("id", "name", "role", "available_hours_per_day"),
+    "tasks": ("id", "build_type", "priority", "item_name", "assignee_id", "final_hours", "story_points_leader"),
+    "sprints": ("name", "start_date", "end_date"),
+}
+
+def get_simulation_parameters(calendar: Optional[CalendarProvider] = None) -> Dict:
+    """현재 알고리즘 파라미터 (업무 달력 포함)"""
+    parameters = {
+        "algorithm": SIMULATION_CONFIG["algorithm"],
+        "algorithm_version": SIMULATION_CONFIG["algorithm_version"],
+    }
+    # 달력 키에는 파일 내용 해시가 들어 있어 휴무일 파일이 바뀌면 지문도 바뀐다
+    # (기본 달력은 넣지 않아 기존 실행 이력의 지문과 그대로 호환)
+    if calendar is not None and calendar.key != KOREAN_CALENDAR.key:
+        parameters["calendar"] = calendar.key
+    return parameters
+
+def resolve_project_calendar(project_id: int, snapshot: Optional[ProjectSnapshot] = None) -> CalendarProvider:
+    """프로젝트가 일정 계산에 쓰는 업무 달력
+    
+    달력 파일이 지워졌거나 읽을 수 없으면 오류 대신 대한민국 공휴일 달력을 돌려주고,
+    그 이유는 fallback_warning에 담는다 (화면에서 경고로 표시).
+    """
+    try:
+        return get_calendar(snapshot.calendar if snapshot is not None else get_project_calendar(project_id))
+    except (ValueError, OSError) as e:
+        return fallback_calendar(str(e))
+
+def resolve_result_calendar(result: "SimulationResult") -> CalendarProvider:
+    """결과의 일정을 계산할 때 쓴 업무 달력 (저장된 실행을 그 뒤에 바뀐 프로젝트 달력으로 그리지 않도록)
+    
+    달력 키가 없으면 기본 달력이고, 그 달력을 더 찾을 수 없으면 대한민국 공휴일 달력을 돌려준다.
+    """
+    try:
+        return find_calendar(result.parameters.get("calendar", KOREAN_CALENDAR.key))
+    except (ValueError, OSError) as e:
+        return fallback_calendar(str(e))
+
+# 프로젝트 ID → (데이터 버전, 날짜, 파라미터, 지문): 버전이 같으면 행을 다시 해시하지 않는다
+_version_fingerprints: Dict[int, Tuple] = {}
+
+def _version_key(data_version: Optional[int], parameters: Dict) -> Optional[Tuple]:
+    """버전 기반 지문 재사용 키 (버전을 모르면 None)"""
+    if data_version is None:
+        return None
+    return (id(database.db), database.db.epoch, data_version, date.today().isoformat(), json.dumps(parameters, sort_keys=True))
+
+def compute_input_fingerprint(snapshot: ProjectSnapshot, parameters: Optional[Dict] = None) -> str:
+    """시뮬레이션 입력 지문 (지문이 같으면 시뮬레이션 결과도 같다)"""
+    parameters = parameters or get_simulation_parameters(resolve_project_calendar(snapshot.project_id, snapshot))
+    version_key = _version_key(snapshot.data_version, parameters)
+    memo = _version_fingerprints.get(snapshot.project_id)
+    if version_key is not None and memo is not None and memo[0] == version_key:
+        return memo[1]
+    
+    payload = {
+        key: [[row.get(name) for name in fields] for row in getattr(snapshot, key)]
+        for key, fields in FINGERPRINT_FIELDS.items()
+    }
+    payload["parameters"] = parameters
+    
+    # 시작일이 없는 스프린트 그룹은 오늘 날짜를 기준으로 일정이 계산되므로 날짜도 입력에 포함
+    sprint_starts = {}
+    for sprint in snapshot.sprints:
+        sprint_starts.setdefault(sprint['name'], sprint.get('start_date'))
+    if any(not sprint_starts.get(task.get('build_type') or '미분류') for task in snapshot.tasks):
+        payload["today"] = date.today().isoformat()
+    
+    encoded = json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str)
+    fingerprint = hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+    if version_key is not None:
+        _version_fingerprints[snapshot.project_id] = (version_key, fingerprint)
+    return fingerprint
+
+def _build_team_workloads(members: List[Dict], assignments: List[TaskAssignment]) -> List[TeamMemberWorkload]:
+    """팀원별 업무량 계산 (팀원 목록 순서 유지)"""
+    workloads = []
+    
+    # 팀원 ID별 할당 목록 (할당 순서 유지)
+    assignments_by_member = {}
+    for assignment in assignments:
+        assignments_by_member.setdefault(assignment.assignee_id, []).append(assignment)
+    
+    for member in members:
+        # 해당 팀원에게 할당된 업무들
+        member_assignments = assignments_by_member.get(member['id'], [])
+        
+        # 총 할당 시간
+        total_hours = sum(a.estimated_hours for a in member_assignments)
+        
+        # 예상 소요 일수 (연속적이지 않을 수 있으므로 마지막 업무의 종료일로 계산)
+        estimated_days = max([a.end_day for a in member_assignments]) if member_assignments else 0
+        
+        # 활용률 계산 (할당된 총 시간 / (일일 가용시간 × 예상일수))
+        if estimated_days > 0:
+            max_possible_hours = member['available_hours_per_day'] * estimated_days
+            utilization_rate = (total_hours / max_possible_hours) * 100
+        else:
+            utilization_rate = 0.0
+        
+        workload = TeamMemberWorkload(
+            member_id=member['id'],
+            member_name=member['name'],
+            role=member['role'],
+            daily_capacity=member['available_hours_per_day'],
+            total_assigned_hours=total_hours,
+            assigned_tasks=member_assignments,
+            utilization_rate=round(utilization_rate, 1),
+            estimated_days=estimated_days
+        )
+        
+        workloads.append(workload)
+    
+    return workloads
 
 class RoundRobinSimulator:
     """Round Robin 알고리즘 기반 업무 분배 시뮬레이터"""
     
-    def __init__(self, project_id: int):
+    def __init__(self, project_id: int, snapshot: Optional[ProjectSnapshot] = None,
+                 calendar: Optional[CalendarProvider] = None):
         self.project_id = project_id
-        self.all_team_members = get_team_members(project_id)
-        self.tasks = get_tasks(project_id)
-        self.sprints = get_sprints(project_id)
+        # 스냅샷이 주어지면 재조회 없이 그대로 사용 (검증기/요약 위젯과 동일 데이터 공유)
+        self.snapshot = snapshot if snapshot is not None else load_project_snapshot(project_id)
+        self.calendar = calendar if calendar is not None else resolve_project_calendar(project_id, self.snapshot)
+        self.all_team_members = list(self.snapshot.team_members)
+        self.tasks = list(self.snapshot.tasks)
+        self.sprints = list(self.snapshot.sprints)
+        
+        # 이름이 같은 스프린트가 있으면 먼저 조회된 것을 사용 (기존 순차 탐색과 동일)
+        self.sprints_by_name = {}
+        for sprint in self.sprints:
+            self.sprints_by_name.setdefault(sprint['name'], sprint)
         
         # 실제 업무가 할당된 팀원들만 추출
         self.team_members = self._get_assigned_team_members()
+        self.members_by_id = {member['id']: member for member in self.team_members}
     
     def _get_assigned_team_members(self) -> List[Dict]:
-        """업무에 실제로 할당된 팀원들만 반환"""
-        # 업무에서 사용된 담당자 이름들 추출
-        assigned_names = set()
-        for task in self.tasks:
-            assignee = task.get('assignee', '').strip()
-            if assignee and assignee != '미지정':
-                assigned_names.add(assignee)
-        
-        # 해당 이름의 팀원들만 필터링
-        assigned_members = []
-        for member in self.all_team_members:
-            if member['name'] in assigned_names:
-                assigned_members.append(member)
-        
-        return assigned_members
+        """업무에 실제로 할당된 팀원들만 반환 (tasks.assignee_id 기준)"""
+        assigned_ids = {task.get('assignee_id') for task in self.tasks}
+        return [member for member in self.all_team_members if member['id'] in assigned_ids]
     
     def simulate(self) -> SimulationResult:
         """메인 시뮬레이션 실행"""
@@ -112,7 +242,7 @@ class RoundRobinSimulator:
             all_assignments.extend(sprint_assignments)
             
             # 스프린트별 워크로드 계산
-            sprint_info = next((s for s in self.sprints if s['name'] == sprint_name), None)
+            sprint_info = self.sprints_by_name.get(sprint_name)
             sprint_workload = SprintWorkload(
                 sprint_name=sprint_name,
                 sprint_start_date=sprint_info['start_date'] if sprint_info else "",
@@ -173,22 +303,10 @@ class RoundRobinSimulator:
         
         for task_idx, task in enumerate(sorted_tasks):
             # 기존 담당자가 있는지 확인
-            task_assignee = task.get('assignee', '').strip()
+            current_member = self.members_by_id.get(task.get('assignee_id'))
             
-            if task_assignee and task_assignee != '미지정':
-                # 기존 담당자 찾기
-                current_member = None
-                for member in self.team_members:
-                    if member['name'] == task_assignee:
-                        current_member = member
-                        break
-                
-                if not current_member:
-                    # 담당자가 팀원 목록에 없으면 Round Robin으로 fallback
-                    current_member = self.team_members[member_index % len(self.team_members)]
-                    member_index += 1
-            else:
-                # 담당자가 없으면 Round Robin 방식으로 선택
+            if not current_member:
+                # 담당자가 없거나 팀원 목록에 없으면 Round Robin 방식으로 선택
                 current_member = self.team_members[member_index % len(self.team_members)]
                 member_index += 1
             
@@ -207,6 +325,7 @@ class RoundRobinSimulator:
                 task_id=task['id'],
                 task_name=task['item_name'],
                 assignee_name=current_member['name'],
+                assignee_id=current_member['id'],
                 estimated_hours=task_hours,
                 priority=task['priority'],
                 start_day=start_day,
@@ -231,44 +350,12 @@ class RoundRobinSimulator:
     
     def _calculate_team_workloads(self, assignments: List[TaskAssignment]) -> List[TeamMemberWorkload]:
         """팀원별 업무량 계산"""
-        workloads = []
-        
-        for member in self.team_members:
-            # 해당 팀원에게 할당된 업무들
-            member_assignments = [a for a in assignments if a.assignee_name == member['name']]
-            
-            # 총 할당 시간
-            total_hours = sum(a.estimated_hours for a in member_assignments)
-            
-            # 예상 소요 일수 (연속적이지 않을 수 있으므로 마지막 업무의 종료일로 계산)
-            estimated_days = max([a.end_day for a in member_assignments]) if member_assignments else 0
-            
-            # 활용률 계산 (할당된 총 시간 / (일일 가용시간 × 예상일수))
-            if estimated_days > 0:
-                max_possible_hours = member['available_hours_per_day'] * estimated_days
-                utilization_rate = (total_hours / max_possible_hours) * 100
-            else:
-                utilization_rate = 0.0
-            
-            workload = TeamMemberWorkload(
-                member_id=member['id'],
-                member_name=member['name'],
-                role=member['role'],
-                daily_capacity=member['available_hours_per_day'],
-                total_assigned_hours=total_hours,
-                assigned_tasks=member_assignments,
-                utilization_rate=round(utilization_rate, 1),
-                estimated_days=estimated_days
-            )
-            
-            workloads.append(workload)
-        
-        return workloads
+        return _build_team_workloads(self.team_members, assignments)
     
     def _calculate_real_dates(self, assignments: List[TaskAssignment], sprint_name: str) -> List[TaskAssignment]:
-        """일차를 실제 날짜로 변환 (업무일 기준, 주말/공휴일 제외)"""
+        """일차를 실제 날짜로 변환 (업무일 기준, 주말/공휴일/회사 휴무일 제외)"""
         # 해당 스프린트 정보 찾기
-        sprint_info = next((s for s in self.sprints if s['name'] == sprint_name), None)
+        sprint_info = self.sprints_by_name.get(sprint_name)
         
         if not sprint_info or not sprint_info.get('start_date'):
             # 스프린트 정보가 없으면 오늘부터 시작
@@ -281,34 +368,24 @@ class RoundRobinSimulator:
                 base_date = date.today()
         
         # 스프린트 시작일을 첫 번째 업무일로 조정
-        sprint_start_workday = KoreanHolidayCalendar.get_next_workday(base_date)
+        sprint_start_workday = self.calendar.get_next_workday(base_date)
         
-        # Round Robin 순서를 반영한 팀원별 시작일 계산
-        member_current_workday = {}
+        # 일차 → 실제 날짜 변환을 할당 전체에 한 번에 적용 (업무일 기준)
+        # 시작일: 스프린트 첫 업무일에서 (start_day - 1) 업무일 뒤 (start_day는 1부터 시작)
+        # 종료일: 시작일에서 업무 소요 일수(end_day - start_day, 0이면 당일 완료)만큼 뒤
+        start_dates = self.calendar.add_workdays_batch(
+            sprint_start_workday, [assignment.start_day - 1 for assignment in assignments]
+        )
+        end_dates = self.calendar.add_workdays_batch(
+            start_dates, [assignment.end_day - assignment.start_day for assignment in assignments]
+        )
         
-        # 팀원 목록을 Round Robin 순서대로 정렬
-        team_member_names = [member['name'] for member in self.team_members]
-        
-        # 각 할당에 실제 날짜 계산 (일차를 실제 날짜로 변환)
-        for assignment in assignments:
-            # 시작일차를 실제 날짜로 변환 (업무일 기준)
-            task_start_date = KoreanHolidayCalendar.add_workdays(
-                sprint_start_workday, 
-                assignment.start_day - 1  # start_day는 1부터 시작하므로
-            )
-            
-            # 업무 소요 일수 계산
-            task_duration_days = assignment.end_day - assignment.start_day  # 0이면 당일, 1이면 2일
-            
-            # 종료일은 시작일에서 업무 소요 일수만큼 더함 (업무일 기준)
-            if task_duration_days > 0:
-                task_end_date = KoreanHolidayCalendar.add_workdays(task_start_date, task_duration_days)
-            else:
-                task_end_date = task_start_date  # 당일 완료
-            
-            # 할당 정보 업데이트
-            assignment.start_date = task_start_date.strftime('%Y-%m-%d')
-            assignment.end_date = task_end_date.strftime('%Y-%m-%d')
+        # 할당 정보 업데이트 (datetime64[D]의 문자열 표현은 YYYY-MM-DD)
+        for assignment, task_start_date, task_end_date in zip(
+            assignments, start_dates.astype(str).tolist(), end_dates.astype(str).tolist()
+        ):
+            assignment.start_date = task_start_date
+            assignment.end_date = task_end_date
         
         return assignments
     
@@ -321,10 +398,175 @@ class RoundRobinSimulator:
         max_days = max(workload.estimated_days for workload in team_workloads)
         return max_days
 
-def run_simulation(project_id: int) -> SimulationResult:
-    """시뮬레이션 실행 (외부 인터페이스)"""
-    simulator = RoundRobinSimulator(project_id)
-    return simulator.simulate()
+# 프로세스 단위 결과 캐시 (모든 세션이 공유, 키: 프로젝트 ID + 입력 지문)
+simulation_cache = SimulationCache(
+    max_entries=SIMULATION_CONFIG["cache_max_entries"],
+    max_weight=SIMULATION_CONFIG["cache_max_assignments"],
+    persist_dir=SIMULATION_CONFIG["cache_dir"]
+)
+
+def run_simulation(project_id: int, snapshot: Optional[ProjectSnapshot] = None, use_cache: bool = True) -> SimulationResult:
+    """시뮬레이션 실행 (외부 인터페이스)
+
+    입력 지문이 같은 결과가 캐시에 있으면 다시 계산하지 않고 그대로 반환한다.
+    스냅샷 없이 호출하면 데이터 버전과 업무 달력만 조회해 캐시를 먼저 확인한다.
+    캐시된 결과는 여러 세션이 공유하므로 읽기 전용으로 다룬다.
+    """
+    # 스크립트처럼 요청 범위 밖에서 불려도 프로젝트 버전 확인은 실행 전체에서 한 번만 한다
+    with read_cache.request_scope():
+        calendar = resolve_project_calendar(project_id, snapshot)
+        parameters = get_simulation_parameters(calendar)
+        if snapshot is None and use_cache:
+            memo = _version_fingerprints.get(project_id)
+            version_key = _version_key(read_cache.project_version(project_id), parameters)
+            if version_key is not None and memo is not None and memo[0] == version_key:
+                cached = simulation_cache.get(f"{project_id}:{memo[1]}")
+                if cached is not None:
+                    return cached
+        
+        snapshot = snapshot if snapshot is not None else load_project_snapshot(project_id)
+        fingerprint = compute_input_fingerprint(snapshot, parameters)
+        cache_key = f"{project_id}:{fingerprint}"
+        
+        if use_cache:
+            cached = simulation_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        simulator = RoundRobinSimulator(project_id, snapshot=snapshot, calendar=calendar)
+        started = time.perf_counter()
+        result = simulator.simulate()
+        result.duration_ms = (time.perf_counter() - started) * 1000
+        result.parameters = parameters
+        result.fingerprint = fingerprint
+        
+        simulation_cache.put(cache_key, result, weight=max(1, len(result.round_robin_assignments)))
+        return result
+
+# (프로젝트 ID, 입력 지문) → (결과 생성 시각, 실행 ID): 캐시된 같은 결과를 다시 저장하지 않기 위한 기록
+_saved_runs: Dict[Tuple[int, str], Tuple[datetime, int]] = {}
+
+def save_simulation_result(result: SimulationResult, keep: Optional[int] = None) -> int:
+    """시뮬레이션 결과를 실행 이력에 저장하고 오래된 이력 정리 (실행 ID 반환)
+
+    캐시에서 돌려받은 결과처럼 이미 저장된 최신 실행이면 새로 저장하지 않는다.
+    result는 캐시가 공유하는 객체일 수 있어 수정하지 않는다 (실행 ID는 반환값으로만 전달).
+    """
+    saved_key = (result.project_id, result.fingerprint)
+    saved_run_id = result.run_id
+    if saved_run_id is None:
+        saved = _saved_runs.get(saved_key)
+        saved_run_id = saved[1] if saved is not None and saved[0] == result.created_at else None
+    if saved_run_id is not None and find_simulation_run(result.project_id, result.fingerprint) == saved_run_id:
+        return saved_run_id
+    
+    members = [
+        {"id": w.member_id, "name": w.member_name, "role": w.role, "available_hours_per_day": w.daily_capacity}
+        for w in result.team_workloads
+    ]
+    sprints = []
+    assignments = []
+    for sprint_index, sprint in enumerate(result.sprint_workloads):
+        sprints.append({
+            "name": sprint.sprint_name,
+            "start_date": sprint.sprint_start_date,
+            "end_date": sprint.sprint_end_date,
+            "build_type": sprint.assignments[0].build_type if sprint.assignments else sprint.sprint_name,
+        })
+        for a in sprint.assignments:
+            assignments.append({
+                "task_id": a.task_id, "member_id": a.assignee_id, "sprint_index": sprint_index,
+                "task_name": a.task_name, "priority": a.priority, "estimated_hours": a.estimated_hours,
+                "story_points": a.story_points, "start_day": a.start_day, "end_day": a.end_day,
+                "start_date": a.start_date, "end_date": a.end_date,
+            })
+    
+    summary = {
+        "total_tasks": result.total_tasks,
+        "total_estimated_hours": result.total_estimated_hours,
+        "estimated_completion_days": result.estimated_completion_days,
+        "duration_ms": result.duration_ms,
+        "created_at": result.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    run_id = save_simulation_run(
+        result.project_id, result.fingerprint, result.parameters, members, sprints, summary, assignments
+    )
+    prune_simulation_runs(result.project_id, keep if keep is not None else SIMULATION_CONFIG["history_limit"])
+    
+    _saved_runs[saved_key] = (result.created_at, run_id)
+    return run_id
+
+def load_simulation_result(run_id: int) -> Optional[SimulationResult]:
+    """저장된 실행을 SimulationResult로 복원 (재시뮬레이션 없이 조회만)"""
+    run = get_simulation_run(run_id)
+    if not run:
+        return None
+    
+    member_names = {member['id']: member['name'] for member in run['members']}
+    sprint_workloads = [
+        SprintWorkload(
+            sprint_name=sprint['name'],
+            sprint_start_date=sprint['start_date'],
+            sprint_end_date=sprint['end_date'],
+            total_tasks=0,
+            total_hours=0.0,
+            assignments=[]
+        )
+        for sprint in run['sprints']
+    ]
+    
+    all_assignments = []
+    for row in run['assignments']:
+        sprint = run['sprints'][row['sprint_index']]
+        assignment = TaskAssignment(
+            task_id=row['task_id'],
+            task_name=row['task_name'],
+            assignee_name=member_names.get(row['member_id'], ""),
+            estimated_hours=row['estimated_hours'],
+            priority=row['priority'],
+            start_day=row['start_day'],
+            end_day=row['end_day'],
+            start_date=row['start_date'],
+            end_date=row['end_date'],
+            sprint_name=sprint['name'],
+            build_type=sprint['build_type'],
+            story_points=row['story_points'],
+            assignee_id=row['member_id']
+        )
+        sprint_workloads[row['sprint_index']].assignments.append(assignment)
+        all_assignments.append(assignment)
+    
+    for sprint_workload in sprint_workloads:
+        sprint_workload.total_tasks = len(sprint_workload.assignments)
+        sprint_workload.total_hours = sum(a.estimated_hours for a in sprint_workload.assignments)
+    
+    return SimulationResult(
+        project_id=run['project_id'],
+        total_tasks=run['total_tasks'],
+        total_estimated_hours=run['total_estimated_hours'],
+        team_workloads=_build_team_workloads(run['members'], all_assignments),
+        sprint_workloads=sprint_workloads,
+        estimated_completion_days=run['estimated_completion_days'],
+        round_robin_assignments=all_assignments,
+        created_at=datetime.strptime(run['created_at'], "%Y-%m-%d %H:%M:%S"),
+        fingerprint=run['fingerprint'],
+        parameters=run['parameters'],
+        duration_ms=run['duration_ms'],
+        run_id=run['id']
+    )
+
+def load_latest_simulation_result(project_id: int, fingerprint: str) -> Optional[SimulationResult]:
+    """같은 입력 지문의 결과 (캐시 → 저장된 가장 최근 실행 순, 없으면 None)"""
+    cache_key = f"{project_id}:{fingerprint}"
+    cached = simulation_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    run_id = find_simulation_run(project_id, fingerprint)
+    result = load_simulation_result(run_id) if run_id else None
+    if result is not None:
+        simulation_cache.put(cache_key, result, weight=max(1, len(result.round_robin_assignments)))
+    return result
 
 def get_simulation_summary(result: SimulationResult) -> Dict:
     """시뮬레이션 결과 요약"""
@@ -1,6 +1,6 @@
 # test_simulation_data.py - 시뮬레이션 테스트용 풍부한 더미 데이터
 
-from database import create_project, add_team_member, add_task, add_sprint
+from database import create_project, add_team_members_bulk, add_tasks_bulk, add_sprints_bulk
 from datetime import date, timedelta
 
 def create_comprehensive_test_project():
@@ -22,13 +22,10 @@ def create_comprehensive_test_project():
             {"name": "최QA", "role": "QA 엔지니어", "hours": 7.0}
         ]
         
-        for member in team_members:
-            add_team_member(
-                project_id=project_id,
-                name=member["name"],
-                role=member["role"],
-                available_hours_per_day=member["hours"]
-            )
+        add_team_members_bulk(project_id, [
+            {"name": member["name"], "role": member["role"], "available_hours_per_day": member["hours"]}
+            for member in team_members
+        ])
         print(f"Team members created: {len(team_members)}")
         
         # 3. 스프린트 생성 (3개 스프린트, 실제 날짜)
@@ -54,14 +51,7 @@ def create_comprehensive_test_project():
             }
         ]
         
-        for sprint in sprints:
-            add_sprint(
-                project_id=project_id,
-                name=sprint["name"],
-                description=sprint["description"],
-                start_date=sprint["start_date"],
-                end_date=sprint["end_date"]
-            )
+        add_sprints_bulk(project_id, sprints)
         print(f"Sprints created: {len(sprints)}")
         
         # 4. 다양한 우선순위와 시간의 업무 생성 (15개)
@@ -163,23 +153,10 @@ def create_comprehensive_test_project():
             }
         ]
         
-        for task in tasks:
-            add_task(
-                project_id=project_id,
-                attribute=task["attribute"],
-                build_type=task["build_type"],
-                part_division=task["part_division"],
-                priority=task["priority"],
-                item_name=task["item_name"],
-                content=task["content"],
-                assignee=task["assignee"],
-                story_points_leader=task["story_points_leader"],
-                duration_leader=task["duration_leader"], 
-                duration_assignee=0.0,
-                final_hours=task["final_hours"],
-                ai_judgment="자동생성",
-                connectivity=""
-            )
+        add_tasks_bulk(project_id, [
+            {**task, "duration_assignee": 0.0, "ai_judgment": "자동생성", "connectivity": ""}
+            for task in tasks
+        ])
         
         print(f"Tasks created: {len(tasks)}")
         
@@ -4,8 +4,12 @@ from .validation import (
     FormValidator, DataValidator, ErrorHandler, ValidationError,
     validate_form_input, is_valid_email, is_valid_phone, sanitize_filename
 )
+from .task_importer import TaskImporter, ImportReport, ImportIssue, import_tasks
+from .simulation_cache import SimulationCache
 
 __all__ = [
     'FormValidator', 'DataValidator', 'ErrorHandler', 'ValidationError',
-    'validate_form_input', 'is_valid_email', 'is_valid_phone', 'sanitize_filename'
+    'validate_form_input', 'is_valid_email', 'is_valid_phone', 'sanitize_filename',
+    'TaskImporter', 'ImportReport', 'ImportIssue', 'import_tasks',
+    'SimulationCache'
 ]
\ No newline at end of file
@@ -0,0 +1,458 @@
+# utils/calendar_providers.py - 프로젝트별 업무일 달력 공급자 (대한민국 공휴일, ICS/CSV 파일)
+
+import csv
+import functools
+import hashlib
+import io
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+from config import CALENDAR_CONFIG
+from .calendar_utils import KoreanHolidayCalendar, WorkdayIndex
+
+class CalendarProvider(ABC):
+    """업무일 달력 공급자 기반 클래스
+    
+    하위 클래스는 key와 holidays_for_year만 정하면 되고, 업무일 계산은 공휴일 표로 만든 WorkdayIndex가 맡는다.
+    메서드 이름은 KoreanHolidayCalendar와 같아 호출부에서 그대로 바꿔 쓸 수 있다.
+    """
+    
+    key = ""                 # 달력 식별자 (시뮬레이션 입력 지문에 포함, 내용이 바뀌면 달라진다)
+    warnings: Tuple[str, ...] = ()
+    fallback_warning = ""    # 설정한 달력을 쓸 수 없어 대신 쓰는 달력이면 그 이유
+    
+    @abstractmethod
+    def holidays_for_year(self, year: int) -> Mapping[str, str]:
+        """연도별 휴일 {YYYY-MM-DD: 이름}"""
+    
+    def workday_index(self) -> WorkdayIndex:
+        """이 달력의 업무일 색인 (처음 사용할 때 생성)"""
+        index = self.__dict__.get("_workday_index")
+        if index is None:
+            index = self._workday_index = WorkdayIndex(self.holidays_for_year)
+        return index
+    
+    def is_holiday(self, target_date: date) -> bool:
+        """휴일(공휴일·휴무일) 여부"""
+        return target_date.isoformat() in self.holidays_for_year(target_date.year)
+    
+    def get_holiday_name(self, target_date: date) -> str:
+        """휴일명 반환 (휴일이 아니면 빈 문자열)"""
+        return self.holidays_for_year(target_date.year).get(target_date.isoformat(), "")
+    
+    def is_weekend(self, target_date: date) -> bool:
+        """주말(토, 일) 확인"""
+        return target_date.weekday() >= 5
+    
+    def is_workday(self, target_date: date) -> bool:
+        """업무일인지 확인 (휴일, 주말 제외)"""
+        return self.workday_index().is_workday(target_date)
+    
+    def get_next_workday(self, start_date: date) -> date:
+        """다음 업무일 찾기 (당일이 업무일이면 당일)"""
+        return self.workday_index().next_workday(start_date)
+    
+    def add_workdays(self, start_date: date, workdays: int) -> date:
+        """업무일 기준으로 날짜 추가 (다음 날부터 센 workdays번째 업무일)"""
+        return self.workday_index().add_workdays(start_date, workdays)
+    
+    def calculate_workdays_between(self, start_date: date, end_date: date) -> int:
+        """두 날짜 사이의 업무일 수 계산 (양 끝 포함)"""
+        return self.workday_index().workdays_between(start_date, end_date)
+    
+    def add_workdays_batch(self, base_dates, offsets):
+        """add_workdays의 배열 버전 (datetime64[D] 배열 반환)"""
+        return self.workday_index().add_workdays_batch(base_dates, offsets)
+    
+    def workdays_between_batch(self, start_dates, end_dates):
+        """calculate_workdays_between의 배열 버전 (int64 배열 반환)"""
+        return self.workday_index().workdays_between_batch(start_dates, end_dates)
+    
+    def is_workday_batch(self, dates):
+        """is_workday의 배열 버전 (bool 배열 반환)"""
+        return self.workday_index().is_workday_batch(dates)
+    
+    def get_non_workdays_between(self, start_date: date, end_date: date) -> List[Tuple[date, str]]:
+        """기간 내 휴일·주말 [(날짜, 휴일명)] (휴일이 아닌 주말은 휴일명이 빈 문자열)"""
+        return [(day, self.get_holiday_name(day)) for day in self.workday_index().non_workdays_between(start_date, end_date)]
+    
+    def get_workday_segments(self, start_date: date, end_date: date) -> List[Tuple[date, date]]:
+        """기간 내 연속된 업무일 구간 [(시작, 끝)]"""
+        return self.workday_index().workday_segments(start_date, end_date)
+    
+    def get_non_workday_segments(self, start_date: date, end_date: date) -> List[Tuple[date, date]]:
+        """기간 내 연속된 휴일·주말 구간 [(시작, 끝)]"""
+        return self.workday_index().non_workday_segments(start_date, end_date)
+
+class KoreanCalendarProvider(CalendarProvider):
+    """대한민국 공휴일 달력 (KoreanHolidayCalendar와 업무일 색인을 공유)"""
+    
+    key = "korean"
+    
+    def holidays_for_year(self, year: int) -> Mapping[str, str]:
+        return KoreanHolidayCalendar.get_holidays_for_year(year)
+    
+    def workday_index(self) -> WorkdayIndex:
+        return KoreanHolidayCalendar.workday_index()
+    
+    def is_holiday(self, target_date: date) -> bool:
+        return KoreanHolidayCalendar.is_holiday(target_date)
+
+class FileCalendarProvider(CalendarProvider):
+    """ICS/CSV 파일에서 읽은 휴일·휴무일 달력
+    
+    파일 내용 해시별로 한 번만 컴파일해 공유하는 불변 객체다. 파일에 있는 연도 범위의 업무일 색인은
+    컴파일할 때 미리 만들어 두므로, 회사 휴무일이 있어도 조회 비용은 기본 달력과 같다.
+    """
+    
+    def __init__(self, key: str, days: Dict[date, str], warnings: List[str] = (),
+                 base: Optional[CalendarProvider] = None):
+        self.content_key = key                # 형식:파일 내용 해시
+        self.key = key if base is None else f"{base.key}+{key}"
+        self.warnings = tuple(warnings)
+        self.day_count = len(days)
+        self._base = base
+        
+        by_year: Dict[int, Dict[str, str]] = {}
+        for day in sorted(days):
+            by_year.setdefault(day.year, {})[day.isoformat()] = days[day]
+        self._by_year = {year: MappingProxyType(holidays) for year, holidays in by_year.items()}
+        self._merged = functools.lru_cache(maxsize=None)(self._merge_year)
+        
+        # 색인은 올해 전후 recurrence_years년 안의 파일 연도만 미리 만들고, 그 밖은 조회할 때 넓힌다
+        if by_year:
+            span = CALENDAR_CONFIG["recurrence_years"]
+            this_year = date.today().year
+            first_year = max(min(by_year), this_year - span)
+            last_year = min(max(by_year), this_year + span)
+            if first_year <= last_year:
+                self.workday_index().prepare(first_year, last_year)
+    
+    def _merge_year(self, year: int) -> Mapping[str, str]:
+        """기본 달력의 공휴일과 파일의 휴일을 합친 표 (같은 날이면 이름을 함께 표시)"""
+        own = self._by_year.get(year, MappingProxyType({}))
+        if self._base is None:
+            return own
+        merged = dict(self._base.holidays_for_year(year))
+        for date_str, name in own.items():
+            existing = merged.get(date_str)
+            merged[date_str] = name if not existing or existing == name else f"{existing}, {name}"
+        return MappingProxyType(dict(sorted(merged.items())))
+    
+    def holidays_for_year(self, year: int) -> Mapping[str, str]:
+        return self._merged(year)
+
+# ---------------------------------------------------------------------------
+# 파일 형식별 파서: bytes → ({날짜: 이름}, 경고 목록)
+# ---------------------------------------------------------------------------
+
+DEFAULT_OFF_DAY_NAME = "휴무일"
+
+def _add_day(days: Dict[date, str], day: date, name: str):
+    """같은 날짜에 일정이 여러 개면 이름을 이어 붙인다"""
+    existing = days.get(day)
+    days[day] = name if not existing or name in existing.split(", ") else f"{existing}, {name}"
+
+def _decode(content: bytes) -> str:
+    """텍스트 디코딩 (UTF-8 우선, 실패 시 CP949)"""
+    try:
+        return content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return content.decode("cp949", errors="replace")
+
+def _parse_ics_date(value: str) -> Tuple[date, bool]:
+    """ICS 날짜/시각 값 → (날짜, 시각 포함 여부) (시각이 있으면 그 날짜를 그대로 사용)"""
+    value = value.strip()
+    return date(int(value[:4]), int(value[4:6]), int(value[6:8])), value[9:15].strip("0") != ""
+
+def _unescape_ics_text(value: str) -> str:
+    """ICS TEXT 이스케이프 해제 (\\n은 공백으로)"""
+    return re.sub(r"\\(.)", lambda m: " " if m.group(1) in "nN" else m.group(1), value).strip()
+
+def _ics_event_days(event: Dict[str, Tuple[str, List[str]]]) -> Tuple[date, int]:
+    """VEVENT의 시작일과 일수 (종일 일정의 DTEND는 다음 날이라 포함하지 않는다)"""
+    start, _ = _parse_ics_date(event["DTSTART"][0])
+    if "DTEND" in event:
+        end, has_time = _parse_ics_date(event["DTEND"][0])
+        span = (end - start).days + (1 if has_time else 0)
+    elif "DURATION" in event:
+        match = re.fullmatch(r"P(?:(\d+)W)?(?:(\d+)D)?(?:T.*)?", event["DURATION"][0].strip())
+        span = int(match.group(1) or 0) * 7 + int(match.group(2) or 0) if match else 1
+    else:
+        span = 1
+    return start, max(span, 1)
+
+def _ics_recurrence(rule: str, start: date, warnings: List[str], name: str) -> List[date]:
+    """RRULE 전개 (매년 반복만 지원, 그 밖의 규칙은 첫 일정만 반영)
+    
+    COUNT/UNTIL이 있어도 시작 연도부터 recurrence_years년까지만 펼친다 (큰 값으로 색인이 커지지 않도록).
+    """
+    parts = dict(part.split("=", 1) for part in rule.split(";") if "=" in part)
+    if parts.get("FREQ") != "YEARLY":
+        warnings.append(f"'{name}': 반복 규칙(FREQ={parts.get('FREQ')})은 지원하지 않아 첫 일정만 반영했습니다.")
+        return [start]
+    
+    interval = int(parts.get("INTERVAL", 1))
+    count = int(parts["COUNT"]) if "COUNT" in parts else None
+    until = _parse_ics_date(parts["UNTIL"])[0] if "UNTIL" in parts else None
+    last_year = min(start.year + CALENDAR_CONFIG["recurrence_years"], date.max.year)
+    if until is not None:
+        last_year = min(last_year, until.year)
+    
+    occurrences = []
+    year = start.year
+    while year <= last_year and (count is None or len(occurrences) < count):
+        try:
+            occurrence = start.replace(year=year)
+        except ValueError:           # 2월 29일은 윤년에만
+            occurrence = None
+        if occurrence is not None:
+            if until is not None and occurrence > until:
+                break
+            occurrences.append(occurrence)
+        year += interval
+    
+    if year > last_year and ((count is not None and len(occurrences) < count) or (until is not None and until.year > last_year)):
+        warnings.append(f"'{name}': 반복 일정은 {last_year}년까지만 반영했습니다.")
+    return occurrences
+
+def parse_ics(content: bytes) -> Tuple[Dict[date, str], List[str]]:
+    """ICS(iCalendar) 파일의 VEVENT를 휴일로 읽기 (여러 날 일정은 모든 날짜, 취소된 일정은 제외)"""
+    # 줄 접기 해제 (RFC 5545: 줄바꿈 다음의 공백/탭은 앞 줄에 이어짐)
+    lines = re.sub(r"\r?\n[ \t]", "", _decode(content)).splitlines()
+    days: Dict[date, str] = {}
+    warnings: List[str] = []
+    event = None
+    
+    event_line = 0
+    for line_number, line in enumerate(lines, start=1):
+        if line.strip().upper() == "BEGIN:VEVENT":
+            event, excluded_values, event_line = {}, [], line_number
+        elif line.strip().upper() == "END:VEVENT" and event is not None:
+            name = _unescape_ics_text(event.get("SUMMARY", ("", []))[0]) or DEFAULT_OFF_DAY_NAME
+            try:
+                if event.get("STATUS", ("", []))[0].strip().upper() != "CANCELLED":
+                    start, span = _ics_event_days(event)
+                    starts = _ics_recurrence(event["RRULE"][0], start, warnings, name) if "RRULE" in event else [start]
+                    excluded = {_parse_ics_date(value)[0] for value in excluded_values}
+                    for occurrence in starts:
+                        if occurrence not in excluded:
+                            for offset in range(span):
+                                _add_day(days, occurrence + timedelta(days=offset), name)
+            except (KeyError, ValueError) as e:
+                warnings.append(f"{event_line}행 일정 '{name}'을 읽지 못했습니다: {e}")
+            event = None
+        elif event is not None and ":" in line:
+            head, value = line.split(":", 1)
+            prop, *params = head.split(";")
+            prop = prop.strip().upper()
+            if prop == "EXDATE":
+                excluded_values.extend(value.split(","))
+            else:
+                event[prop] = (value, params)
+    
+    return days, warnings
+
+# CSV 헤더 별칭 (헤더가 없으면 날짜, 이름, 종료일 순서로 읽는다)
+CSV_COLUMN_ALIASES = {
+    "date": ["날짜", "일자", "시작일", "date", "start_date", "start"],
+    "name": ["이름", "휴일명", "공휴일명", "휴무", "설명", "name", "summary", "description"],
+    "end_date": ["종료일", "end_date", "end"],
+}
+
+def _normalize_header(header) -> str:
+    """헤더 비교용 정규화 (공백 제거, 소문자)"""
+    return "".join(str(header).split()).lower()
+
+def _parse_csv_date(value: str) -> date:
+    """CSV 날짜 (YYYY-MM-DD, YYYY/MM/DD, YYYY.MM.DD, YYYYMMDD)"""
+    value = value.strip()
+    for fmt in ("%Y-%m-%d", "%Y/%m/%d", "%Y.%m.%d", "%Y%m%d"):
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f"날짜 형식이 아닙니다: '{value}'")
+
+def parse_csv(content: bytes) -> Tuple[Dict[date, str], List[str]]:
+    """CSV 파일의 날짜(또는 날짜~종료일)를 휴일로 읽기"""
+    rows = [row for row in csv.reader(io.StringIO(_decode(content))) if any(cell.strip() for cell in row)]
+    days: Dict[date, str] = {}
+    warnings: List[str] = []
+    if not rows:
+        return days, warnings
+    
+    alias_lookup = {_normalize_header(alias): field for field, aliases in CSV_COLUMN_ALIASES.items() for alias in aliases}
+    header = {alias_lookup.get(_normalize_header(cell)): i for i, cell in enumerate(rows[0])}
+    header.pop(None, None)
+    if "date" in header:
+        columns, body_start = header, 2
+        rows = rows[1:]
+    else:
+        columns, body_start = {"date": 0, "name": 1, "end_date": 2}, 1
+    
+    def cell(row: List[str], field: str) -> str:
+        index = columns.get(field)
+        return row[index].strip() if index is not None and index < len(row) else ""
+    
+    for row_number, row in enumerate(rows, start=body_start):
+        try:
+            start = _parse_csv_date(cell(row, "date"))
+            end = _parse_csv_date(cell(row, "end_date")) if cell(row, "end_date") else start
+        except ValueError as e:
+            warnings.append(f"{row_number}행: {e}")
+            continue
+        if end < start:
+            warnings.append(f"{row_number}행: 종료일이 시작일보다 빠릅니다.")
+            continue
+        for offset in range((end - start).days + 1):
+            _add_day(days, start + timedelta(days=offset), cell(row, "name") or DEFAULT_OFF_DAY_NAME)
+    
+    return days, warnings
+
+# 파일 확장자별 파서 (새 형식은 여기에 추가)
+CALENDAR_FORMATS: Dict[str, Callable[[bytes], Tuple[Dict[date, str], List[str]]]] = {
+    ".ics": parse_ics,
+    ".csv": parse_csv,
+}
+
+# ---------------------------------------------------------------------------
+# 달력 조회 (내장 달력 + 파일 달력, 파일은 내용 해시 기준으로 컴파일 결과 캐시)
+# ---------------------------------------------------------------------------
+
+KOREAN_CALENDAR = KoreanCalendarProvider()
+
+# 이름 → 내장 달력 (새 내장 달력은 여기에 추가)
+BUILTIN_CALENDARS: Dict[str, CalendarProvider] = {
+    "korean": KOREAN_CALENDAR,
+}
+
+CALENDAR_LABELS = {
+    "korean": "대한민국 공휴일",
+}
+
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_lock = threading.Lock()
+_file_digests: Dict[str, Tuple[int, int, str]] = {}      # 경로 → (mtime_ns, 크기, 캐시 키) - 바뀌지 않은 파일은 다시 해시하지 않음
+_compiled: "OrderedDict[str, FileCalendarProvider]" = OrderedDict()   # 형식:해시 → 컴파일된 달력 (LRU)
+
+def _calendar_dir() -> str:
+    """달력 폴더 경로 (상대 경로는 실행 위치가 아니라 앱 폴더 기준)"""
+    return os.path.join(_APP_DIR, CALENDAR_CONFIG["calendar_dir"])
+
+def _calendar_path(name: str) -> str:
+    """달력 파일 경로 (달력 폴더 안의 지원 형식 파일만 허용)"""
+    if os.path.basename(name) != name or os.path.splitext(name)[1].lower() not in CALENDAR_FORMATS:
+        raise ValueError(f"지원하지 않는 달력입니다: '{name}' (ICS/CSV 파일만 사용할 수 있습니다)")
+    return os.path.join(_calendar_dir(), name)
+
+def compile_calendar(suffix: str, content: bytes) -> FileCalendarProvider:
+    """파일 내용을 달력으로 컴파일 (같은 내용이면 캐시된 달력 반환)"""
+    digest = hashlib.sha256(content).hexdigest()
+    cache_key = f"{suffix.lstrip('.').lower()}:{digest[:16]}"
+    with _lock:
+        provider = _compiled.get(cache_key)
+        if provider is not None:
+            _compiled.move_to_end(cache_key)
+            return provider
+    
+    days, warnings = CALENDAR_FORMATS[suffix.lower()](content)
+    provider = FileCalendarProvider(
+        cache_key, days, warnings, base=KOREAN_CALENDAR if CALENDAR_CONFIG["extend_korean"] else None
+    )
+    with _lock:
+        provider = _compiled.setdefault(cache_key, provider)
+        _compiled.move_to_end(cache_key)
+        while len(_compiled) > CALENDAR_CONFIG["compiled_cache_size"]:
+            _compiled.popitem(last=False)
+    return provider
+
+def get_calendar(name: Optional[str] = None) -> CalendarProvider:
+    """이름으로 달력 조회 (None이면 기본 달력, 파일 달력은 파일이 바뀌었을 때만 다시 읽음)"""
+    name = name or CALENDAR_CONFIG["default"]
+    builtin = BUILTIN_CALENDARS.get(name)
+    if builtin is not None:
+        return builtin
+    
+    path = _calendar_path(name)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        raise ValueError(f"달력 파일을 찾을 수 없습니다: '{name}'") from None
+    
+    memo = _file_digests.get(path)
+    if memo is not None and memo[:2] == (stat.st_mtime_ns, stat.st_size):
+        with _lock:
+            provider = _compiled.get(memo[2])
+        if provider is not None:
+            return provider
+    
+    with open(path, "rb") as f:
+        content = f.read()
+    provider = compile_calendar(os.path.splitext(name)[1], content)
+    _file_digests[path] = (stat.st_mtime_ns, stat.st_size, provider.content_key)
+    return provider
+
+def find_calendar(key: str) -> CalendarProvider:
+    """달력 키로 조회 (저장된 실행의 parameters["calendar"], 그 내용의 달력이 더 없으면 ValueError)"""
+    for provider in BUILTIN_CALENDARS.values():
+        if provider.key == key:
+            return provider
+    
+    with _lock:
+        provider = _compiled.get(key.rsplit("+", 1)[-1])
+    if provider is not None and provider.key == key:
+        return provider
+    
+    # 컴파일 캐시에서 밀려났으면 달력 폴더의 파일 중 내용이 같은 것을 찾는다
+    for name in list_calendars():
+        if name in BUILTIN_CALENDARS:
+            continue
+        try:
+            provider = get_calendar(name)
+        except (ValueError, OSError):
+            continue
+        if provider.key == key:
+            return provider
+    raise ValueError(f"실행에 쓴 달력을 찾을 수 없습니다 (파일이 바뀌었거나 삭제됨): '{key}'")
+
+def fallback_calendar(reason: str) -> CalendarProvider:
+    """설정한 달력을 쓸 수 없을 때 대신 쓰는 대한민국 공휴일 달력 (업무일 색인은 기본 달력과 공유)"""
+    provider = KoreanCalendarProvider()
+    provider.fallback_warning = f"{reason} (대한민국 공휴일 달력으로 계산합니다)"
+    return provider
+
+def list_calendars() -> List[str]:
+    """선택 가능한 달력 이름 (내장 달력 + 달력 폴더의 ICS/CSV 파일)"""
+    directory = _calendar_dir()
+    files = sorted(
+        entry for entry in (os.listdir(directory) if os.path.isdir(directory) else [])
+        if os.path.splitext(entry)[1].lower() in CALENDAR_FORMATS
+    )
+    return list(BUILTIN_CALENDARS) + files
+
+def calendar_label(name: str) -> str:
+    """달력 표시 이름"""
+    if name in CALENDAR_LABELS:
+        return CALENDAR_LABELS[name]
+    return f"{name} (+ 대한민국 공휴일)" if CALENDAR_CONFIG["extend_korean"] else name
+
+def save_calendar_file(filename: str, content: bytes) -> str:
+    """업로드한 달력 파일을 검증해 달력 폴더에 저장 (저장된 달력 이름 반환)"""
+    name = os.path.basename(filename).strip()
+    path = _calendar_path(name)
+    provider = compile_calendar(os.path.splitext(name)[1], content)
+    if not provider.day_count:
+        raise ValueError("파일에서 휴일·휴무일을 찾지 못했습니다.")
+    
+    os.makedirs(_calendar_dir(), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(content)
+    return name
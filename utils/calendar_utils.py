@@ -1,79 +1,333 @@
 # utils/calendar_utils.py - 달력 및 공휴일 관리 유틸리티
 
+from bisect import bisect_left, bisect_right
 from datetime import datetime, date, timedelta
-from typing import List, Set
+from itertools import accumulate
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Set, Tuple
 import calendar
+import functools
+import threading
+
+from .lunar_calendar import lunar_to_solar
+
+class WorkdayIndex:
+    """연도 범위의 업무일 비트맵과 누적합 색인 (업무일 계산을 O(1) 조회로 대체)
+
+    days[i]는 origin + i일이 업무일이면 1, prefix[i]는 origin부터 i일 전까지의 업무일 수,
+    positions[k]는 k번째 업무일의 오프셋, off_days는 업무일이 아닌 날의 오프셋(정렬)이다.
+    범위를 벗어난 날짜가 오면 연도 단위로 넓혀 다시 만든다.
+    """
+    
+    def __init__(self, holidays_for_year: Callable[[int], dict], weekend_days: tuple = (5, 6)):
+        self._holidays_for_year = holidays_for_year
+        self._weekend_days = frozenset(weekend_days)
+        self._lock = threading.Lock()
+        self._state = None   # (first_year, last_year, origin, days, prefix, positions, off_days)
+        self._busday = None  # (색인 상태, np.busdaycalendar) - 배치 API용
+    
+    def _build(self, first_year: int, last_year: int) -> tuple:
+        """first_year~last_year 색인 생성 (공휴일은 해당 연도 표에 있는 날짜만 인정)"""
+        origin = date(first_year, 1, 1).toordinal()
+        end = date(last_year, 12, 31).toordinal() + 1
+        
+        holidays = set()
+        for year in range(first_year, last_year + 1):
+            for date_str in self._holidays_for_year(year):
+                holiday = date.fromisoformat(date_str)
+                if holiday.year == year:
+                    holidays.add(holiday.toordinal())
+        
+        first_weekday = date(first_year, 1, 1).weekday()
+        days = bytes(
+            0 if (first_weekday + i) % 7 in self._weekend_days or origin + i in holidays else 1
+            for i in range(end - origin)
+        )
+        prefix = [0, *accumulate(days)]
+        positions = [i for i, flag in enumerate(days) if flag]
+        off_days = [i for i, flag in enumerate(days) if not flag]
+        return first_year, last_year, origin, days, prefix, positions, off_days
+    
+    def _covering(self, first_year: int, last_year: int) -> tuple:
+        """first_year~last_year를 포함하는 색인 반환 (없으면 기존 범위와 합쳐 다시 생성)"""
+        state = self._state
+        if state is not None and state[0] <= first_year and last_year <= state[1]:
+            return state
+        
+        with self._lock:
+            state = self._state
+            if state is None:
+                first_year, last_year = first_year - 1, last_year + 1
+            elif state[0] <= first_year and last_year <= state[1]:
+                return state
+            else:
+                first_year, last_year = min(first_year, state[0]), max(last_year, state[1])
+            state = self._state = self._build(max(first_year, date.min.year), min(last_year, date.max.year))
+        return state
+    
+    def _nth_workday(self, state: tuple, k: int) -> date:
+        """색인 시작 이후 k번째(0부터) 업무일 (범위를 넘으면 뒤쪽 연도를 넓혀 찾음)"""
+        while k >= len(state[5]):
+            if state[1] >= date.max.year:
+                raise OverflowError("date value out of range")
+            # 한 해에 업무일이 최소 200일 이상이므로 부족한 만큼 연도를 넉넉히 넓힌다
+            wider = self._covering(state[0], state[1] + (k - len(state[5])) // 200 + 1)
+            if wider[2] != state[2]:
+                # 다른 스레드가 앞쪽 연도까지 넓혔으면 시작점이 바뀐 만큼 순번을 옮긴다
+                k += wider[4][state[2] - wider[2]]
+            state = wider
+        return date.fromordinal(state[2] + state[5][k])
+    
+    def prepare(self, first_year: int, last_year: int):
+        """first_year~last_year 색인을 미리 생성 (첫 조회에서 만드는 비용을 앞당김)"""
+        self._covering(first_year, last_year)
+    
+    def clear(self):
+        """색인 폐기 (공휴일 표가 바뀌었을 때)"""
+        with self._lock:
+            self._state = None
+            self._busday = None
+    
+    def _busday_calendar(self, state: tuple):
+        """색인 범위의 NumPy 영업일 달력 (주말 마스크 + 평일 공휴일 목록, 색인이 바뀔 때만 새로 생성)"""
+        import numpy as np
+        
+        cached = self._busday
+        if cached is not None and cached[0] is state:
+            return cached[1]
+        
+        flags = np.frombuffer(state[3], dtype=np.uint8)
+        offsets = np.flatnonzero(flags == 0)
+        weekdays = (date.fromordinal(state[2]).weekday() + offsets) % 7
+        offsets = offsets[~np.isin(weekdays, list(self._weekend_days))]
+        origin = np.datetime64(date.fromordinal(state[2]), "D")
+        busdaycal = np.busdaycalendar(
+            weekmask="".join("0" if day in self._weekend_days else "1" for day in range(7)),
+            holidays=origin + offsets
+        )
+        self._busday = (state, busdaycal)
+        return busdaycal
+    
+    def _covering_dates(self, days) -> tuple:
+        """datetime64[D] 배열의 연도 범위를 포함하는 색인"""
+        years = days.astype("datetime64[Y]").astype(int) + 1970
+        return self._covering(int(years.min()), int(years.max()))
+    
+    def is_workday(self, target_date: date) -> bool:
+        """업무일 여부"""
+        state = self._covering(target_date.year, target_date.year)
+        return bool(state[3][target_date.toordinal() - state[2]])
+    
+    def next_workday(self, start_date: date) -> date:
+        """start_date 이후(당일 포함) 첫 업무일"""
+        state = self._covering(start_date.year, start_date.year)
+        return self._nth_workday(state, state[4][start_date.toordinal() - state[2]])
+    
+    def add_workdays(self, start_date: date, workdays: int) -> date:
+        """start_date 다음 날부터 세어 workdays번째 업무일 (0 이하면 start_date)"""
+        if workdays <= 0:
+            return start_date
+        state = self._covering(start_date.year, start_date.year)
+        return self._nth_workday(state, state[4][start_date.toordinal() - state[2] + 1] + workdays - 1)
+    
+    def workdays_between(self, start_date: date, end_date: date) -> int:
+        """start_date~end_date(양 끝 포함) 업무일 수"""
+        if start_date > end_date:
+            return 0
+        state = self._covering(start_date.year, end_date.year)
+        origin, prefix = state[2], state[4]
+        return prefix[end_date.toordinal() - origin + 1] - prefix[start_date.toordinal() - origin]
+    
+    def non_workdays_between(self, start_date: date, end_date: date) -> List[date]:
+        """start_date~end_date(양 끝 포함)의 업무일이 아닌 날짜 (이분 탐색으로 범위만 잘라내 비업무일 수에 비례)"""
+        if start_date > end_date:
+            return []
+        state = self._covering(start_date.year, end_date.year)
+        origin, off_days = state[2], state[6]
+        low = bisect_left(off_days, start_date.toordinal() - origin)
+        high = bisect_right(off_days, end_date.toordinal() - origin)
+        return [date.fromordinal(origin + offset) for offset in off_days[low:high]]
+    
+    def non_workday_segments(self, start_date: date, end_date: date) -> List[Tuple[date, date]]:
+        """start_date~end_date 안의 연속된 비업무일 구간 [(시작, 끝)]"""
+        segments = []
+        for day in self.non_workdays_between(start_date, end_date):
+            if segments and segments[-1][1] + timedelta(days=1) == day:
+                segments[-1] = (segments[-1][0], day)
+            else:
+                segments.append((day, day))
+        return segments
+    
+    def workday_segments(self, start_date: date, end_date: date) -> List[Tuple[date, date]]:
+        """start_date~end_date 안의 연속된 업무일 구간 [(시작, 끝)] (비업무일 구간 사이의 빈칸)"""
+        segments = []
+        segment_start = start_date
+        for off_start, off_end in self.non_workday_segments(start_date, end_date):
+            if off_start > segment_start:
+                segments.append((segment_start, off_start - timedelta(days=1)))
+            segment_start = off_end + timedelta(days=1)
+        if segment_start <= end_date:
+            segments.append((segment_start, end_date))
+        return segments
+    
+    def add_workdays_batch(self, base_dates, offsets):
+        """add_workdays의 배열 버전 (datetime64[D] 배열 반환, 입력은 서로 브로드캐스트)"""
+        import numpy as np
+        
+        base, offsets = np.broadcast_arrays(
+            np.asarray(base_dates, dtype="datetime64[D]"), np.asarray(offsets, dtype=np.int64)
+        )
+        if base.size == 0:
+            return base.copy()
+        
+        # 업무일이 아닌 날은 직전 업무일로 당겨 세면 "다음 날부터 센 n번째 업무일"과 같다
+        positive = offsets > 0
+        state = self._covering_dates(base)
+        while True:
+            shifted = np.busday_offset(
+                base, np.where(positive, offsets, 0), roll="backward", busdaycal=self._busday_calendar(state)
+            )
+            result = np.where(positive, shifted, base)
+            last_year = int(result.max().astype("datetime64[Y]").astype(int)) + 1970
+            if last_year <= state[1]:
+                return result
+            if state[1] >= date.max.year:
+                raise OverflowError("date value out of range")
+            # 결과가 색인 범위를 넘으면 그 해의 공휴일까지 포함해 다시 계산
+            state = self._covering(state[0], last_year)
+    
+    def workdays_between_batch(self, start_dates, end_dates):
+        """workdays_between의 배열 버전 (int64 배열 반환, 시작일이 종료일보다 늦으면 0)"""
+        import numpy as np
+        
+        starts, ends = np.broadcast_arrays(
+            np.asarray(start_dates, dtype="datetime64[D]"), np.asarray(end_dates, dtype="datetime64[D]")
+        )
+        valid = starts <= ends
+        if not valid.any():
+            return np.zeros(starts.shape, dtype=np.int64)
+        
+        state = self._covering_dates(np.concatenate([starts[valid], ends[valid]]))
+        counts = np.busday_count(starts, ends + np.timedelta64(1, "D"), busdaycal=self._busday_calendar(state))
+        return np.where(valid, counts, 0)
+    
+    def is_workday_batch(self, dates):
+        """is_workday의 배열 버전 (bool 배열 반환)"""
+        import numpy as np
+        
+        days = np.asarray(dates, dtype="datetime64[D]")
+        if days.size == 0:
+            return np.zeros(days.shape, dtype=bool)
+        return np.is_busday(days, busdaycal=self._busday_calendar(self._covering_dates(days)))
 
 class KoreanHolidayCalendar:
     """한국 공휴일 및 주말 관리 클래스"""
     
-    # 2025년 한국 공휴일 (고정)
-    FIXED_HOLIDAYS_2025 = {
-        "2025-01-01": "신정",
-        "2025-01-28": "설날 연휴",
-        "2025-01-29": "설날",
-        "2025-01-30": "설날 연휴",
-        "2025-03-01": "삼일절",
-        "2025-05-05": "어린이날",
-        "2025-05-06": "어린이날 대체공휴일",
-        "2025-05-13": "부처님 오신 날",
-        "2025-06-06": "현충일",
-        "2025-08-15": "광복절",
-        "2025-09-28": "추석 연휴",
-        "2025-09-29": "추석",
-        "2025-09-30": "추석 연휴",
-        "2025-10-03": "개천절",
-        "2025-10-09": "한글날",
-        "2025-12-25": "크리스마스"
-    }
+    # 양력 공휴일 (월, 일, 이름, 대체공휴일 적용 시작 연도 - None이면 대체공휴일 없음)
+    # 토·일요일이나 다른 공휴일과 겹치면 그다음 첫 평일 비공휴일이 대체공휴일이 된다
+    SOLAR_HOLIDAYS = [
+        (1, 1, "신정", None),
+        (3, 1, "삼일절", 2021),
+        (5, 5, "어린이날", 2014),
+        (6, 6, "현충일", None),
+        (8, 15, "광복절", 2021),
+        (10, 3, "개천절", 2021),
+        (10, 9, "한글날", 2021),       # 1991~2012년은 공휴일 아님
+        (12, 25, "크리스마스", 2023),
+    ]
+    
+    # 음력 공휴일 (음력 월, 일, 이름, 대체공휴일 적용 시작 연도)
+    LUNAR_HOLIDAYS = [
+        (4, 8, "부처님 오신 날", 2023),
+    ]
+    
+    # 전날·다음날까지 사흘 연휴인 음력 명절 (토요일은 제외하고 일요일이나 다른 공휴일과 겹칠 때만 대체공휴일)
+    LUNAR_FESTIVALS = [
+        (1, 1, "설날", 2014),
+        (8, 15, "추석", 2014),
+    ]
     
-    # 2024년 공휴일 (참고용)
-    FIXED_HOLIDAYS_2024 = {
-        "2024-01-01": "신정",
-        "2024-02-09": "설날 연휴",
-        "2024-02-10": "설날",
-        "2024-02-11": "설날 연휴",
-        "2024-02-12": "설날 대체공휴일",
-        "2024-03-01": "삼일절",
-        "2024-05-05": "어린이날",
-        "2024-05-06": "어린이날 대체공휴일",
-        "2024-05-15": "부처님 오신 날",
-        "2024-06-06": "현충일",
-        "2024-08-15": "광복절",
-        "2024-09-16": "추석 연휴",
-        "2024-09-17": "추석",
-        "2024-09-18": "추석 연휴",
-        "2024-10-03": "개천절",
-        "2024-10-09": "한글날",
-        "2024-12-25": "크리스마스"
+    # 임시공휴일·선거일 (규칙으로 계산할 수 없으므로 지정될 때마다 추가, 대체공휴일 없음)
+    SPECIAL_HOLIDAYS = {
+        "2015-08-14": "임시공휴일",
+        "2016-05-06": "임시공휴일",
+        "2017-05-09": "대통령 선거일",
+        "2017-10-02": "임시공휴일",
+        "2018-06-13": "전국동시지방선거일",
+        "2020-04-15": "국회의원 선거일",
+        "2020-08-17": "임시공휴일",
+        "2022-03-09": "대통령 선거일",
+        "2022-06-01": "전국동시지방선거일",
+        "2023-10-02": "임시공휴일",
+        "2024-04-10": "국회의원 선거일",
+        "2024-10-01": "임시공휴일",
+        "2025-01-27": "임시공휴일",
+        "2025-06-03": "대통령 선거일",
+        "2026-06-03": "전국동시지방선거일",
     }
     
     @classmethod
-    def get_holidays_for_year(cls, year: int) -> dict:
-        """연도별 공휴일 반환"""
-        if year == 2025:
-            return cls.FIXED_HOLIDAYS_2025
-        elif year == 2024:
-            return cls.FIXED_HOLIDAYS_2024
-        else:
-            # 다른 연도는 기본 공휴일만 (확장 가능)
-            return {
-                f"{year}-01-01": "신정",
-                f"{year}-03-01": "삼일절", 
-                f"{year}-05-05": "어린이날",
-                f"{year}-06-06": "현충일",
-                f"{year}-08-15": "광복절",
-                f"{year}-10-03": "개천절",
-                f"{year}-10-09": "한글날",
-                f"{year}-12-25": "크리스마스"
-            }
+    @functools.lru_cache(maxsize=None)
+    def get_holidays_for_year(cls, year: int) -> Mapping[str, str]:
+        """연도별 공휴일 {YYYY-MM-DD: 이름} (음력 명절·대체공휴일·임시공휴일 포함, 연도별로 한 번만 계산)"""
+        days: Dict[date, List[tuple]] = {}   # 날짜 → [(이름, 대체공휴일 이름, 대체 시작 연도, 명절 여부)]
+        
+        def add(day: date, name: str, substitute_name: str = "", since: int = None, festival: bool = False):
+            if day.year == year:
+                days.setdefault(day, []).append((name, substitute_name, since, festival))
+        
+        for month, day, name, since in cls.SOLAR_HOLIDAYS:
+            if name == "한글날" and 1991 <= year <= 2012:
+                continue
+            add(date(year, month, day), name, name, since)
+        for month, day, name, since in cls.LUNAR_HOLIDAYS:
+            add(lunar_to_solar(year, month, day), name, name, since)
+        for month, day, name, since in cls.LUNAR_FESTIVALS:
+            center = lunar_to_solar(year, month, day)
+            for offset, label in ((-1, f"{name} 연휴"), (0, name), (1, f"{name} 연휴")):
+                add(center + timedelta(days=offset), label, name, since, festival=True)
+        for date_str, name in cls.SPECIAL_HOLIDAYS.items():
+            add(date.fromisoformat(date_str), name)
+        
+        # 대체공휴일: 날짜 순으로 처리해 앞선 대체공휴일과도 겹치지 않게 한다 (한 날짜에 하나)
+        substitutes: Dict[date, str] = {}
+        for day in sorted(days):
+            entries = days[day]
+            for name, substitute_name, since, festival in entries:
+                if since is None or year < since:
+                    continue
+                on_weekend = day.weekday() == 6 if festival else day.weekday() >= 5
+                if on_weekend or len(entries) > 1:
+                    candidate = day + timedelta(days=1)
+                    while candidate.weekday() >= 5 or candidate in days or candidate in substitutes:
+                        candidate += timedelta(days=1)
+                    if candidate.year == year:
+                        substitutes[candidate] = f"{substitute_name} 대체공휴일"
+                    break
+        
+        holidays = {day: ", ".join(entry[0] for entry in entries) for day, entries in days.items()}
+        holidays.update(substitutes)
+        return MappingProxyType({day.isoformat(): holidays[day] for day in sorted(holidays)})
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def get_holiday_dates(cls, year: int) -> frozenset:
+        """연도별 공휴일 날짜 집합 (is_holiday의 O(1) 조회용)"""
+        return frozenset(date.fromisoformat(date_str) for date_str in cls.get_holidays_for_year(year))
+    
+    @classmethod
+    def workday_index(cls) -> WorkdayIndex:
+        """이 달력의 업무일 색인 (클래스별로 하나, 하위 클래스는 자신의 공휴일 표로 따로 생성)"""
+        index = cls.__dict__.get("_workday_index")
+        if index is None:
+            index = WorkdayIndex(cls.get_holidays_for_year)
+            setattr(cls, "_workday_index", index)
+        return index
     
     @classmethod
     def is_holiday(cls, target_date: date) -> bool:
         """특정 날짜가 공휴일인지 확인"""
-        holidays = cls.get_holidays_for_year(target_date.year)
-        date_str = target_date.strftime('%Y-%m-%d')
-        return date_str in holidays
+        return target_date in cls.get_holiday_dates(target_date.year)
     
     @classmethod
     def is_weekend(cls, target_date: date) -> bool:
@@ -83,54 +337,57 @@ class KoreanHolidayCalendar:
     @classmethod 
     def is_workday(cls, target_date: date) -> bool:
         """업무일인지 확인 (공휴일, 주말 제외)"""
-        return not (cls.is_holiday(target_date) or cls.is_weekend(target_date))
+        return cls.workday_index().is_workday(target_date)
     
     @classmethod
     def get_next_workday(cls, start_date: date) -> date:
-        """다음 업무일 찾기"""
-        current_date = start_date
-        while not cls.is_workday(current_date):
-            current_date += timedelta(days=1)
-        return current_date
+        """다음 업무일 찾기 (당일이 업무일이면 당일)"""
+        return cls.workday_index().next_workday(start_date)
     
     @classmethod
     def add_workdays(cls, start_date: date, workdays: int) -> date:
-        """업무일 기준으로 날짜 추가"""
-        if workdays == 0:
-            return start_date
-            
-        current_date = start_date
-        days_added = 0
-        
-        while days_added < workdays:
-            current_date += timedelta(days=1)  # 다음 날로 이동
-            if cls.is_workday(current_date):   # 업무일이면 카운트
-                days_added += 1
-        
-        return current_date
+        """업무일 기준으로 날짜 추가 (다음 날부터 센 workdays번째 업무일)"""
+        return cls.workday_index().add_workdays(start_date, workdays)
     
     @classmethod
     def calculate_workdays_between(cls, start_date: date, end_date: date) -> int:
-        """두 날짜 사이의 업무일 수 계산"""
-        if start_date > end_date:
-            return 0
-            
-        workdays = 0
-        current_date = start_date
-        
-        while current_date <= end_date:
-            if cls.is_workday(current_date):
-                workdays += 1
-            current_date += timedelta(days=1)
-        
-        return workdays
+        """두 날짜 사이의 업무일 수 계산 (양 끝 포함)"""
+        return cls.workday_index().workdays_between(start_date, end_date)
+    
+    @classmethod
+    def add_workdays_batch(cls, base_dates, offsets):
+        """add_workdays를 여러 날짜/일수에 한 번에 적용 (NumPy 영업일 연산, datetime64[D] 배열 반환)"""
+        return cls.workday_index().add_workdays_batch(base_dates, offsets)
+    
+    @classmethod
+    def workdays_between_batch(cls, start_dates, end_dates):
+        """calculate_workdays_between을 여러 구간에 한 번에 적용 (int64 배열 반환)"""
+        return cls.workday_index().workdays_between_batch(start_dates, end_dates)
+    
+    @classmethod
+    def is_workday_batch(cls, dates):
+        """is_workday를 여러 날짜에 한 번에 적용 (bool 배열 반환)"""
+        return cls.workday_index().is_workday_batch(dates)
+    
+    @classmethod
+    def get_non_workdays_between(cls, start_date: date, end_date: date) -> List[Tuple[date, str]]:
+        """기간 내 공휴일·주말 [(날짜, 공휴일명)] (공휴일이 아닌 주말은 공휴일명이 빈 문자열)"""
+        return [(day, cls.get_holiday_name(day)) for day in cls.workday_index().non_workdays_between(start_date, end_date)]
+    
+    @classmethod
+    def get_workday_segments(cls, start_date: date, end_date: date) -> List[Tuple[date, date]]:
+        """기간 내 연속된 업무일 구간 [(시작, 끝)]"""
+        return cls.workday_index().workday_segments(start_date, end_date)
+    
+    @classmethod
+    def get_non_workday_segments(cls, start_date: date, end_date: date) -> List[Tuple[date, date]]:
+        """기간 내 연속된 공휴일·주말 구간 [(시작, 끝)]"""
+        return cls.workday_index().non_workday_segments(start_date, end_date)
     
     @classmethod
     def get_holiday_name(cls, target_date: date) -> str:
         """공휴일명 반환"""
-        holidays = cls.get_holidays_for_year(target_date.year)
-        date_str = target_date.strftime('%Y-%m-%d')
-        return holidays.get(date_str, "")
+        return cls.get_holidays_for_year(target_date.year).get(target_date.isoformat(), "")
 
 class WorkdayCalculator:
     """업무일 기반 일정 계산 클래스"""
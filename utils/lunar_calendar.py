@@ -0,0 +1,137 @@
+# utils/lunar_calendar.py - 한국 음력(태음태양력) 날짜 계산
+
+import functools
+import math
+from datetime import date
+from typing import List, Tuple
+
+# 한국 음력은 한국 표준시(UTC+9) 기준 합삭일을 초하루로, 중기(태양 황경 30°의 배수)로 달 번호를 정한다.
+# 천체 위치는 Meeus, "Astronomical Algorithms" 2판 25장(태양)·49장(합삭) 공식을 사용한다.
+KST_OFFSET_DAYS = 9 / 24
+SYNODIC_MONTH = 29.530588861
+JDE_NEW_MOON_EPOCH = 2451550.09766      # k = 0 합삭 (2000-01-06)
+JD_ORDINAL_OFFSET = 1721424.5           # JD - 이 값 = date.toordinal() (자정 기준)
+
+# 합삭 주기항 보정 (계수, M 배수, M' 배수, F 배수, 이심률 E 차수) - Meeus 표 49.A
+_NEW_MOON_TERMS = [
+    (-0.40720, 0, 1, 0, 0), (0.17241, 1, 0, 0, 1), (0.01608, 0, 2, 0, 0), (0.01039, 0, 0, 2, 0),
+    (0.00739, -1, 1, 0, 1), (-0.00514, 1, 1, 0, 1), (0.00208, 2, 0, 0, 2), (-0.00111, 0, 1, -2, 0),
+    (-0.00057, 0, 1, 2, 0), (0.00056, 1, 2, 0, 1), (-0.00042, 0, 3, 0, 0), (0.00042, 1, 0, 2, 1),
+    (0.00038, 1, 0, -2, 1), (-0.00024, -1, 2, 0, 1), (-0.00007, 2, 1, 0, 0), (0.00004, 0, 2, -2, 0),
+    (0.00004, 3, 0, 0, 0), (0.00003, 1, 1, -2, 0), (0.00003, 0, 2, 2, 0), (-0.00003, 1, 1, 2, 0),
+    (0.00003, -1, 1, 2, 0), (-0.00002, -1, 1, -2, 0), (-0.00002, 1, 3, 0, 0), (0.00002, 0, 4, 0, 0),
+]
+
+# 행성 섭동 보정 (계수, 기준각, k 계수, T² 계수)
+_PLANETARY_TERMS = [
+    (0.000325, 299.77, 0.107408, -0.009173), (0.000165, 251.88, 0.016321, 0), (0.000164, 251.83, 26.651886, 0),
+    (0.000126, 349.42, 36.412478, 0), (0.000110, 84.66, 18.206239, 0), (0.000062, 141.74, 53.303771, 0),
+    (0.000060, 207.14, 2.453732, 0), (0.000056, 154.84, 7.306860, 0), (0.000047, 34.52, 27.261239, 0),
+    (0.000042, 207.19, 0.121824, 0), (0.000040, 291.34, 1.844379, 0), (0.000037, 161.72, 24.198154, 0),
+    (0.000035, 239.56, 25.513099, 0), (0.000023, 331.55, 3.592518, 0),
+]
+
+def _delta_t_days(year: float) -> float:
+    """지구시(TT)와 세계시(UT)의 차이 ΔT (일 단위, Espenak-Meeus 근사식)"""
+    t = year - 2000
+    if 2005 <= year < 2050:
+        seconds = 62.92 + 0.32217 * t + 0.005589 * t ** 2
+    elif 1986 <= year < 2005:
+        seconds = (63.86 + 0.3345 * t - 0.060374 * t ** 2 + 0.0017275 * t ** 3
+                   + 0.000651814 * t ** 4 + 0.00002373599 * t ** 5)
+    else:
+        u = (year - 1820) / 100
+        seconds = -20 + 32 * u ** 2 - (0.5628 * (2150 - year) if 2050 <= year < 2150 else 0)
+    return seconds / 86400
+
+def _kst_date(jde: float) -> date:
+    """역학시 율리우스일 → 한국 표준시 날짜"""
+    year = 2000 + (jde - 2451545.0) / 365.25
+    return date.fromordinal(math.floor(jde - _delta_t_days(year) + KST_OFFSET_DAYS - JD_ORDINAL_OFFSET))
+
+def new_moon_jde(k: int) -> float:
+    """k번째 합삭 시각 (역학시 율리우스일, k=0은 2000-01-06)"""
+    T = k / 1236.85
+    jde = (JDE_NEW_MOON_EPOCH + SYNODIC_MONTH * k + 0.00015437 * T ** 2
+           - 0.000000150 * T ** 3 + 0.00000000073 * T ** 4)
+    E = 1 - 0.002516 * T - 0.0000074 * T ** 2
+    M = math.radians(2.5534 + 29.10535670 * k - 0.0000014 * T ** 2 - 0.00000011 * T ** 3)
+    Mp = math.radians(201.5643 + 385.81693528 * k + 0.0107582 * T ** 2
+                      + 0.00001238 * T ** 3 - 0.000000058 * T ** 4)
+    F = math.radians(160.7108 + 390.67050284 * k - 0.0016118 * T ** 2
+                     - 0.00000227 * T ** 3 + 0.000000011 * T ** 4)
+    omega = math.radians(124.7746 - 1.56375588 * k + 0.0020672 * T ** 2 + 0.00000215 * T ** 3)
+
+    jde += sum(coef * E ** e_power * math.sin(m * M + mp * Mp + f * F)
+               for coef, m, mp, f, e_power in _NEW_MOON_TERMS)
+    jde -= 0.00017 * math.sin(omega)
+    jde += sum(coef * math.sin(math.radians(base + rate * k + t2 * T ** 2))
+               for coef, base, rate, t2 in _PLANETARY_TERMS)
+    return jde
+
+def sun_longitude(jde: float) -> float:
+    """태양의 겉보기 황경 (도, 0~360)"""
+    T = (jde - 2451545.0) / 36525
+    L0 = 280.46646 + 36000.76983 * T + 0.0003032 * T ** 2
+    M = math.radians(357.52911 + 35999.05029 * T - 0.0001537 * T ** 2)
+    C = ((1.914602 - 0.004817 * T - 0.000014 * T ** 2) * math.sin(M)
+         + (0.019993 - 0.000101 * T) * math.sin(2 * M) + 0.000289 * math.sin(3 * M))
+    omega = math.radians(125.04 - 1934.136 * T)
+    return (L0 + C - 0.00569 - 0.00478 * math.sin(omega)) % 360
+
+def solar_term_jde(year: int, longitude: float) -> float:
+    """year년에 태양 황경이 longitude가 되는 시각 (춘분 0°, 동지 270°)"""
+    jde = 2451623.80984 + 365.242374 * (year - 2000) + longitude / 360 * 365.242374
+    for _ in range(20):
+        correction = 58 * math.sin(math.radians(longitude - sun_longitude(jde)))
+        jde += correction
+        if abs(correction) < 1e-7:
+            break
+    return jde
+
+@functools.lru_cache(maxsize=256)
+def lunar_months(year: int) -> Tuple[Tuple[date, int, bool], ...]:
+    """year-1년 동짓달부터 year년 동짓달 직전까지의 음력 달 (초하루, 달 번호, 윤달 여부)
+
+    동지를 포함한 달이 11월이며, 두 동짓달 사이에 달이 13개면 중기가 없는 첫 달이 윤달이다.
+    설날(1월)·부처님 오신 날(4월)·추석(8월)은 모두 이 범위에 들어간다.
+    """
+    winter_solstices = [_kst_date(solar_term_jde(y, 270)) for y in (year - 1, year)]
+
+    # 두 동지를 감싸는 합삭일 목록
+    k = math.floor((solar_term_jde(year - 1, 270) - JDE_NEW_MOON_EPOCH) / SYNODIC_MONTH) - 1
+    new_moons: List[date] = []
+    while not new_moons or new_moons[-1] <= winter_solstices[1]:
+        new_moons.append(_kst_date(new_moon_jde(k)))
+        k += 1
+    start = max(i for i, day in enumerate(new_moons) if day <= winter_solstices[0])
+    end = max(i for i, day in enumerate(new_moons) if day <= winter_solstices[1])
+
+    # 중기(황경 30°의 배수) 날짜 - solar_term_jde(y, ...)는 y년 춘분부터의 1년이므로 270° 이상은 전년도 기준
+    principal_terms = [
+        _kst_date(solar_term_jde(year - 1 if longitude >= 270 else year, longitude))
+        for longitude in range(0, 360, 30)
+    ]
+
+    leap_year = end - start == 13
+    months = []
+    number, leap_found = 11, False
+    for i in range(start, end):
+        first_day, next_first_day = new_moons[i], new_moons[i + 1]
+        is_leap = False
+        if i > start:
+            has_principal_term = any(first_day <= term < next_first_day for term in principal_terms)
+            if leap_year and not leap_found and not has_principal_term:
+                is_leap = leap_found = True
+            else:
+                number = number % 12 + 1
+        months.append((first_day, number, is_leap))
+    return tuple(months)
+
+def lunar_to_solar(year: int, month: int, day: int, leap: bool = False) -> date:
+    """음력 날짜 → 양력 날짜 (year는 음력 연도)"""
+    # 음력 11·12월은 다음 해 동짓달 범위의 앞부분에 있다 (lunar_months의 첫 11·12월은 전년도 달)
+    for first_day, number, is_leap in lunar_months(year + 1 if month >= 11 else year):
+        if number == month and is_leap == leap:
+            return date.fromordinal(first_day.toordinal() + day - 1)
+    raise ValueError(f"음력 {year}년 {'윤' if leap else ''}{month}월이 없습니다.")
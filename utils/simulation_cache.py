@@ -0,0 +1,144 @@
+# utils/simulation_cache.py - 입력 지문 기반 시뮬레이션 결과 캐시
+
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+class SimulationCache:
+    """입력 지문(키)으로 찾는 LRU 결과 캐시
+
+    키가 입력 데이터와 파라미터의 해시이므로 데이터가 바뀌면 키도 바뀐다. 따라서 무효화 없이
+    오래된 항목은 LRU로 밀려난다. 메모리 상한은 항목 수와 가중치 합(할당 행 수 등)으로 제한한다.
+    persist_dir를 지정하면 항목을 pickle 파일로도 저장해 프로세스 재시작 후에도 재사용한다.
+    (캐시 디렉터리에는 이 클래스가 쓴 파일만 두어야 한다)
+    """
+
+    def __init__(self, max_entries: int = 32, max_weight: int = 0, persist_dir: Optional[str] = None):
+        self.max_entries = max_entries
+        self.max_weight = max_weight          # 0이면 가중치 제한 없음
+        self.persist_dir = persist_dir
+        if persist_dir:
+            os.makedirs(persist_dir, exist_ok=True)
+
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()   # 키 → (값, 가중치)
+        self._weight = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "disk_hits": 0, "evictions": 0}
+
+    def _path(self, key: str) -> str:
+        """디스크 저장 경로 (키는 16진수 해시 기반이라 파일명으로 그대로 사용)"""
+        return os.path.join(self.persist_dir, f"{key.replace(':', '_')}.pkl")
+
+    def _touch(self, key: str):
+        """디스크 항목의 수정 시각 갱신 (디스크 정리도 최근 사용 순을 따르도록)"""
+        if self.persist_dir:
+            try:
+                os.utime(self._path(key))
+            except OSError:
+                pass
+
+    def _store(self, key: str, value: Any, weight: int):
+        """메모리에 저장 후 상한을 넘는 오래된 항목 제거 (잠금 안에서 호출)"""
+        if key in self._entries:
+            self._weight -= self._entries.pop(key)[1]
+        self._entries[key] = (value, weight)
+        self._weight += weight
+
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or (self.max_weight and self._weight > self.max_weight and len(self._entries) > 1)
+        ):
+            _, (_, evicted_weight) = self._entries.popitem(last=False)
+            self._weight -= evicted_weight
+            self._stats["evictions"] += 1
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (메모리 → 디스크 순, 없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+        if entry is not None:
+            self._touch(key)
+            return entry[0]
+
+        if self.persist_dir and os.path.exists(self._path(key)):
+            try:
+                with open(self._path(key), "rb") as f:
+                    value, weight = pickle.load(f)
+            except Exception:
+                value = None
+            if value is not None:
+                self._touch(key)
+                with self._lock:
+                    self._store(key, value, weight)
+                    self._stats["hits"] += 1
+                    self._stats["disk_hits"] += 1
+                return value
+
+        with self._lock:
+            self._stats["misses"] += 1
+        return None
+
+    def put(self, key: str, value: Any, weight: int = 1):
+        """캐시 저장 (persist_dir가 있으면 파일에도 기록)"""
+        with self._lock:
+            self._store(key, value, weight)
+
+        if self.persist_dir:
+            # 임시 파일에 쓴 뒤 교체해 다른 프로세스가 쓰다 만 파일을 읽지 않도록 한다
+            fd, temp_path = tempfile.mkstemp(dir=self.persist_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump((value, weight), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, self._path(key))
+            except Exception:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+            self._prune_disk()
+
+    def _prune_disk(self):
+        """디스크 항목도 최근 사용(수정) 순으로 max_entries개만 유지"""
+        try:
+            paths = [
+                os.path.join(self.persist_dir, name)
+                for name in os.listdir(self.persist_dir) if name.endswith(".pkl")
+            ]
+            paths.sort(key=os.path.getmtime, reverse=True)
+            for path in paths[self.max_entries:]:
+                os.remove(path)
+        except OSError:
+            pass
+
+    def clear(self, include_disk: bool = False):
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self._weight = 0
+        if include_disk and self.persist_dir:
+            for name in os.listdir(self.persist_dir):
+                if name.endswith(".pkl"):
+                    os.remove(os.path.join(self.persist_dir, name))
+
+    def get_stats(self) -> Dict:
+        """캐시 통계 (항목 수/가중치/적중률)"""
+        with self._lock:
+            stats = dict(self._stats)
+            entries = len(self._entries)
+            weight = self._weight
+        requests = stats["hits"] + stats["misses"]
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "weight": weight,
+            "max_weight": self.max_weight,
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "disk_hits": stats["disk_hits"],
+            "evictions": stats["evictions"],
+            "hit_rate": round(stats["hits"] / requests * 100, 1) if requests else 0.0
+        }
@@ -0,0 +1,334 @@
+# utils/task_importer.py - CSV/XLSX 업무 일괄 가져오기
+
+import io
+import time
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from config import IMPORT_CONFIG
+from database import get_team_members, get_sprints, add_tasks_bulk, add_sprints_bulk
+
+# 업무 필드별 허용 헤더 (업무 목록/내보내기 화면의 한글 헤더 + 영문 필드명)
+TASK_COLUMN_ALIASES = {
+    "item_name": ["업무명", "항목", "item_name", "task_name", "task"],
+    "content": ["업무 내용", "내용", "content", "description"],
+    "attribute": ["속성", "attribute"],
+    "build_type": ["빌드", "스프린트", "적용 빌드/스프린트", "build_type", "sprint"],
+    "part_division": ["파트", "파트 구분", "part_division", "part"],
+    "priority": ["우선순위", "priority"],
+    "assignee": ["담당자", "assignee"],
+    "story_points_leader": ["스토리포인트", "스토리 포인트", "story_points_leader", "story_points"],
+    "duration_leader": ["리더예상", "예상 기간(리더)", "duration_leader"],
+    "duration_assignee": ["담당자예상", "예상 기간(담당자)", "duration_assignee"],
+    "final_hours": ["최종시간", "최종 예상시간", "예상시간", "final_hours", "hours"],
+    "ai_judgment": ["AI판단", "AI 판단", "ai_judgment"],
+    "connectivity": ["연결성", "connectivity"],
+}
+
+TEXT_FIELDS = ["item_name", "content", "attribute", "build_type", "part_division", "assignee", "ai_judgment", "connectivity"]
+NUMERIC_FIELDS = ["story_points_leader", "duration_leader", "duration_assignee", "final_hours"]
+
+# 업무 목록 화면에서 "비어 있음"을 뜻하는 표시값
+EMPTY_MARKERS = {"assignee": "미지정", "connectivity": "없음"}
+
+def _normalize_header(header) -> str:
+    """헤더 비교용 정규화 (공백 제거, 소문자)"""
+    return "".join(str(header).split()).lower()
+
+_ALIAS_LOOKUP = {
+    _normalize_header(alias): field_name
+    for field_name, aliases in TASK_COLUMN_ALIASES.items()
+    for alias in aliases
+}
+
+@dataclass
+class ImportIssue:
+    """가져오기 중 발견된 행 단위 오류/경고"""
+    row: int            # 원본 파일 기준 행 번호 (헤더 = 1행)
+    column: str
+    message: str
+
+@dataclass
+class ImportReport:
+    """가져오기 결과 리포트"""
+    total_rows: int = 0
+    imported: int = 0
+    skipped: int = 0
+    error_count: int = 0
+    warning_count: int = 0
+    errors: List[ImportIssue] = field(default_factory=list)
+    warnings: List[ImportIssue] = field(default_factory=list)
+    column_mapping: Dict[str, str] = field(default_factory=dict)
+    unmapped_columns: List[str] = field(default_factory=list)
+    created_sprints: List[str] = field(default_factory=list)
+    task_ids: List[int] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+    dry_run: bool = False
+
+def map_columns(headers) -> Tuple[Dict[str, str], List[str]]:
+    """원본 헤더를 업무 필드에 매핑 (매핑 결과, 매핑되지 않은 헤더 목록)"""
+    mapping = {}
+    unmapped = []
+    for header in headers:
+        field_name = _ALIAS_LOOKUP.get(_normalize_header(header))
+        if field_name and field_name not in mapping.values():
+            mapping[str(header)] = field_name
+        else:
+            unmapped.append(str(header))
+    return mapping, unmapped
+
+def _detect_encoding(sample: bytes) -> str:
+    """CSV 인코딩 판별 (UTF-8 우선, 실패 시 CP949)"""
+    try:
+        sample.decode("utf-8")
+        return "utf-8-sig"
+    except UnicodeDecodeError as e:
+        # 샘플 끝에서 잘린 멀티바이트 문자는 UTF-8로 간주
+        return "utf-8-sig" if e.start >= len(sample) - 3 else "cp949"
+
+def _open_binary(source):
+    """경로 또는 파일 객체를 바이너리 스트림으로 변환"""
+    if isinstance(source, str):
+        return open(source, "rb"), True
+    if isinstance(source, bytes):
+        return io.BytesIO(source), True
+    return source, False
+
+def _iter_csv_chunks(stream, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """CSV를 chunk 단위 DataFrame으로 읽기 (모든 값은 문자열, 빈 줄도 행으로 남겨 행 번호를 파일과 맞춤)"""
+    sample = stream.read(65536)
+    stream.seek(0)
+    reader = pd.read_csv(
+        stream, chunksize=chunk_size, dtype=str, keep_default_na=False,
+        encoding=_detect_encoding(sample), skipinitialspace=True, skip_blank_lines=False
+    )
+    for chunk in reader:
+        yield chunk
+
+def _iter_xlsx_chunks(stream, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """XLSX 첫 시트를 read-only 모드로 chunk 단위 DataFrame으로 읽기"""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(stream, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        headers = ["" if h is None else str(h) for h in header]
+        while True:
+            block = list(islice(rows, chunk_size))
+            if not block:
+                break
+            yield pd.DataFrame([row[:len(headers)] for row in block], columns=headers, dtype=object)
+    finally:
+        workbook.close()
+
+def _estimate_xlsx_rows(stream) -> Optional[int]:
+    """XLSX 시트 크기 정보로 데이터 행 수 추정 (없으면 None)"""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(stream, read_only=True)
+    try:
+        max_row = workbook.active.max_row
+    finally:
+        workbook.close()
+    stream.seek(0)
+    return max_row - 1 if max_row else None
+
+def _clean_text(series: pd.Series) -> pd.Series:
+    """텍스트 컬럼 정리 (None/NaN → 빈 문자열, 앞뒤 공백 제거)"""
+    return series.where(series.notna(), "").astype(str).str.strip()
+
+def _parse_number(series: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """숫자 컬럼 변환 ('8.0h' 같은 표시 형식 허용). (값, 형식 오류 마스크) 반환"""
+    text = _clean_text(series).str.rstrip("hH").str.strip()
+    values = pd.to_numeric(text, errors="coerce")
+    invalid = values.isna() & (text != "")
+    return values, invalid
+
+class TaskImporter:
+    """CSV/XLSX 업무 일괄 가져오기
+
+    파일을 chunk 단위로 읽어 벡터화 검증 후 add_tasks_bulk로 chunk마다 한 트랜잭션에 저장한다.
+    전체 파일을 메모리에 올리지 않으며, 잘못된 행은 건너뛰고 리포트에 남긴다.
+    """
+
+    def __init__(self, project_id: int, create_missing_sprints: bool = True,
+                 chunk_size: Optional[int] = None, dry_run: bool = False):
+        self.project_id = project_id
+        self.create_missing_sprints = create_missing_sprints
+        self.chunk_size = chunk_size or IMPORT_CONFIG["chunk_size"]
+        self.dry_run = dry_run
+        self.max_issues = IMPORT_CONFIG["max_reported_issues"]
+
+    def run(self, source, file_name: str = "",
+            progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+            total_rows: Optional[int] = None) -> ImportReport:
+        """가져오기 실행
+
+        Args:
+            source: 파일 경로, bytes 또는 바이너리 파일 객체
+            file_name: 확장자 판별용 파일명 (경로를 넘긴 경우 생략 가능)
+            progress_callback: (처리한 행 수, 전체 행 수 또는 None)을 받는 콜백
+            total_rows: 진행률 표시용 전체 행 수 (모르면 None, XLSX는 자동 추정)
+        """
+        started = time.perf_counter()
+        report = ImportReport(dry_run=self.dry_run)
+        name = (file_name or (source if isinstance(source, str) else "")).lower()
+        stream, should_close = _open_binary(source)
+
+        try:
+            if name.endswith((".xlsx", ".xlsm")):
+                if total_rows is None:
+                    total_rows = _estimate_xlsx_rows(stream)
+                chunks = _iter_xlsx_chunks(stream, self.chunk_size)
+            elif name.endswith((".csv", ".txt")) or not name:
+                chunks = _iter_csv_chunks(stream, self.chunk_size)
+            else:
+                raise ValueError(f"지원하지 않는 파일 형식입니다: {file_name}")
+
+            # 담당자/스프린트는 한 번만 조회해 조회 테이블로 사용
+            member_roles = {m["name"]: m["role"] for m in get_team_members(self.project_id)}
+            sprint_names = {s["name"] for s in get_sprints(self.project_id)}
+
+            row_offset = 2  # 헤더가 1행
+            for chunk in chunks:
+                if not report.column_mapping:
+                    report.column_mapping, report.unmapped_columns = map_columns(chunk.columns)
+                    if "item_name" not in report.column_mapping.values():
+                        raise ValueError("업무명 컬럼을 찾을 수 없습니다. (예: '업무명', 'item_name')")
+
+                chunk = chunk.rename(columns=report.column_mapping)[list(report.column_mapping.values())]
+                chunk.index = range(row_offset, row_offset + len(chunk))
+                row_offset += len(chunk)
+
+                records = self._prepare_chunk(chunk, report, member_roles, sprint_names)
+                if records and not self.dry_run:
+                    report.task_ids.extend(add_tasks_bulk(self.project_id, records))
+                report.imported += len(records)
+
+                if progress_callback:
+                    progress_callback(row_offset - 2, total_rows)
+        finally:
+            if should_close:
+                stream.close()
+
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+
+    def _prepare_chunk(self, chunk: pd.DataFrame, report: ImportReport,
+                       member_roles: Dict[str, str], sprint_names: set) -> List[Dict]:
+        """chunk 하나를 검증/정규화하고 저장할 업무 dict 목록 반환"""
+        for field_name in TASK_COLUMN_ALIASES:
+            if field_name not in chunk.columns:
+                chunk[field_name] = ""
+
+        frame = pd.DataFrame(index=chunk.index)
+        for field_name in TEXT_FIELDS:
+            frame[field_name] = _clean_text(chunk[field_name])
+        for field_name, marker in EMPTY_MARKERS.items():
+            frame.loc[frame[field_name] == marker, field_name] = ""
+        labels = {field_name: header for header, field_name in report.column_mapping.items()}
+
+        # 완전히 빈 행은 조용히 건너뜀
+        blank = (frame[TEXT_FIELDS] == "").all(axis=1) & (_clean_text(chunk["priority"]) == "")
+        for field_name in NUMERIC_FIELDS:
+            blank &= _clean_text(chunk[field_name]) == ""
+        frame = frame[~blank]
+        chunk = chunk[~blank]
+        report.total_rows += len(frame)
+
+        invalid_rows = pd.Series(False, index=frame.index)
+
+        def flag(mask: pd.Series, column: str, message: str):
+            nonlocal invalid_rows
+            for row in mask[mask].index:
+                self._add_issue(report, "errors", row, labels.get(column, column), message)
+            invalid_rows |= mask
+
+        flag(frame["item_name"] == "", "item_name", "업무명(항목)은 필수입니다.")
+
+        priority, bad_priority = _parse_number(chunk["priority"])
+        priority = priority.fillna(3)
+        flag(bad_priority | (priority % 1 != 0) | ~priority.between(1, 5),
+             "priority", "우선순위는 1~5 사이의 정수여야 합니다.")
+        frame["priority"] = priority
+
+        for field_name in NUMERIC_FIELDS:
+            values, bad = _parse_number(chunk[field_name])
+            values = values.fillna(0)
+            flag(bad | (values < 0), field_name, "0 이상의 숫자여야 합니다.")
+            frame[field_name] = values
+
+        # 최종 예상시간이 없으면 업무 입력 폼과 같이 리더/담당자 예상의 평균 사용
+        average = (frame["duration_leader"] + frame["duration_assignee"]) / 2
+        frame["final_hours"] = frame["final_hours"].where(frame["final_hours"] > 0, average)
+
+        # 연결성: '#12' 또는 12.0 형식을 업무 ID 문자열로 정규화
+        connectivity = frame["connectivity"].str.lstrip("#")
+        numeric_connectivity = pd.to_numeric(connectivity, errors="coerce")
+        frame["connectivity"] = connectivity.where(
+            numeric_connectivity.isna() | (numeric_connectivity % 1 != 0),
+            numeric_connectivity.fillna(0).astype("int64").astype(str)
+        )
+
+        # 담당자 확인: 팀에 없는 이름은 비우고 경고
+        unknown_assignee = (frame["assignee"] != "") & ~frame["assignee"].isin(member_roles)
+        for row, name in frame.loc[unknown_assignee & ~invalid_rows, "assignee"].items():
+            self._add_issue(report, "warnings", row, labels["assignee"],
+                            f"팀원 '{name}'을(를) 찾을 수 없어 미지정으로 가져옵니다.")
+        frame.loc[unknown_assignee, "assignee"] = ""
+
+        # 파트 구분이 비어 있으면 업무 입력 폼과 같이 담당자 역할(미지정이면 '기타') 사용
+        missing_part = frame["part_division"] == ""
+        frame.loc[missing_part, "part_division"] = frame.loc[missing_part, "assignee"].map(member_roles).fillna("기타")
+
+        frame = frame[~invalid_rows]
+        report.skipped += int(invalid_rows.sum())
+
+        # 스프린트 확인: 없는 스프린트는 생성하거나 경고
+        new_sprints = sorted(set(frame["build_type"].unique()) - sprint_names - {""})
+        if new_sprints:
+            if self.create_missing_sprints:
+                if not self.dry_run:
+                    add_sprints_bulk(self.project_id, [{"name": sprint_name} for sprint_name in new_sprints])
+                report.created_sprints.extend(new_sprints)
+            else:
+                unknown_sprint = frame["build_type"].isin(new_sprints)
+                for row, sprint_name in frame.loc[unknown_sprint, "build_type"].items():
+                    self._add_issue(report, "warnings", row, labels["build_type"],
+                                    f"스프린트 '{sprint_name}'이(가) 존재하지 않습니다.")
+            sprint_names.update(new_sprints)
+
+        frame["priority"] = frame["priority"].astype("int64")
+        frame["story_points_leader"] = frame["story_points_leader"].round().astype("int64")
+        # 컬럼 단위 tolist()로 파이썬 기본 타입 dict 목록 생성 (to_dict보다 빠름)
+        fields = list(TASK_COLUMN_ALIASES)
+        return [dict(zip(fields, values)) for values in zip(*(frame[f].tolist() for f in fields))]
+
+    def _add_issue(self, report: ImportReport, kind: str, row: int, column: str, message: str):
+        """오류/경고 기록 (보관 건수는 max_reported_issues로 제한, 건수는 모두 집계)"""
+        issues = getattr(report, kind)
+        if len(issues) < self.max_issues:
+            issues.append(ImportIssue(row=int(row), column=column, message=message))
+        if kind == "errors":
+            report.error_count += 1
+        else:
+            report.warning_count += 1
+
+def import_tasks(project_id: int, source, file_name: str = "", **options) -> ImportReport:
+    """TaskImporter 간편 실행 함수"""
+    progress_callback = options.pop("progress_callback", None)
+    total_rows = options.pop("total_rows", None)
+    return TaskImporter(project_id, **options).run(
+        source, file_name=file_name, progress_callback=progress_callback, total_rows=total_rows
+    )
+
+def build_import_template() -> str:
+    """가져오기 양식 CSV (헤더만) 생성"""
+    headers = [aliases[0] for aliases in TASK_COLUMN_ALIASES.values()]
+    return pd.DataFrame(columns=headers).to_csv(index=False)
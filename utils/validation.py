@@ -112,9 +112,12 @@ class DataValidator:
     """데이터 유효성 검증 클래스"""
     
     @staticmethod
-    def validate_simulation_requirements(project_id: int) -> Dict[str, Any]:
-        """시뮬레이션 실행 요구사항 검증"""
-        from database import get_team_members, get_tasks
+    def validate_simulation_requirements(project_id: int, snapshot=None) -> Dict[str, Any]:
+        """시뮬레이션 실행 요구사항 검증 (snapshot이 주어지면 재조회하지 않음)"""
+        from database import load_project_snapshot
+        
+        if snapshot is None:
+            snapshot = load_project_snapshot(project_id)
         
         validation_result = {
             "valid": True,
@@ -125,7 +128,7 @@ class DataValidator:
         }
         
         # 팀원 검증
-        team_members = get_team_members(project_id)
+        team_members = snapshot.team_members
         validation_result["team_count"] = len(team_members)
         
         if len(team_members) == 0:
@@ -133,7 +136,7 @@ class DataValidator:
             validation_result["errors"].append("팀원이 없습니다. 최소 1명의 팀원을 추가해주세요.")
         
         # 업무 검증
-        tasks = get_tasks(project_id)
+        tasks = snapshot.tasks
         validation_result["task_count"] = len(tasks)
         
         if len(tasks) == 0: